@@ -10,6 +10,7 @@ STACK_NAME="aws-problem-solver-game-api"
 ENVIRONMENT=${1:-dev}
 REGION=${AWS_REGION:-us-east-1}
 CORS_ORIGIN=${CORS_ORIGIN:-'*'}
+FUNCTIONS="question_manager score_calculator hint_provider leaderboard leaderboard_ranker"
 
 echo "🚀 Starting deployment for AWS Problem Solver Game API"
 echo "Environment: $ENVIRONMENT"
@@ -29,7 +30,7 @@ mkdir -p $DEPLOY_DIR
 echo "📦 Preparing Lambda deployment packages..."
 
 # Package Lambda functions
-for function in question_manager score_calculator hint_provider leaderboard; do
+for function in $FUNCTIONS; do
     echo "Packaging $function..."
     
     # Create function directory
@@ -81,6 +82,16 @@ else
     echo "✅ DynamoDB tables already exist"
 fi
 
+# Leaderboard stream ARN for the leaderboard_ranker event source
+LEADERBOARD_STREAM_ARN=$(aws cloudformation describe-stacks \
+    --stack-name "$STACK_NAME-db-$ENVIRONMENT" \
+    --region $REGION \
+    --query 'Stacks[0].Outputs[?OutputKey==`LeaderboardStreamArn`].OutputValue' \
+    --output text 2>/dev/null || echo "")
+if [ "$LEADERBOARD_STREAM_ARN" = "None" ]; then
+    LEADERBOARD_STREAM_ARN=""
+fi
+
 # Deploy API Gateway and Lambda functions
 echo "Deploying API Gateway and Lambda functions..."
 
@@ -88,7 +99,7 @@ echo "Deploying API Gateway and Lambda functions..."
 S3_BUCKET="aws-problem-solver-game-deployments-$ENVIRONMENT"
 if aws s3 ls "s3://$S3_BUCKET" > /dev/null 2>&1; then
     echo "Uploading Lambda packages to S3..."
-    for function in question_manager score_calculator hint_provider leaderboard; do
+    for function in $FUNCTIONS; do
         aws s3 cp $DEPLOY_DIR/${function}.zip s3://$S3_BUCKET/lambda/${function}.zip
     done
     
@@ -99,6 +110,7 @@ if aws s3 ls "s3://$S3_BUCKET" > /dev/null 2>&1; then
         --parameter-overrides \
             Environment=$ENVIRONMENT \
             CorsOrigin="$CORS_ORIGIN" \
+            LeaderboardStreamArn="$LEADERBOARD_STREAM_ARN" \
             S3Bucket=$S3_BUCKET \
         --capabilities CAPABILITY_NAMED_IAM \
         --region $REGION \
@@ -107,8 +119,8 @@ else
     echo "S3 bucket not found, using inline deployment..."
     
     # Update Lambda functions with local packages
-    for function in question_manager score_calculator hint_provider leaderboard; do
-        FUNCTION_NAME="game-$function-$ENVIRONMENT"
+    for function in $FUNCTIONS; do
+        FUNCTION_NAME="game-${function//_/-}-$ENVIRONMENT"
         
         # Check if function exists
         if aws lambda get-function --function-name $FUNCTION_NAME --region $REGION > /dev/null 2>&1; then
@@ -129,6 +141,7 @@ else
         --parameter-overrides \
             Environment=$ENVIRONMENT \
             CorsOrigin="$CORS_ORIGIN" \
+            LeaderboardStreamArn="$LEADERBOARD_STREAM_ARN" \
         --capabilities CAPABILITY_NAMED_IAM \
         --region $REGION \
         --no-fail-on-empty-changeset
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+AWS Problem Solver Game - Leaderboard Migration Script
+기존 리더보드 테이블(leaderboardType + score 키)의 항목을
+새 테이블(leaderboardType + userId 키)로 옮기는 일회성 스크립트
+
+사용법:
+    python scripts/migrate-leaderboard.py --source aws-game-leaderboard --target aws-game-leaderboard-v2 [--dry-run]
+"""
+
+import argparse
+import boto3
+from typing import Dict, Iterator
+
+# 스트림 처리기가 관리하는 속성 (새 테이블에서 다시 계산)
+DERIVED_ATTRIBUTES = ('position', 'percentile')
+
+def scan_items(table) -> Iterator[Dict]:
+    """
+    테이블 전체 스캔 (페이지 누적)
+    """
+    scan_kwargs = {}
+    while True:
+        response = table.scan(**scan_kwargs)
+        yield from response.get('Items', [])
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return
+        scan_kwargs['ExclusiveStartKey'] = last_key
+
+def latest_entries(items: Iterator[Dict]) -> Dict[tuple, Dict]:
+    """
+    사용자·타입별로 가장 최근 항목만 남김 (기존 스키마는 점수마다 항목이 남을 수 있음)
+    """
+    entries = {}
+    for item in items:
+        if not item.get('userId') or not item.get('leaderboardType'):
+            continue
+        key = (item['leaderboardType'], item['userId'])
+        current = entries.get(key)
+        if current is None or (item.get('updatedAt', ''), item['score']) > (current.get('updatedAt', ''), current['score']):
+            entries[key] = item
+    return entries
+
+def main():
+    parser = argparse.ArgumentParser(description='리더보드 테이블 이전')
+    parser.add_argument('--source', default='aws-game-leaderboard', help='기존 테이블 이름')
+    parser.add_argument('--target', default='aws-game-leaderboard-v2', help='새 테이블 이름')
+    parser.add_argument('--region', default=None, help='AWS 리전')
+    parser.add_argument('--dry-run', action='store_true', help='쓰지 않고 항목 수만 출력')
+    args = parser.parse_args()
+
+    dynamodb = boto3.resource('dynamodb', region_name=args.region)
+    source = dynamodb.Table(args.source)
+    target = dynamodb.Table(args.target)
+
+    entries = latest_entries(scan_items(source))
+    print(f"{len(entries)} entries to migrate from {args.source} to {args.target}")
+    if args.dry_run:
+        return
+
+    with target.batch_writer() as batch:
+        for item in entries.values():
+            batch.put_item(Item={k: v for k, v in item.items() if k not in DERIVED_ATTRIBUTES})
+
+    print("✅ Migration complete (positions and #STATS are filled in by leaderboard_ranker)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+AWS Problem Solver Game - Question Seed Script
+src/game_data/questions의 문제를 문제 테이블에 등록하고,
+랜덤 선택용 randomBucket이 없는 기존 항목을 채운 뒤
+NPC별 문제 ID 목록 테이블({npcId, questionIds})을 다시 만드는 스크립트
+
+사용법:
+    python scripts/seed-questions.py --table aws-game-questions --npc-table aws-game-npc-questions [--backfill-only] [--dry-run]
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import boto3
+from decimal import Decimal
+from collections import defaultdict
+from typing import Dict, Iterator, List
+from boto3.dynamodb.conditions import Attr
+
+# question_manager.RANDOM_BUCKETS와 같은 값이어야 함
+RANDOM_BUCKETS = int(os.environ.get('RANDOM_BUCKETS', 10))
+QUESTIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'game_data', 'questions')
+
+def load_local_questions() -> List[Dict]:
+    """
+    로컬 JSON 문제 파일 로드 (숫자는 DynamoDB용 Decimal로)
+    """
+    questions = []
+    for file_path in sorted(glob.glob(os.path.join(QUESTIONS_DIR, '*.json'))):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            questions.extend(json.load(f, parse_float=Decimal).get('questions', []))
+    return questions
+
+def with_random_bucket(question: Dict) -> Dict:
+    """
+    randomBucket이 없으면 0..RANDOM_BUCKETS-1 중 무작위로 기록
+    """
+    if 'randomBucket' in question:
+        return question
+    return {**question, 'randomBucket': random.randrange(RANDOM_BUCKETS)}
+
+def items_missing_bucket(table) -> Iterator[Dict]:
+    """
+    randomBucket이 없는 항목의 questionId (페이지 누적)
+    """
+    scan_kwargs = {
+        'ProjectionExpression': 'questionId',
+        'FilterExpression': Attr('randomBucket').not_exists()
+    }
+    while True:
+        response = table.scan(**scan_kwargs)
+        yield from response.get('Items', [])
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return
+        scan_kwargs['ExclusiveStartKey'] = last_key
+
+def npc_question_ids(table) -> Dict[str, List[str]]:
+    """
+    활성 문제 ID를 npcCharacter별로 모음 (페이지 누적)
+    """
+    ids = defaultdict(list)
+    scan_kwargs = {
+        'ProjectionExpression': 'questionId, npcCharacter',
+        'FilterExpression': Attr('isActive').eq(True)
+    }
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get('Items', []):
+            if item.get('npcCharacter'):
+                ids[item['npcCharacter']].append(item['questionId'])
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return dict(ids)
+        scan_kwargs['ExclusiveStartKey'] = last_key
+
+def write_npc_questions(npc_table, ids_by_npc: Dict[str, List[str]]) -> int:
+    with npc_table.batch_writer(overwrite_by_pkeys=['npcId']) as batch:
+        for npc_id, question_ids in ids_by_npc.items():
+            batch.put_item(Item={'npcId': npc_id, 'questionIds': sorted(question_ids)})
+    return len(ids_by_npc)
+
+def seed_questions(table, questions: List[Dict]) -> int:
+    with table.batch_writer(overwrite_by_pkeys=['questionId']) as batch:
+        for question in questions:
+            batch.put_item(Item=with_random_bucket(question))
+    return len(questions)
+
+def backfill_buckets(table, dry_run: bool = False) -> int:
+    """
+    기존 항목에 randomBucket 기록 (그사이 기록된 항목은 덮어쓰지 않음)
+    """
+    updated = 0
+    for item in items_missing_bucket(table):
+        updated += 1
+        if dry_run:
+            continue
+        try:
+            table.update_item(
+                Key={'questionId': item['questionId']},
+                UpdateExpression='SET randomBucket = :bucket',
+                ConditionExpression='attribute_exists(questionId) AND attribute_not_exists(randomBucket)',
+                ExpressionAttributeValues={':bucket': random.randrange(RANDOM_BUCKETS)}
+            )
+        except table.meta.client.exceptions.ConditionalCheckFailedException:
+            updated -= 1
+    return updated
+
+def main():
+    parser = argparse.ArgumentParser(description='문제 테이블 등록 및 randomBucket 채우기')
+    parser.add_argument('--table', default='aws-game-questions', help='문제 테이블 이름')
+    parser.add_argument('--npc-table', default='aws-game-npc-questions', help='NPC별 문제 ID 목록 테이블 이름')
+    parser.add_argument('--region', default=None, help='AWS 리전')
+    parser.add_argument('--backfill-only', action='store_true', help='로컬 문제 등록 없이 randomBucket만 채움')
+    parser.add_argument('--dry-run', action='store_true', help='쓰지 않고 항목 수만 출력')
+    args = parser.parse_args()
+
+    dynamodb = boto3.resource('dynamodb', region_name=args.region)
+    table = dynamodb.Table(args.table)
+
+    if not args.backfill_only:
+        questions = load_local_questions()
+        if args.dry_run:
+            print(f"{len(questions)} local questions to seed into {args.table}")
+        else:
+            print(f"✅ Seeded {seed_questions(table, questions)} questions into {args.table}")
+
+    updated = backfill_buckets(table, args.dry_run)
+    if args.dry_run:
+        print(f"{updated} existing questions missing randomBucket")
+    else:
+        print(f"✅ randomBucket set on {updated} existing questions")
+
+    # 문제 등록/비활성화 후 다시 실행해 NPC 목록을 최신으로 유지
+    ids_by_npc = npc_question_ids(table)
+    if args.dry_run:
+        print(f"{len(ids_by_npc)} NPC question lists to write into {args.npc_table}")
+    else:
+        print(f"✅ Wrote {write_npc_questions(dynamodb.Table(args.npc_table), ids_by_npc)} NPC question lists into {args.npc_table}")
+
+if __name__ == '__main__':
+    main()
@@ -9,10 +9,16 @@ set -e
 ENVIRONMENT=${1:-dev}
 REGION=${AWS_REGION:-us-east-1}
 FUNCTION_PREFIX="game"
+FUNCTIONS="question_manager score_calculator hint_provider leaderboard leaderboard_ranker"
 
 echo "🔄 Updating Lambda functions for environment: $ENVIRONMENT"
 echo "Region: $REGION"
 
+# Deployed function names use hyphens (e.g. leaderboard_ranker -> game-leaderboard-ranker-dev)
+function_name() {
+    echo "$FUNCTION_PREFIX-${1//_/-}-$ENVIRONMENT"
+}
+
 # Check if AWS CLI is configured
 if ! aws sts get-caller-identity > /dev/null 2>&1; then
     echo "❌ AWS CLI is not configured. Please run 'aws configure' first."
@@ -26,7 +32,7 @@ mkdir -p $DEPLOY_DIR
 echo "📦 Preparing Lambda deployment packages..."
 
 # Package and update each Lambda function
-for function in question_manager score_calculator hint_provider leaderboard; do
+for function in $FUNCTIONS; do
     echo "Processing $function..."
     
     # Create function directory
@@ -56,7 +62,7 @@ for function in question_manager score_calculator hint_provider leaderboard; do
     cd - > /dev/null
     
     # Update Lambda function
-    FUNCTION_NAME="$FUNCTION_PREFIX-$function-$ENVIRONMENT"
+    FUNCTION_NAME=$(function_name $function)
     
     echo "Updating $FUNCTION_NAME..."
     
@@ -84,13 +90,14 @@ echo "🔄 Updating environment variables..."
 
 # Update environment variables for each function
 declare -A ENV_VARS
-ENV_VARS[question_manager]="QUESTIONS_TABLE=aws-game-questions-$ENVIRONMENT,USERS_TABLE=aws-game-users-$ENVIRONMENT"
-ENV_VARS[score_calculator]="USERS_TABLE=aws-game-users-$ENVIRONMENT,SESSIONS_TABLE=aws-game-sessions-$ENVIRONMENT,QUESTIONS_TABLE=aws-game-questions-$ENVIRONMENT,LEADERBOARD_TABLE=aws-game-leaderboard-$ENVIRONMENT"
+ENV_VARS[question_manager]="QUESTIONS_TABLE=aws-game-questions-$ENVIRONMENT,NPC_QUESTIONS_TABLE=aws-game-npc-questions-$ENVIRONMENT,USERS_TABLE=aws-game-users-$ENVIRONMENT"
+ENV_VARS[score_calculator]="USERS_TABLE=aws-game-users-$ENVIRONMENT,SESSIONS_TABLE=aws-game-sessions-$ENVIRONMENT,QUESTIONS_TABLE=aws-game-questions-$ENVIRONMENT,LEADERBOARD_TABLE=aws-game-leaderboard-v2-$ENVIRONMENT"
 ENV_VARS[hint_provider]="QUESTIONS_TABLE=aws-game-questions-$ENVIRONMENT,USERS_TABLE=aws-game-users-$ENVIRONMENT"
-ENV_VARS[leaderboard]="LEADERBOARD_TABLE=aws-game-leaderboard-$ENVIRONMENT,USERS_TABLE=aws-game-users-$ENVIRONMENT"
+ENV_VARS[leaderboard]="LEADERBOARD_TABLE=aws-game-leaderboard-v2-$ENVIRONMENT,USERS_TABLE=aws-game-users-$ENVIRONMENT"
+ENV_VARS[leaderboard_ranker]="LEADERBOARD_TABLE=aws-game-leaderboard-v2-$ENVIRONMENT"
 
-for function in question_manager score_calculator hint_provider leaderboard; do
-    FUNCTION_NAME="$FUNCTION_PREFIX-$function-$ENVIRONMENT"
+for function in $FUNCTIONS; do
+    FUNCTION_NAME=$(function_name $function)
     
     if aws lambda get-function --function-name $FUNCTION_NAME --region $REGION > /dev/null 2>&1; then
         # Convert comma-separated env vars to JSON format
@@ -118,8 +125,8 @@ echo ""
 echo "🧪 Testing updated functions..."
 
 # Test each function with a simple invocation
-for function in question_manager score_calculator hint_provider leaderboard; do
-    FUNCTION_NAME="$FUNCTION_PREFIX-$function-$ENVIRONMENT"
+for function in $FUNCTIONS; do
+    FUNCTION_NAME=$(function_name $function)
     
     if aws lambda get-function --function-name $FUNCTION_NAME --region $REGION > /dev/null 2>&1; then
         echo "Testing $FUNCTION_NAME..."
@@ -5,20 +5,556 @@ Amazon Q CLI를 활용한 지능형 힌트 시스템
 
 import json
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ReadTimeoutError
 import subprocess
+import shutil
 import os
-from typing import Dict, List, Any, Optional
+import time
+import zlib
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:
+    # orjson이 없는 환경에서는 표준 json 사용
+    orjson = None
+
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+def _json_dumps(obj: Any) -> str:
+    """JSON 직렬화 (orjson 사용 가능 시 우선 사용)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def _json_loads(data: Any) -> Any:
+    """JSON 역직렬화 (orjson 사용 가능 시 우선 사용)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# LLM 응답 캐시 설정
+LLM_CACHE_MAXSIZE = int(os.environ.get('LLM_CACHE_MAXSIZE', '512'))
+LLM_CACHE_TTL = int(os.environ.get('LLM_CACHE_TTL', '3600'))
+
+
+class LLMCache:
+    """LLM 응답 캐시 (SHA256 키, TTL 만료, LRU 방식 크기 제한)"""
+    
+    def __init__(self, maxsize: int = 512, ttl: int = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """요청 내용을 정규화하여 캐시 키 생성"""
+        raw = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (만료된 항목은 제거)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return dict(value)
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """캐시 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+
+# LLM 백엔드 설정 ('q_cli': 로컬 Amazon Q CLI, 'bedrock': Bedrock Runtime 직접 호출)
+LLM_BACKEND = os.environ.get('LLM_BACKEND', 'q_cli')
+BEDROCK_MODEL_ID = os.environ.get('BEDROCK_MODEL_ID', 'anthropic.claude-3-haiku-20240307-v1:0')
+LLM_SOURCES = {'q_cli': 'amazon_q', 'bedrock': 'bedrock'}
+
+# Bedrock 프롬프트 캐시는 지원 모델에서, 최소 캐시 크기(1024~2048 토큰)를 넘는 system 프롬프트에만 사용
+# (미지원 모델이나 짧은 프롬프트에 cache_control을 붙이면 무시되거나 ValidationException 발생)
+PROMPT_CACHE_MODELS = tuple(
+    m.strip() for m in os.environ.get(
+        'PROMPT_CACHE_MODELS',
+        'anthropic.claude-3-5-haiku,anthropic.claude-3-7-sonnet,anthropic.claude-sonnet-4,anthropic.claude-opus-4'
+    ).split(',') if m.strip()
+)
+PROMPT_CACHE_MIN_CHARS = int(os.environ.get('PROMPT_CACHE_MIN_CHARS', '8192'))
+
+# LLM 호출 타임아웃 및 재시도 설정 (Q CLI는 타임아웃 시 재시도하지 않으므로 최대 REQUEST_TIMEOUT_S초)
+REQUEST_TIMEOUT_S = float(os.environ.get('REQUEST_TIMEOUT_S', '8'))
+MAX_RETRIES = int(os.environ.get('MAX_RETRIES', '2'))  # Bedrock(botocore) 재시도 횟수
+BEDROCK_CONNECT_TIMEOUT_S = 2
+
+# Q CLI 확인 결과 디스크 캐시 (/tmp는 같은 컨테이너의 호출 간에 유지됨)
+Q_CLI_PROBE_CACHE_PATH = os.environ.get('Q_CLI_PROBE_CACHE_PATH', '/tmp/.q_cli_available')
+Q_CLI_PROBE_CACHE_TTL = 3600
+
+# Q CLI 연속 실패 시 일정 시간 동안 호출 없이 대체 힌트 사용 (서킷 브레이커)
+Q_CLI_CIRCUIT_FAILURE_THRESHOLD = 3
+Q_CLI_CIRCUIT_COOLDOWN_S = 60
+
+# 배치 힌트 요청 설정 (NPC 4명 x 힌트 레벨 3개)
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', '12'))
+BATCH_MAX_WORKERS = int(os.environ.get('BATCH_MAX_WORKERS', '4'))
+
+# 서비스 설명 프롬프트의 고정 영역 (프롬프트 캐싱 대상)
+EXPLANATION_SYSTEM_PROMPT = """
+AWS 서비스 설명 요청:
+
+다음 형식으로 한국어로 설명해주세요:
+1. 서비스 개요 (2-3문장)
+2. 주요 기능 (3-4개 항목)
+3. 사용 사례 (2-3개)
+4. 관련 서비스 (2-3개)
+5. 모범 사례 (2-3개 팁)
+
+간결하고 실용적으로 설명해주세요.
+""".strip()
+
+# 시맨틱 캐시 설정 (임베딩 호출 비용이 있으므로 기본 비활성화)
+SEMANTIC_CACHE_ENABLED = os.environ.get('SEMANTIC_CACHE_ENABLED', 'false').lower() == 'true'
+SEMANTIC_CACHE_THRESHOLD = float(os.environ.get('SEMANTIC_CACHE_THRESHOLD', '0.92'))
+SEMANTIC_CACHE_MAXSIZE = int(os.environ.get('SEMANTIC_CACHE_MAXSIZE', '256'))
+EMBEDDING_MODEL_ID = os.environ.get('EMBEDDING_MODEL_ID', 'amazon.titan-embed-text-v2:0')
+
+# 컨테이너 간 공유 힌트 캐시 (DynamoDB, 테이블 미설정 시 비활성화)
+HINT_CACHE_TABLE = os.environ.get('HINT_CACHE_TABLE', '')
+HINT_CACHE_TTL = int(os.environ.get('HINT_CACHE_TTL', '3600'))
+
+# CloudWatch Embedded Metric Format 로그 출력 (API 호출 없이 로그에서 지표 수집)
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'false').lower() == 'true'
+METRICS_NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'AWSProblemSolverGame')
+
+
+@lru_cache(maxsize=1)
+def _numpy():
+    """numpy 지연 import (시맨틱 캐시 사용 시에만 로드, 없는 환경에서는 None)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class SemanticHintCache:
+    """임베딩 코사인 유사도 기반 힌트 캐시 (표현만 다른 유사 문제 재사용)"""
+    
+    def __init__(self, maxsize: int = 256, threshold: float = 0.92):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._matrix = None  # (maxsize, dim) 정규화된 임베딩 행렬
+        self._tags: List[Optional[Tuple[str, int]]] = [None] * maxsize
+        self._values: List[Optional[Dict[str, Any]]] = [None] * maxsize
+        self._last_used = [0] * maxsize
+        self._size = 0
+        self._tick = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _normalize(embedding):
+        np = _numpy()
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+    
+    def lookup(self, embedding, npc_id: str, hint_level: int) -> Optional[Dict[str, Any]]:
+        """유사도가 임계값 이상인 캐시 항목 조회"""
+        np = _numpy()
+        vector = self._normalize(embedding)
+        tag = (npc_id, hint_level)
+        
+        with self._lock:
+            if self._size == 0:
+                return None
+            
+            similarities = self._matrix[:self._size] @ vector
+            mask = np.fromiter((t == tag for t in self._tags[:self._size]), dtype=bool, count=self._size)
+            similarities[~mask] = -1.0
+            
+            index = int(np.argmax(similarities))
+            if similarities[index] < self.threshold:
+                return None
+            
+            self._tick += 1
+            self._last_used[index] = self._tick
+            return dict(self._values[index])
+    
+    def add(self, embedding, npc_id: str, hint_level: int, value: Dict[str, Any]) -> None:
+        """캐시 항목 추가 (가득 찬 경우 가장 오래 사용되지 않은 행 교체)"""
+        vector = self._normalize(embedding)
+        
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = _numpy().zeros((self.maxsize, vector.shape[0]), dtype=vector.dtype)
+            
+            if self._size < self.maxsize:
+                index = self._size
+                self._size += 1
+            else:
+                index = min(range(self.maxsize), key=self._last_used.__getitem__)
+            
+            self._tick += 1
+            self._matrix[index] = vector
+            self._tags[index] = (npc_id, hint_level)
+            self._values[index] = dict(value)
+            self._last_used[index] = self._tick
+    
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        self.__init__(self.maxsize, self.threshold)
+
+
+class SharedHintCache:
+    """DynamoDB 기반 힌트/설명 캐시 (여러 Lambda 컨테이너가 같은 결과 재사용, TTL 자동 만료)"""
+    
+    def __init__(self, table_name: str, ttl: int = 3600):
+        self.table_name = table_name
+        self.ttl = ttl
+    
+    @property
+    def enabled(self) -> bool:
+        return bool(self.table_name)
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (미설정, 만료 또는 오류 시 None)"""
+        if not self.enabled:
+            return None
+        
+        try:
+            response = _get_dynamodb_client().get_item(
+                TableName=self.table_name,
+                Key={'cache_key': {'S': key}},
+                ProjectionExpression='hint_json, #ttl',
+                ExpressionAttributeNames={'#ttl': 'ttl'}
+            )
+        except Exception as e:
+            logger.warning(f"Hint cache lookup failed: {str(e)}")
+            return None
+        
+        return self._decode(response.get('Item'))
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 키를 BatchGetItem 한 번으로 조회 (찾은 항목만 반환)"""
+        unique_keys = list(dict.fromkeys(keys))
+        if not self.enabled or not unique_keys:
+            return {}
+        
+        try:
+            response = _get_dynamodb_client().batch_get_item(RequestItems={
+                self.table_name: {
+                    'Keys': [{'cache_key': {'S': key}} for key in unique_keys],
+                    'ProjectionExpression': 'cache_key, hint_json, #ttl',
+                    'ExpressionAttributeNames': {'#ttl': 'ttl'}
+                }
+            })
+        except Exception as e:
+            logger.warning(f"Hint cache batch lookup failed: {str(e)}")
+            return {}
+        
+        # 처리되지 않은 키(UnprocessedKeys)는 캐시 미스로 간주
+        found = {}
+        for item in response.get('Responses', {}).get(self.table_name, []):
+            value = self._decode(item)
+            if value is not None:
+                found[item['cache_key']['S']] = value
+        return found
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """캐시 저장 (핸들러 반환 후에는 프로세스가 멈추므로 동기로 기록, 실패해도 무시)"""
+        if not self.enabled:
+            return
+        
+        item = {
+            'cache_key': {'S': key},
+            'hint_json': {'S': _json_dumps(value)},
+            'ttl': {'N': str(int(time.time()) + self.ttl)}
+        }
+        try:
+            _get_dynamodb_client().put_item(TableName=self.table_name, Item=item)
+        except Exception as e:
+            logger.warning(f"Hint cache write failed: {str(e)}")
+    
+    @staticmethod
+    def _decode(item: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """DynamoDB 항목을 힌트 데이터로 변환 (TTL 삭제 전 만료 항목 제외)"""
+        if not item:
+            return None
+        if 'ttl' in item and int(item['ttl']['N']) < time.time():
+            return None
+        return _json_loads(item['hint_json']['S'])
+
+
+# 웜 컨테이너에서 재사용되는 응답 캐시
+_LLM_CACHE = LLMCache(maxsize=LLM_CACHE_MAXSIZE, ttl=LLM_CACHE_TTL)
+_SEMANTIC_CACHE = SemanticHintCache(maxsize=SEMANTIC_CACHE_MAXSIZE, threshold=SEMANTIC_CACHE_THRESHOLD)
+_SHARED_CACHE = SharedHintCache(HINT_CACHE_TABLE, ttl=HINT_CACHE_TTL)
+
+# 웜 컨테이너에서 재사용되는 boto3 세션/클라이언트 (자격 증명 로딩, TLS 핸드셰이크 1회)
+_SESSION = boto3.session.Session()
+_BEDROCK_CONFIG = Config(
+    retries={'max_attempts': MAX_RETRIES, 'mode': 'adaptive'},
+    connect_timeout=BEDROCK_CONNECT_TIMEOUT_S,
+    read_timeout=REQUEST_TIMEOUT_S,
+    tcp_keepalive=True
+)
+_DYNAMODB_CONFIG = Config(
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connect_timeout=BEDROCK_CONNECT_TIMEOUT_S,
+    max_pool_connections=50,
+    tcp_keepalive=True
+)
+_BEDROCK = None
+_DDB = None
+# 세션/클라이언트 생성은 스레드 안전하지 않으므로 배치 작업자 스레드의 첫 호출이 겹치지 않도록 잠금
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_bedrock_client():
+    """Bedrock Runtime 클라이언트 반환 (리전 미설정 환경에서도 import 가능하도록 첫 사용 시 생성)"""
+    global _BEDROCK
+    if _BEDROCK is None:
+        with _CLIENT_LOCK:
+            if _BEDROCK is None:
+                _BEDROCK = _SESSION.client('bedrock-runtime', config=_BEDROCK_CONFIG)
+    return _BEDROCK
+
+
+def _get_dynamodb_client():
+    """DynamoDB 클라이언트 반환 (첫 사용 시 생성)"""
+    global _DDB
+    if _DDB is None:
+        with _CLIENT_LOCK:
+            if _DDB is None:
+                _DDB = _SESSION.client('dynamodb', config=_DYNAMODB_CONFIG)
+    return _DDB
+
+
+def _build_bedrock_body(prompt: str, max_tokens: int, system: Optional[str] = None) -> str:
+    """Anthropic 메시지 형식의 Bedrock 요청 본문 생성"""
+    body = {
+        'anthropic_version': 'bedrock-2023-05-31',
+        'max_tokens': max_tokens,
+        'messages': [{'role': 'user', 'content': prompt}]
+    }
+    if system:
+        block = {'type': 'text', 'text': system}
+        if _prompt_cache_enabled(system):
+            # 고정 영역은 프롬프트 캐시에 저장되어 재처리 비용 절감
+            block['cache_control'] = {'type': 'ephemeral'}
+        body['system'] = [block]
+    return _json_dumps(body)
+
+
+def _prompt_cache_enabled(system: str) -> bool:
+    """현재 모델이 프롬프트 캐시를 지원하고 system 프롬프트가 최소 크기 이상인지 확인"""
+    return (
+        len(system) >= PROMPT_CACHE_MIN_CHARS
+        and any(model in BEDROCK_MODEL_ID for model in PROMPT_CACHE_MODELS)
+    )
+
+
+# 카테고리별 힌트 템플릿
+_HINT_TEMPLATES = {
+    'EC2': {
+        1: "인스턴스 확장성과 로드 밸런싱을 고려해보세요.",
+        2: "Auto Scaling Group과 Application Load Balancer 조합을 생각해보세요.",
+        3: "다중 AZ 배포와 CloudWatch 모니터링을 포함한 완전한 아키텍처를 설계해보세요."
+    },
+    'S3': {
+        1: "스토리지 클래스와 액세스 패턴을 고려해보세요.",
+        2: "Standard-IA, Glacier 등 적절한 스토리지 클래스를 선택해보세요.",
+        3: "라이프사이클 정책과 버전 관리를 포함한 완전한 스토리지 전략을 수립해보세요."
+    },
+    'LAMBDA': {
+        1: "서버리스 아키텍처와 이벤트 기반 처리를 고려해보세요.",
+        2: "Lambda와 API Gateway, DynamoDB 조합을 생각해보세요.",
+        3: "Step Functions를 활용한 워크플로우 오케스트레이션을 포함해보세요."
+    },
+    'RDS': {
+        1: "데이터베이스 가용성과 백업 전략을 고려해보세요.",
+        2: "Multi-AZ 배포와 Read Replica를 생각해보세요.",
+        3: "자동 백업, 모니터링, 성능 최적화를 포함한 완전한 DB 솔루션을 설계해보세요."
+    },
+    'VPC': {
+        1: "네트워크 보안과 서브넷 구성을 고려해보세요.",
+        2: "퍼블릭/프라이빗 서브넷과 NAT Gateway를 생각해보세요.",
+        3: "보안 그룹, NACL, VPC 엔드포인트를 포함한 완전한 네트워크 아키텍처를 설계해보세요."
+    }
+}
+
+# 기본 힌트
+_DEFAULT_HINTS = {
+    1: "AWS의 관리형 서비스를 활용해보세요.",
+    2: "고가용성과 비용 효율성을 동시에 고려해보세요.",
+    3: "모니터링과 자동화를 포함한 완전한 솔루션을 설계해보세요."
+}
+MAX_HINT_LEVEL = len(_DEFAULT_HINTS)
+
+# NPC별 힌트 말투 (접두어/접미어)
+_STYLE_MODIFIERS = {
+    'alex_ceo': {
+        'prefix': ["빠르게 해결해야 해요! ", "비즈니스 관점에서 ", "투자자들이 좋아할 만한 "],
+        'suffix': [" 시간이 중요해요!", " 이게 가장 효율적일 거예요!", " 바로 적용해봅시다!"]
+    },
+    'sarah_analyst': {
+        'prefix': ["데이터를 분석해보니 ", "체계적으로 접근하면 ", "정확한 방법은 "],
+        'suffix': [" 이 방법이 가장 안정적입니다.", " 성능 지표도 좋을 거예요.", " 모니터링도 잊지 마세요."]
+    },
+    'mike_security': {
+        'prefix': ["보안을 위해서는 ", "안전한 방법으로 ", "규제 준수를 위해 "],
+        'suffix': [" 보안이 최우선이에요.", " 이 방법이 가장 안전합니다.", " 감사 요구사항도 만족해요."]
+    },
+    'jenny_developer': {
+        'prefix': ["개발자 친화적으로 ", "자동화를 활용해서 ", "최신 기술로 "],
+        'suffix': [" 개발이 훨씬 쉬워질 거예요!", " 정말 혁신적인 방법이에요!", " 코드 관리도 편해집니다!"]
+    }
+}
+
+
+def _styled_hint(base_hint: str, npc_id: str, hint_level: int = 0) -> str:
+    """NPC 말투 적용 (같은 입력은 항상 같은 결과가 되도록 crc32로 접두/접미어 선택)"""
+    modifiers = _STYLE_MODIFIERS.get(npc_id, _STYLE_MODIFIERS['alex_ceo'])
+    seed = f"{npc_id}:{hint_level}:{base_hint}".encode('utf-8')
+    
+    # hash()는 프로세스마다 달라지므로 컨테이너 간에도 안정적인 crc32 사용
+    prefix = modifiers['prefix'][zlib.crc32(seed) % len(modifiers['prefix'])]
+    suffix = modifiers['suffix'][zlib.crc32(seed + b':suffix') % len(modifiers['suffix'])]
+    return f"{prefix}{base_hint}{suffix}"
+
+
+def _build_fallback_table() -> Dict[Tuple[str, int, str], str]:
+    """(대문자 카테고리, 레벨, NPC)별 스타일 적용 힌트를 미리 생성"""
+    table = {}
+    categories = dict(_HINT_TEMPLATES)
+    categories[''] = _DEFAULT_HINTS  # 알 수 없는 카테고리용
+    
+    for category, hints in categories.items():
+        for level in _DEFAULT_HINTS:
+            base_hint = hints.get(level, _DEFAULT_HINTS[level])
+            for npc_id in _STYLE_MODIFIERS:
+                table[(category.upper(), level, npc_id)] = _styled_hint(base_hint, npc_id, level)
+    
+    return table
+
+
+# 대체 힌트 조회 테이블 (import 시 1회 생성)
+_FALLBACK_TABLE = _build_fallback_table()
+
+
+# 대체 설명용 AWS 서비스 정보
+_SERVICE_EXPLANATIONS = {
+    'EC2': {
+        'overview': 'Amazon EC2는 클라우드에서 확장 가능한 컴퓨팅 용량을 제공하는 웹 서비스입니다.',
+        'features': ['다양한 인스턴스 타입', 'Auto Scaling', 'Elastic Load Balancing', 'EBS 스토리지'],
+        'use_cases': ['웹 애플리케이션 호스팅', '데이터 처리', '개발/테스트 환경'],
+        'related': ['ELB', 'Auto Scaling', 'CloudWatch'],
+        'best_practices': ['적절한 인스턴스 타입 선택', '보안 그룹 설정', '정기적인 백업']
+    },
+    'S3': {
+        'overview': 'Amazon S3는 업계 최고의 확장성, 데이터 가용성, 보안 및 성능을 제공하는 객체 스토리지 서비스입니다.',
+        'features': ['무제한 스토리지', '다양한 스토리지 클래스', '버전 관리', '라이프사이클 정책'],
+        'use_cases': ['정적 웹사이트 호스팅', '데이터 백업', 'CDN 원본 스토리지'],
+        'related': ['CloudFront', 'Lambda', 'Glacier'],
+        'best_practices': ['적절한 스토리지 클래스 선택', '버킷 정책 설정', '암호화 활성화']
+    },
+    'Lambda': {
+        'overview': 'AWS Lambda는 서버를 프로비저닝하거나 관리하지 않고도 코드를 실행할 수 있는 서버리스 컴퓨팅 서비스입니다.',
+        'features': ['자동 스케일링', '이벤트 기반 실행', '다양한 런타임 지원', '내장 모니터링'],
+        'use_cases': ['API 백엔드', '데이터 처리', '실시간 파일 처리'],
+        'related': ['API Gateway', 'DynamoDB', 'S3'],
+        'best_practices': ['함수 크기 최적화', '환경 변수 활용', '적절한 메모리 설정']
+    }
+}
+
+
+def _render_explanation_body(service_info: Dict[str, Any]) -> str:
+    """서비스 정보를 설명 Markdown 본문으로 변환 (제목 제외)"""
+    return f"""
+{service_info['overview']}
+
+**주요 기능**
+{' • '.join(service_info['features'])}
+
+**사용 사례**
+{' • '.join(service_info['use_cases'])}
+
+**관련 서비스**
+{' • '.join(service_info['related'])}
+
+**모범 사례**
+{' • '.join(service_info['best_practices'])}
+""".strip()
+
+
+# 서비스별 설명 본문 (import 시 1회 생성, 대문자 서비스명 키)
+_EXPLANATION_MD = {
+    name.upper(): _render_explanation_body(info)
+    for name, info in _SERVICE_EXPLANATIONS.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _question_context(category: str, difficulty: str, scenario: str,
+                      question: str, scenario_context: str) -> Dict[str, str]:
+    """문제 컨텍스트 dict 생성 (동일한 문제는 캐시에서 재사용)"""
+    return {
+        'category': category,
+        'difficulty': difficulty,
+        'scenario': scenario,
+        'question': question,
+        'context': scenario_context
+    }
+
+
+@lru_cache(maxsize=128)
+def _fallback_explanation_text(service_name: str) -> str:
+    """대체 설명 Markdown 생성 (서비스명별 캐시)"""
+    body = _EXPLANATION_MD.get(service_name.upper(), _EXPLANATION_MD['EC2'])
+    return f"**{service_name} 개요**\n{body}"
+
+
 class AmazonQHintProvider:
     """Amazon Q CLI를 활용한 힌트 제공 시스템"""
     
+    # Q CLI 사용 가능 여부 캐시 (None: 아직 확인 전, 웜 컨테이너에서 재사용)
+    _q_cli_available_cache: Optional[bool] = None
+    
+    # Q CLI 서킷 브레이커 상태 (컨테이너 내 모든 요청이 공유)
+    _qcli_failures = 0
+    _qcli_circuit_open_until = 0.0
+    _qcli_circuit_lock = threading.Lock()
+    
     def __init__(self):
-        self.q_cli_available = self._check_q_cli_availability()
+        # Bedrock 백엔드는 CLI 바이너리가 필요 없으므로 확인 생략
+        self.q_cli_available = LLM_BACKEND == 'bedrock' or self._check_q_cli_availability()
         
         # NPC별 힌트 스타일 정의
         self.npc_hint_styles = {
@@ -62,16 +598,82 @@ class AmazonQHintProvider:
             2: "구체적인 서비스 제안",
             3: "상세한 구현 방법"
         }
+        
+        # 요청마다 변하지 않는 힌트 프롬프트 앞부분 (프롬프트 캐싱 대상)
+        self.hint_system_prompt = self._build_hint_system_prompt()
+    
+    def _build_hint_system_prompt(self) -> str:
+        """힌트 프롬프트의 고정 영역 구성 (규칙, 레벨 표, NPC 성격)"""
+        level_lines = '\n'.join(
+            f"{level}: {description}" for level, description in self.hint_levels.items()
+        )
+        npc_lines = '\n'.join(
+            f"- {npc_id} ({style['personality']}): {' '.join(style['style_prompts'])}"
+            for npc_id, style in self.npc_hint_styles.items()
+        )
+        
+        return f"""
+AWS 문제 해결 힌트 요청:
+
+다음 조건으로 힌트를 제공해주세요:
+1. 한국어로 응답
+2. 직접적인 정답은 제시하지 말고 방향성만 제시
+3. AWS 서비스명과 핵심 개념 포함
+4. 요청된 NPC 성격 반영
+5. 150자 이내로 간결하게
+
+힌트 레벨:
+{level_lines}
+
+NPC 성격:
+{npc_lines}
+""".strip()
     
     def _check_q_cli_availability(self) -> bool:
-        """Amazon Q CLI 사용 가능 여부 확인"""
+        """Amazon Q CLI 사용 가능 여부 확인 (프로세스당 1회만 실행)"""
+        if AmazonQHintProvider._q_cli_available_cache is not None:
+            return AmazonQHintProvider._q_cli_available_cache
+        
+        # ENABLE_Q_CLI=true가 아니면 subprocess 확인 자체를 생략 (Lambda 기본값)
+        if os.environ.get('ENABLE_Q_CLI', 'false').lower() != 'true':
+            available = False
+        elif shutil.which('q') is None:
+            # PATH에 q가 없으면 프로세스 생성 없이 바로 사용 불가 처리
+            available = False
+        else:
+            available = self._read_q_cli_probe_cache()
+            if available is None:
+                try:
+                    result = subprocess.run(['q', '--version'], 
+                                          capture_output=True, text=True, timeout=5)
+                    available = result.returncode == 0
+                except (subprocess.TimeoutExpired, FileNotFoundError):
+                    logger.warning("Amazon Q CLI not available, using fallback system")
+                    available = False
+                self._write_q_cli_probe_cache(available)
+        
+        AmazonQHintProvider._q_cli_available_cache = available
+        return available
+    
+    @staticmethod
+    def _read_q_cli_probe_cache() -> Optional[bool]:
+        """디스크에 저장된 Q CLI 확인 결과 조회 (없거나 1시간 경과 시 None)"""
         try:
-            result = subprocess.run(['q', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            logger.warning("Amazon Q CLI not available, using fallback system")
-            return False
+            if time.time() - os.path.getmtime(Q_CLI_PROBE_CACHE_PATH) >= Q_CLI_PROBE_CACHE_TTL:
+                return None
+            with open(Q_CLI_PROBE_CACHE_PATH) as f:
+                return f.read().strip() == '1'
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _write_q_cli_probe_cache(available: bool) -> None:
+        """Q CLI 확인 결과를 디스크에 저장 (실패해도 무시)"""
+        try:
+            with open(Q_CLI_PROBE_CACHE_PATH, 'w') as f:
+                f.write('1' if available else '0')
+        except OSError as e:
+            logger.warning(f"Failed to write Q CLI probe cache: {str(e)}")
     
     def generate_hint(self, question_data: Dict[str, Any], 
                      npc_id: str, hint_level: int) -> Dict[str, Any]:
@@ -88,126 +690,264 @@ class AmazonQHintProvider:
         """
         try:
             if self.q_cli_available:
-                return self._generate_q_cli_hint(question_data, npc_id, hint_level)
+                context = self._build_question_context(question_data)
+                cache_key = self._hint_cache_key(context, npc_id, hint_level)
+                cached = _LLM_CACHE.get(cache_key)
+                if cached is not None:
+                    return cached
+                
+                shared = _SHARED_CACHE.get(cache_key)
+                if shared is not None:
+                    _LLM_CACHE.set(cache_key, shared)
+                    return shared
+                
+                embedding = self._get_context_embedding(context)
+                if embedding is not None:
+                    similar = _SEMANTIC_CACHE.lookup(embedding, npc_id, hint_level)
+                    if similar is not None:
+                        # 힌트 문구만 재사용하고 문제별 필드는 현재 문제로 다시 생성
+                        result = self._hint_result(similar['hint'], similar['source'],
+                                                   question_data, context, npc_id, hint_level)
+                        _LLM_CACHE.set(cache_key, result)
+                        return result
+                
+                result = self._generate_q_cli_hint(question_data, npc_id, hint_level)
+                if result.get('source') != 'fallback':
+                    _LLM_CACHE.set(cache_key, result)
+                    _SHARED_CACHE.set(cache_key, result)
+                    if embedding is not None:
+                        _SEMANTIC_CACHE.add(embedding, npc_id, hint_level,
+                                            {'hint': result['hint'], 'source': result['source']})
+                return result
             else:
                 return self._generate_fallback_hint(question_data, npc_id, hint_level)
         except Exception as e:
             logger.error(f"Error generating hint: {str(e)}")
             return self._generate_fallback_hint(question_data, npc_id, hint_level)
     
+    def generate_hints_batch(self, hint_requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        여러 힌트를 동시에 생성 (예: 같은 문제에 대한 NPC별/레벨별 힌트)
+        
+        Args:
+            hint_requests: {questionData, npcId, hintLevel} 목록
+        
+        Returns:
+            요청 순서와 같은 순서의 힌트 데이터 목록
+        """
+        if not hint_requests:
+            return []
+        
+        if self.q_cli_available and _SHARED_CACHE.enabled:
+            try:
+                self._prefetch_shared_hints(hint_requests)
+            except Exception as e:
+                logger.warning(f"Hint cache prefetch failed: {str(e)}")
+        
+        def generate(request: Dict[str, Any]) -> Dict[str, Any]:
+            return self.generate_hint(
+                request.get('questionData', {}),
+                request.get('npcId', 'alex_ceo'),
+                request.get('hintLevel', 1)
+            )
+        
+        # LLM 호출은 네트워크 대기가 대부분이므로 스레드로 동시 실행
+        workers = min(len(hint_requests), BATCH_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(generate, hint_requests))
+    
+    def _prefetch_shared_hints(self, hint_requests: List[Dict[str, Any]]) -> None:
+        """배치 요청의 공유 캐시 항목을 BatchGetItem 한 번으로 로컬 캐시에 적재"""
+        keys = []
+        for request in hint_requests:
+            key = self._hint_cache_key(
+                self._build_question_context(request.get('questionData', {})),
+                request.get('npcId', 'alex_ceo'),
+                request.get('hintLevel', 1)
+            )
+            if _LLM_CACHE.get(key) is None:
+                keys.append(key)
+        
+        for key, value in _SHARED_CACHE.get_many(keys).items():
+            _LLM_CACHE.set(key, value)
+    
+    @staticmethod
+    def _hint_cache_key(context: Dict[str, str], npc_id: str, hint_level: int) -> str:
+        """힌트 응답 캐시 키 (로컬/공유 캐시 공통)"""
+        return LLMCache.make_key({
+            'npc': npc_id,
+            'lvl': hint_level,
+            'ctx': context
+        })
+    
+    def _get_context_embedding(self, context: Dict[str, str]):
+        """시맨틱 캐시용 문제 상황 임베딩 (비활성화 또는 실패 시 None)"""
+        if not SEMANTIC_CACHE_ENABLED or _numpy() is None:
+            return None
+        
+        text = f"{context['scenario']} {context['question']}".strip()
+        if not text:
+            return None
+        
+        try:
+            response = _get_bedrock_client().invoke_model(
+                modelId=EMBEDDING_MODEL_ID,
+                body=_json_dumps({'inputText': text, 'normalize': True})
+            )
+            return _json_loads(response['body'].read())['embedding']
+        except Exception as e:
+            logger.warning(f"Embedding request failed, skipping semantic cache: {str(e)}")
+            return None
+    
     def _generate_q_cli_hint(self, question_data: Dict[str, Any], 
                            npc_id: str, hint_level: int) -> Dict[str, Any]:
         """Amazon Q CLI를 사용한 힌트 생성"""
         
-        # NPC 스타일 가져오기
+        context = self._build_question_context(question_data)
+        q_prompt = self._build_hint_prompt(context, npc_id, hint_level)
+        
+        hint_text = self._invoke_llm(q_prompt, max_tokens=256,
+                                     system=self.hint_system_prompt)
+        if hint_text is None:
+            return self._generate_fallback_hint(question_data, npc_id, hint_level)
+        
+        return self._hint_result(hint_text, LLM_SOURCES[LLM_BACKEND],
+                                 question_data, context, npc_id, hint_level)
+    
+    @staticmethod
+    def _hint_result(hint_text: str, source: str, question_data: Dict[str, Any],
+                     context: Dict[str, str], npc_id: str, hint_level: int) -> Dict[str, Any]:
+        """힌트 응답 생성 (문제 ID와 컨텍스트는 항상 요청한 문제 기준)"""
+        result = {
+            'hint': hint_text,
+            'source': source,
+            'npc_id': npc_id,
+            'hint_level': hint_level,
+            'context': context,
+            'success': True
+        }
+        question_id = question_data.get('questionId') or question_data.get('id')
+        if question_id:
+            result['question_id'] = question_id
+        return result
+    
+    def _build_hint_prompt(self, context: Dict[str, str],
+                           npc_id: str, hint_level: int) -> str:
+        """요청별 힌트 프롬프트 구성 (고정 영역은 hint_system_prompt에 위치)"""
         npc_style = self.npc_hint_styles.get(npc_id, self.npc_hint_styles['alex_ceo'])
         style_prompt = npc_style['style_prompts'][min(hint_level - 1, len(npc_style['style_prompts']) - 1)]
         
-        # 문제 컨텍스트 구성
-        context = self._build_question_context(question_data)
-        
-        # Amazon Q CLI 프롬프트 구성
-        q_prompt = f"""
-AWS 문제 해결 힌트 요청:
-
-문제 상황: {context['scenario']}
-문제: {context['question']}
+        return f"""
+NPC: {npc_id} ({npc_style['personality']} 성격 반영)
+힌트 레벨: {hint_level} ({self.hint_levels[min(max(hint_level, 1), MAX_HINT_LEVEL)]})
+요청 스타일: {style_prompt}
 카테고리: {context['category']}
 난이도: {context['difficulty']}
 
-힌트 레벨: {hint_level} ({self.hint_levels[hint_level]})
-요청 스타일: {style_prompt}
-
-다음 조건으로 힌트를 제공해주세요:
-1. 한국어로 응답
-2. 직접적인 정답은 제시하지 말고 방향성만 제시
-3. AWS 서비스명과 핵심 개념 포함
-4. {npc_style['personality']} 성격 반영
-5. 150자 이내로 간결하게
+문제 상황: {context['scenario']}
+문제: {context['question']}
 
 힌트:
-"""
+""".strip()
+    
+    def _invoke_llm(self, prompt: str, max_tokens: int,
+                    system: Optional[str] = None) -> Optional[str]:
+        """설정된 백엔드로 프롬프트 실행 (실패 시 None)"""
+        if LLM_BACKEND == 'bedrock':
+            # Bedrock 재시도는 botocore adaptive 모드가 담당
+            return self._invoke_bedrock(prompt, max_tokens, system)
+        
+        if time.time() < AmazonQHintProvider._qcli_circuit_open_until:
+            return None
         
         try:
-            # Amazon Q CLI 실행
+            response = self._run_q_chat(f"{system}\n\n{prompt}" if system else prompt)
+        except subprocess.TimeoutExpired:
+            # 멈춘 q chat은 다시 실행해도 대개 같으므로 재시도 없이 바로 서킷 오픈 후 대체 힌트
+            logger.warning(f"LLM request timeout after {REQUEST_TIMEOUT_S}s")
+            self._open_q_cli_circuit()
+            return None
+        
+        self._record_q_cli_result(response is not None)
+        return response
+    
+    @classmethod
+    def _open_q_cli_circuit(cls) -> None:
+        """Q_CLI_CIRCUIT_COOLDOWN_S초 동안 Q CLI 호출 중단"""
+        with cls._qcli_circuit_lock:
+            logger.warning(f"Q CLI circuit open for {Q_CLI_CIRCUIT_COOLDOWN_S}s")
+            cls._qcli_circuit_open_until = time.time() + Q_CLI_CIRCUIT_COOLDOWN_S
+            cls._qcli_failures = 0
+    
+    @classmethod
+    def _record_q_cli_result(cls, success: bool) -> None:
+        """Q CLI 호출 결과 기록 (연속 실패가 임계값에 도달하면 서킷 오픈)"""
+        with cls._qcli_circuit_lock:
+            if success:
+                cls._qcli_failures = 0
+                return
+            
+            cls._qcli_failures += 1
+            if cls._qcli_failures < Q_CLI_CIRCUIT_FAILURE_THRESHOLD:
+                return
+        cls._open_q_cli_circuit()
+    
+    def _invoke_bedrock(self, prompt: str, max_tokens: int,
+                        system: Optional[str] = None) -> Optional[str]:
+        """Bedrock Runtime을 직접 호출 (프로세스 생성 및 CLI 초기화 없음)"""
+        try:
+            response = _get_bedrock_client().invoke_model(
+                modelId=BEDROCK_MODEL_ID,
+                body=_build_bedrock_body(prompt, max_tokens, system)
+            )
+            response_data = _json_loads(response['body'].read())
+            return ''.join(
+                block.get('text', '') for block in response_data.get('content', [])
+                if block.get('type') == 'text'
+            ).strip()
+        except ReadTimeoutError:
+            logger.warning("Bedrock request timeout")
+            return None
+        except Exception as e:
+            logger.error(f"Bedrock error: {str(e)}")
+            return None
+    
+    def _run_q_chat(self, prompt: str) -> Optional[str]:
+        """Amazon Q CLI 실행 (로컬 개발 환경용, 타임아웃은 호출자가 처리)"""
+        try:
             result = subprocess.run([
                 'q', 'chat', 
-                '--message', q_prompt.strip(),
+                '--message', prompt,
                 '--format', 'json'
-            ], capture_output=True, text=True, timeout=30)
+            ], capture_output=True, text=True, timeout=REQUEST_TIMEOUT_S)
             
-            if result.returncode == 0:
-                response_data = json.loads(result.stdout)
-                hint_text = response_data.get('response', '').strip()
-                
-                return {
-                    'hint': hint_text,
-                    'source': 'amazon_q',
-                    'npc_id': npc_id,
-                    'hint_level': hint_level,
-                    'context': context,
-                    'success': True
-                }
-            else:
+            if result.returncode != 0:
                 logger.error(f"Q CLI error: {result.stderr}")
-                return self._generate_fallback_hint(question_data, npc_id, hint_level)
-                
-        except subprocess.TimeoutExpired:
-            logger.error("Q CLI timeout")
-            return self._generate_fallback_hint(question_data, npc_id, hint_level)
+                return None
+            
+            response_data = _json_loads(result.stdout)
+            return response_data.get('response', '').strip()
+        
         except json.JSONDecodeError:
             logger.error("Failed to parse Q CLI response")
-            return self._generate_fallback_hint(question_data, npc_id, hint_level)
+            return None
+        except OSError as e:
+            # 확인 이후 q가 사라진 경우 등도 실패로 집계해 서킷 브레이커에 반영
+            logger.error(f"Failed to run Q CLI: {str(e)}")
+            return None
     
     def _generate_fallback_hint(self, question_data: Dict[str, Any], 
                               npc_id: str, hint_level: int) -> Dict[str, Any]:
         """Amazon Q CLI 사용 불가 시 대체 힌트 생성"""
         
         context = self._build_question_context(question_data)
-        category = context['category'].upper()
-        
-        # 카테고리별 힌트 템플릿
-        hint_templates = {
-            'EC2': {
-                1: "인스턴스 확장성과 로드 밸런싱을 고려해보세요.",
-                2: "Auto Scaling Group과 Application Load Balancer 조합을 생각해보세요.",
-                3: "다중 AZ 배포와 CloudWatch 모니터링을 포함한 완전한 아키텍처를 설계해보세요."
-            },
-            'S3': {
-                1: "스토리지 클래스와 액세스 패턴을 고려해보세요.",
-                2: "Standard-IA, Glacier 등 적절한 스토리지 클래스를 선택해보세요.",
-                3: "라이프사이클 정책과 버전 관리를 포함한 완전한 스토리지 전략을 수립해보세요."
-            },
-            'LAMBDA': {
-                1: "서버리스 아키텍처와 이벤트 기반 처리를 고려해보세요.",
-                2: "Lambda와 API Gateway, DynamoDB 조합을 생각해보세요.",
-                3: "Step Functions를 활용한 워크플로우 오케스트레이션을 포함해보세요."
-            },
-            'RDS': {
-                1: "데이터베이스 가용성과 백업 전략을 고려해보세요.",
-                2: "Multi-AZ 배포와 Read Replica를 생각해보세요.",
-                3: "자동 백업, 모니터링, 성능 최적화를 포함한 완전한 DB 솔루션을 설계해보세요."
-            },
-            'VPC': {
-                1: "네트워크 보안과 서브넷 구성을 고려해보세요.",
-                2: "퍼블릭/프라이빗 서브넷과 NAT Gateway를 생각해보세요.",
-                3: "보안 그룹, NACL, VPC 엔드포인트를 포함한 완전한 네트워크 아키텍처를 설계해보세요."
-            }
-        }
-        
-        # 기본 힌트
-        default_hints = {
-            1: "AWS의 관리형 서비스를 활용해보세요.",
-            2: "고가용성과 비용 효율성을 동시에 고려해보세요.",
-            3: "모니터링과 자동화를 포함한 완전한 솔루션을 설계해보세요."
-        }
-        
-        # 힌트 선택
-        base_hint = hint_templates.get(category, default_hints).get(hint_level, default_hints[hint_level])
+        category = context['category']
+        npc_key = npc_id if npc_id in _STYLE_MODIFIERS else 'alex_ceo'
         
-        # NPC 스타일 적용
-        npc_style = self.npc_hint_styles.get(npc_id, self.npc_hint_styles['alex_ceo'])
-        styled_hint = self._apply_npc_style(base_hint, npc_id, npc_style)
+        # 미리 생성된 NPC 스타일 힌트 조회 (같은 요청은 항상 같은 힌트)
+        level = min(max(hint_level, 1), MAX_HINT_LEVEL)  # 범위 밖 레벨은 가장 가까운 레벨로
+        styled_hint = (_FALLBACK_TABLE.get((category.upper(), level, npc_key))
+                       or _FALLBACK_TABLE[('', level, npc_key)])
         
         return {
             'hint': styled_hint,
@@ -218,51 +958,39 @@ AWS 문제 해결 힌트 요청:
             'success': True
         }
     
-    def _apply_npc_style(self, base_hint: str, npc_id: str, npc_style: Dict) -> str:
-        """NPC 성격에 맞게 힌트 스타일 적용"""
-        
-        style_modifiers = {
-            'alex_ceo': {
-                'prefix': ["빠르게 해결해야 해요! ", "비즈니스 관점에서 ", "투자자들이 좋아할 만한 "],
-                'suffix': [" 시간이 중요해요!", " 이게 가장 효율적일 거예요!", " 바로 적용해봅시다!"]
-            },
-            'sarah_analyst': {
-                'prefix': ["데이터를 분석해보니 ", "체계적으로 접근하면 ", "정확한 방법은 "],
-                'suffix': [" 이 방법이 가장 안정적입니다.", " 성능 지표도 좋을 거예요.", " 모니터링도 잊지 마세요."]
-            },
-            'mike_security': {
-                'prefix': ["보안을 위해서는 ", "안전한 방법으로 ", "규제 준수를 위해 "],
-                'suffix': [" 보안이 최우선이에요.", " 이 방법이 가장 안전합니다.", " 감사 요구사항도 만족해요."]
-            },
-            'jenny_developer': {
-                'prefix': ["개발자 친화적으로 ", "자동화를 활용해서 ", "최신 기술로 "],
-                'suffix': [" 개발이 훨씬 쉬워질 거예요!", " 정말 혁신적인 방법이에요!", " 코드 관리도 편해집니다!"]
-            }
-        }
-        
-        modifiers = style_modifiers.get(npc_id, style_modifiers['alex_ceo'])
-        
-        import random
-        prefix = random.choice(modifiers['prefix'])
-        suffix = random.choice(modifiers['suffix'])
-        
-        return f"{prefix}{base_hint}{suffix}"
-    
     def _build_question_context(self, question_data: Dict[str, Any]) -> Dict[str, str]:
-        """문제 데이터에서 컨텍스트 추출"""
-        return {
-            'category': question_data.get('category', 'General'),
-            'difficulty': question_data.get('difficulty', 'medium'),
-            'scenario': question_data.get('scenario', {}).get('description', ''),
-            'question': question_data.get('question', ''),
-            'context': question_data.get('scenario', {}).get('context', '')
-        }
+        """문제 데이터에서 컨텍스트 추출 (같은 문제는 캐시된 dict 재사용, 수정 금지)"""
+        scenario = question_data.get('scenario', {})
+        return _question_context(
+            question_data.get('category', 'General'),
+            question_data.get('difficulty', 'medium'),
+            scenario.get('description', ''),
+            question_data.get('question', ''),
+            scenario.get('context', '')
+        )
     
     def get_aws_explanation(self, service_name: str, context: str = "") -> Dict[str, Any]:
         """AWS 서비스에 대한 상세 설명 제공"""
         
         if self.q_cli_available:
-            return self._get_q_cli_explanation(service_name, context)
+            cache_key = LLMCache.make_key({
+                'service': service_name.upper(),
+                'ctx': context
+            })
+            cached = _LLM_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            shared = _SHARED_CACHE.get(cache_key)
+            if shared is not None:
+                _LLM_CACHE.set(cache_key, shared)
+                return shared
+            
+            result = self._get_q_cli_explanation(service_name, context)
+            if result.get('source') != 'fallback':
+                _LLM_CACHE.set(cache_key, result)
+                _SHARED_CACHE.set(cache_key, result)
+            return result
         else:
             return self._get_fallback_explanation(service_name, context)
     
@@ -270,169 +998,222 @@ AWS 문제 해결 힌트 요청:
         """Amazon Q CLI를 사용한 AWS 서비스 설명"""
         
         prompt = f"""
-AWS 서비스 설명 요청:
-
 서비스: {service_name}
 컨텍스트: {context}
-
-다음 형식으로 한국어로 설명해주세요:
-1. 서비스 개요 (2-3문장)
-2. 주요 기능 (3-4개 항목)
-3. 사용 사례 (2-3개)
-4. 관련 서비스 (2-3개)
-5. 모범 사례 (2-3개 팁)
-
-간결하고 실용적으로 설명해주세요.
 """
         
         try:
-            result = subprocess.run([
-                'q', 'chat',
-                '--message', prompt.strip(),
-                '--format', 'json'
-            ], capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                response_data = json.loads(result.stdout)
-                explanation = response_data.get('response', '').strip()
-                
-                return {
-                    'explanation': explanation,
-                    'service': service_name,
-                    'source': 'amazon_q',
-                    'success': True
-                }
-            else:
-                return self._get_fallback_explanation(service_name, context)
-                
+            explanation = self._invoke_llm(prompt.strip(), max_tokens=1024,
+                                           system=EXPLANATION_SYSTEM_PROMPT)
         except Exception as e:
             logger.error(f"Error getting Q CLI explanation: {str(e)}")
+            explanation = None
+        
+        if explanation is None:
             return self._get_fallback_explanation(service_name, context)
+        
+        return {
+            'explanation': explanation,
+            'service': service_name,
+            'source': LLM_SOURCES[LLM_BACKEND],
+            'success': True
+        }
     
     def _get_fallback_explanation(self, service_name: str, context: str) -> Dict[str, Any]:
         """대체 AWS 서비스 설명"""
         
-        explanations = {
-            'EC2': {
-                'overview': 'Amazon EC2는 클라우드에서 확장 가능한 컴퓨팅 용량을 제공하는 웹 서비스입니다.',
-                'features': ['다양한 인스턴스 타입', 'Auto Scaling', 'Elastic Load Balancing', 'EBS 스토리지'],
-                'use_cases': ['웹 애플리케이션 호스팅', '데이터 처리', '개발/테스트 환경'],
-                'related': ['ELB', 'Auto Scaling', 'CloudWatch'],
-                'best_practices': ['적절한 인스턴스 타입 선택', '보안 그룹 설정', '정기적인 백업']
-            },
-            'S3': {
-                'overview': 'Amazon S3는 업계 최고의 확장성, 데이터 가용성, 보안 및 성능을 제공하는 객체 스토리지 서비스입니다.',
-                'features': ['무제한 스토리지', '다양한 스토리지 클래스', '버전 관리', '라이프사이클 정책'],
-                'use_cases': ['정적 웹사이트 호스팅', '데이터 백업', 'CDN 원본 스토리지'],
-                'related': ['CloudFront', 'Lambda', 'Glacier'],
-                'best_practices': ['적절한 스토리지 클래스 선택', '버킷 정책 설정', '암호화 활성화']
-            },
-            'Lambda': {
-                'overview': 'AWS Lambda는 서버를 프로비저닝하거나 관리하지 않고도 코드를 실행할 수 있는 서버리스 컴퓨팅 서비스입니다.',
-                'features': ['자동 스케일링', '이벤트 기반 실행', '다양한 런타임 지원', '내장 모니터링'],
-                'use_cases': ['API 백엔드', '데이터 처리', '실시간 파일 처리'],
-                'related': ['API Gateway', 'DynamoDB', 'S3'],
-                'best_practices': ['함수 크기 최적화', '환경 변수 활용', '적절한 메모리 설정']
-            }
-        }
-        
-        service_info = explanations.get(service_name.upper(), explanations['EC2'])
-        
-        formatted_explanation = f"""
-**{service_name} 개요**
-{service_info['overview']}
-
-**주요 기능**
-{' • '.join(service_info['features'])}
-
-**사용 사례**
-{' • '.join(service_info['use_cases'])}
-
-**관련 서비스**
-{' • '.join(service_info['related'])}
-
-**모범 사례**
-{' • '.join(service_info['best_practices'])}
-"""
-        
         return {
-            'explanation': formatted_explanation.strip(),
+            'explanation': _fallback_explanation_text(service_name),
             'service': service_name,
             'source': 'fallback',
             'success': True
         }
 
 
+# 웜 컨테이너에서 재사용되는 힌트 제공자 인스턴스
+_PROVIDER = AmazonQHintProvider()
+
+
+def _warm_up_clients() -> None:
+    """INIT 단계에서 클라이언트 생성 및 DynamoDB 연결 수립 (첫 요청의 TLS/자격 증명 비용 제거)"""
+    try:
+        if LLM_BACKEND == 'bedrock':
+            _get_bedrock_client()
+        if _SHARED_CACHE.enabled:
+            _get_dynamodb_client().get_item(
+                TableName=HINT_CACHE_TABLE,
+                Key={'cache_key': {'S': '__warmup__'}},
+                ProjectionExpression='cache_key'
+            )
+    except Exception as e:
+        logger.warning(f"Client warm-up failed: {str(e)}")
+
+
+_warm_up_clients()
+
+# CORS 헤더 및 preflight 응답 (요청마다 동일하므로 import 시 1회 생성)
+_CORS_HEADERS = {
+    'Content-Type': 'application/json; charset=utf-8',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type'
+}
+_OPTIONS_RESPONSE = {
+    'statusCode': 200,
+    'headers': _CORS_HEADERS,
+    'body': '{"message":"OK"}'
+}
+
+# 고정 오류 응답 (본문 직렬화도 import 시 1회)
+_INVALID_ACTION_RESPONSE = {
+    'statusCode': 400,
+    'headers': _CORS_HEADERS,
+    'body': _json_dumps({'error': 'Invalid action'})
+}
+_BATCH_SIZE_ERROR_RESPONSE = {
+    'statusCode': 400,
+    'headers': _CORS_HEADERS,
+    'body': _json_dumps({'error': f'requests must be a list of 1-{MAX_BATCH_SIZE} objects'})
+}
+_HINT_LEVEL_ERROR_RESPONSE = {
+    'statusCode': 400,
+    'headers': _CORS_HEADERS,
+    'body': _json_dumps({'error': 'hintLevel must be an integer'})
+}
+
+
+def _parse_hint_level(value: Any) -> Optional[int]:
+    """요청의 hintLevel을 정수로 변환 ("2" 같은 문자열 허용, 변환 불가 시 None)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _emit_hint_metrics(results: List[Dict[str, Any]], latency_ms: float) -> None:
+    """힌트 출처별 제공 수와 처리 시간을 EMF 형식으로 stdout에 기록"""
+    counts: Dict[str, int] = {}
+    for result in results:
+        source = result.get('source', 'unknown')
+        counts[source] = counts.get(source, 0) + 1
+    
+    timestamp = int(time.time() * 1000)
+    for source, count in counts.items():
+        print(_json_dumps({
+            '_aws': {
+                'Timestamp': timestamp,
+                'CloudWatchMetrics': [{
+                    'Namespace': METRICS_NAMESPACE,
+                    'Dimensions': [['Source']],
+                    'Metrics': [
+                        {'Name': 'HintsProvided', 'Unit': 'Count'},
+                        {'Name': 'HintLatency', 'Unit': 'Milliseconds'}
+                    ]
+                }]
+            },
+            'Source': source,
+            'HintsProvided': count,
+            'HintLatency': round(latency_ms, 1)
+        }))
+
+
+def _handle_get_hint(request_data: Dict[str, Any]) -> Dict[str, Any]:
+    """힌트 요청 처리"""
+    question_data = request_data.get('questionData', {})
+    npc_id = request_data.get('npcId', 'alex_ceo')
+    hint_level = _parse_hint_level(request_data.get('hintLevel', 1))
+    if hint_level is None:
+        return _HINT_LEVEL_ERROR_RESPONSE
+    
+    started = time.perf_counter()
+    result = _PROVIDER.generate_hint(question_data, npc_id, hint_level)
+    if METRICS_ENABLED:
+        _emit_hint_metrics([result], (time.perf_counter() - started) * 1000)
+    
+    return {
+        'statusCode': 200,
+        'headers': _CORS_HEADERS,
+        'body': _json_dumps(result)
+    }
+
+
+def _handle_get_hints_batch(request_data: Dict[str, Any]) -> Dict[str, Any]:
+    """여러 힌트 동시 요청 처리"""
+    hint_requests = request_data.get('requests', [])
+    
+    if (not isinstance(hint_requests, list) or not hint_requests
+            or len(hint_requests) > MAX_BATCH_SIZE
+            or not all(isinstance(request, dict) for request in hint_requests)):
+        return _BATCH_SIZE_ERROR_RESPONSE
+    
+    levels = [_parse_hint_level(request.get('hintLevel', 1)) for request in hint_requests]
+    if None in levels:
+        return _HINT_LEVEL_ERROR_RESPONSE
+    hint_requests = [
+        {**request, 'hintLevel': level} for request, level in zip(hint_requests, levels)
+    ]
+    
+    started = time.perf_counter()
+    results = _PROVIDER.generate_hints_batch(hint_requests)
+    if METRICS_ENABLED:
+        _emit_hint_metrics(results, (time.perf_counter() - started) * 1000)
+    
+    return {
+        'statusCode': 200,
+        'headers': _CORS_HEADERS,
+        'body': _json_dumps({'hints': results, 'count': len(results)})
+    }
+
+
+def _handle_get_explanation(request_data: Dict[str, Any]) -> Dict[str, Any]:
+    """AWS 서비스 설명 요청 처리"""
+    service_name = request_data.get('serviceName', '')
+    context = request_data.get('context', '')
+    
+    result = _PROVIDER.get_aws_explanation(service_name, context)
+    
+    return {
+        'statusCode': 200,
+        'headers': _CORS_HEADERS,
+        'body': _json_dumps(result)
+    }
+
+
+# action별 처리 함수
+_ACTIONS = {
+    'get_hint': _handle_get_hint,
+    'get_hints_batch': _handle_get_hints_batch,
+    'get_explanation': _handle_get_explanation
+}
+
+
 def lambda_handler(event, context):
     """Lambda 함수 핸들러"""
     
+    # OPTIONS 요청 처리 (CORS preflight)
+    if event.get('httpMethod') == 'OPTIONS':
+        return _OPTIONS_RESPONSE
+    
     try:
-        # CORS 헤더
-        headers = {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-            'Access-Control-Allow-Headers': 'Content-Type'
-        }
-        
-        # OPTIONS 요청 처리 (CORS preflight)
-        if event.get('httpMethod') == 'OPTIONS':
-            return {
-                'statusCode': 200,
-                'headers': headers,
-                'body': json.dumps({'message': 'OK'})
-            }
-        
         # 요청 데이터 파싱
         if event.get('body'):
-            request_data = json.loads(event['body'])
+            request_data = _json_loads(event['body'])
         else:
             request_data = event
         
-        action = request_data.get('action')
-        hint_provider = AmazonQHintProvider()
+        handler = _ACTIONS.get(request_data.get('action'))
+        if handler is None:
+            return _INVALID_ACTION_RESPONSE
         
-        if action == 'get_hint':
-            # 힌트 요청 처리
-            question_data = request_data.get('questionData', {})
-            npc_id = request_data.get('npcId', 'alex_ceo')
-            hint_level = request_data.get('hintLevel', 1)
-            
-            result = hint_provider.generate_hint(question_data, npc_id, hint_level)
-            
-            return {
-                'statusCode': 200,
-                'headers': headers,
-                'body': json.dumps(result)
-            }
-        
-        elif action == 'get_explanation':
-            # AWS 서비스 설명 요청 처리
-            service_name = request_data.get('serviceName', '')
-            context = request_data.get('context', '')
-            
-            result = hint_provider.get_aws_explanation(service_name, context)
-            
-            return {
-                'statusCode': 200,
-                'headers': headers,
-                'body': json.dumps(result)
-            }
-        
-        else:
-            return {
-                'statusCode': 400,
-                'headers': headers,
-                'body': json.dumps({'error': 'Invalid action'})
-            }
+        return handler(request_data)
     
     except Exception as e:
         logger.error(f"Lambda handler error: {str(e)}")
         
         return {
             'statusCode': 500,
-            'headers': headers,
-            'body': json.dumps({
+            'headers': _CORS_HEADERS,
+            'body': _json_dumps({
                 'error': 'Internal server error',
                 'message': str(e)
             })
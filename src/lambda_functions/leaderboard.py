@@ -5,51 +5,167 @@ AWS Problem Solver Game - Leaderboard Lambda Function
 
 import json
 import boto3
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List
-from boto3.dynamodb.conditions import Key, Attr
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional
+from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 
-# DynamoDB 클라이언트 초기화
-dynamodb = boto3.resource('dynamodb')
-leaderboard_table = dynamodb.Table('aws-game-leaderboard')
-users_table = dynamodb.Table('aws-game-users')
+# 프로젝트 경로 추가 (배포 패키지에는 utils가 함께 복사됨)
+sys.path.append('/opt/python')
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-"""
-AWS Problem Solver Game - Leaderboard Lambda Function
-리더보드 관리 및 순위 시스템을 담당하는 Lambda 함수
-"""
+from utils.leaderboard_store import LEADERBOARD_TYPES, ranking_attributes, upsert_ranking
 
-import json
-import boto3
-import os
-from datetime import datetime, timedelta
-from typing import Dict, List
-from boto3.dynamodb.conditions import Key, Attr
+try:
+    import amazondax
+except ImportError:
+    amazondax = None
 
-# DynamoDB 클라이언트 초기화
-dynamodb = boto3.resource('dynamodb')
-leaderboard_table = dynamodb.Table(os.environ.get('LEADERBOARD_TABLE', 'aws-game-leaderboard'))
-users_table = dynamodb.Table(os.environ.get('USERS_TABLE', 'aws-game-users'))
+try:
+    import orjson
+except ImportError:
+    # orjson이 없는 환경에서는 표준 json 사용
+    orjson = None
+
+def _decimal_default(obj):
+    """DynamoDB Decimal 값을 int/float로 변환"""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+def _json_dumps(obj) -> str:
+    """JSON 직렬화 (orjson 사용 가능 시 우선 사용, 한글은 이스케이프하지 않음)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_decimal_default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, default=_decimal_default)
+
+# DynamoDB 클라이언트 초기화 (웜 컨테이너에서 재사용)
+# 병렬 쓰기를 위해 풀 확장, 빠른 실패를 위해 타임아웃/재시도 제한
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'mode': 'adaptive', 'total_max_attempts': 3},
+    connect_timeout=5,
+    read_timeout=10,
+    tcp_keepalive=True
+)
+dynamodb = boto3.resource('dynamodb', config=DYNAMODB_CONFIG)
+DAX_ENDPOINT = os.environ.get('DAX_ENDPOINT')
+
+# 리더보드 조회는 DAX 클러스터가 설정되어 있으면 DAX를 경유
+if DAX_ENDPOINT and amazondax:
+    leaderboard_resource = amazondax.AmazonDaxClient.resource(endpoint_url=DAX_ENDPOINT)
+else:
+    leaderboard_resource = dynamodb
+LEADERBOARD_TABLE = os.environ.get('LEADERBOARD_TABLE', 'aws-game-leaderboard-v2')
+leaderboard_table = leaderboard_resource.Table(LEADERBOARD_TABLE)
+# 점수 순 조회용 GSI (기본 키는 leaderboardType + userId)
+SCORE_INDEX = 'leaderboardType-score-index'
+BULK_UPDATE_WORKERS = 16
+BATCH_GET_LIMIT = 100  # BatchGetItem 최대 키 수
+BATCH_GET_MAX_RETRIES = 5
+
+# 병렬 DynamoDB 호출용 스레드 풀 (웜 컨테이너에서 스레드와 스레드별 resource를 함께 재사용)
+_BULK_EXECUTOR = ThreadPoolExecutor(max_workers=BULK_UPDATE_WORKERS)
+_FANOUT_EXECUTOR = ThreadPoolExecutor(max_workers=len(LEADERBOARD_TYPES))
+_thread_local = threading.local()
+
+def thread_leaderboard_table():
+    """
+    현재 스레드 전용 리더보드 Table (boto3 resource는 스레드 간 공유할 수 없음)
+    """
+    if threading.current_thread() is threading.main_thread():
+        return leaderboard_table
+    table = getattr(_thread_local, 'leaderboard_table', None)
+    if table is None:
+        if DAX_ENDPOINT and amazondax:
+            resource = amazondax.AmazonDaxClient.resource(endpoint_url=DAX_ENDPOINT)
+        else:
+            resource = boto3.session.Session().resource('dynamodb', config=DYNAMODB_CONFIG)
+        table = _thread_local.leaderboard_table = resource.Table(LEADERBOARD_TABLE)
+    return table
+
+def _leaderboard_call(method: str, **kwargs):
+    """현재 스레드의 리더보드 Table로 DynamoDB 호출 (스레드 풀 작업용)"""
+    return getattr(thread_leaderboard_table(), method)(**kwargs)
+
+# 통계 분포 구간 (점수는 상한 미포함, 레벨은 상한 포함)
+SCORE_BOUNDS = (1000, 2500, 5000, 10000)
+SCORE_LABELS = ('0-999', '1000-2499', '2500-4999', '5000-9999', '10000+')
+LEVEL_BOUNDS = (3, 6, 9, 12)
+LEVEL_LABELS = ('1-3', '4-6', '7-9', '10-12', '13+')
+NUMPY_STATS_THRESHOLD = 1000  # 이 이상이면 NumPy로 집계
+
+# 스트림 처리기(leaderboard_ranker)가 유지하는 타입별 집계 행 (score가 없어 GSI에는 포함되지 않음)
+STATS_USER_ID = '#STATS'
+USERS_TABLE = os.environ.get('USERS_TABLE', 'aws-game-users')
+users_table = dynamodb.Table(USERS_TABLE)
+
+# 조회 응답 캐시 (웜 컨테이너 재사용)
+# 키에 사용자 ID가 들어가므로 최근 사용 순으로 LB_CACHE_MAX_ENTRIES개까지만 유지
+LB_CACHE_TTL = float(os.environ.get('LB_CACHE_TTL', 30))
+LB_CACHE_MAX_ENTRIES = int(os.environ.get('LB_CACHE_MAX_ENTRIES', 512))
+_CACHE: 'OrderedDict[tuple, tuple]' = OrderedDict()
+
+def _cache_get(key: tuple):
+    hit = _CACHE.get(key)
+    if not hit:
+        return None
+    if time.monotonic() - hit[0] >= LB_CACHE_TTL:
+        del _CACHE[key]
+        return None
+    _CACHE.move_to_end(key)
+    return hit[1]
+
+def _cache_set(key: tuple, response: Dict) -> Dict:
+    _CACHE[key] = (time.monotonic(), response)
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > LB_CACHE_MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+    return response
+
+# 조회 개수 상한 (캐시 키와 Query Limit에 그대로 쓰이므로 범위를 제한)
+MAX_LEADERBOARD_LIMIT = 100
+
+# CORS 헤더 (호출마다 새로 만들지 않도록 모듈 상수로 유지, 수정 금지)
+CORS_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization'
+}
+
+# 고정 응답 본문 (모듈 로드 시 한 번만 직렬화)
+_PREFLIGHT_BODY = _json_dumps({'message': 'CORS preflight successful'})
+_ERR_USER_ID_PARAM = _json_dumps({'error': 'userId 파라미터가 필요합니다.'})
+_ERR_RANK_NOT_FOUND = _json_dumps({'error': '사용자의 순위 정보를 찾을 수 없습니다.'})
+_ERR_USER_UPDATES = _json_dumps({'error': 'userUpdates 배열이 필요합니다.'})
+_ERR_ADMIN_REQUIRED = _json_dumps({'error': '관리자 권한이 필요합니다.'})
+_ERR_LEADERBOARD_TYPE = _json_dumps({'error': 'leaderboardType이 필요합니다.'})
+_ERR_USER_ID = _json_dumps({'error': 'userId가 필요합니다.'})
+_ERR_USER_NOT_FOUND = _json_dumps({'error': '사용자를 찾을 수 없습니다.'})
 
 def lambda_handler(event, context):
     """
     Lambda 함수 메인 핸들러
     """
     try:
-        # CORS 헤더 설정
-        cors_headers = {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-            'Access-Control-Allow-Headers': 'Content-Type, Authorization'
-        }
+        cors_headers = CORS_HEADERS
         
         # OPTIONS 요청 처리
         if event.get('httpMethod') == 'OPTIONS':
             return {
                 'statusCode': 200,
                 'headers': cors_headers,
-                'body': json.dumps({'message': 'CORS preflight successful'})
+                'body': _PREFLIGHT_BODY
             }
         
         http_method = event.get('httpMethod', '')
@@ -58,32 +174,27 @@ def lambda_handler(event, context):
         print(f"Processing {http_method} request to {path}")
         
         if http_method == 'GET':
-            if '/leaderboard' in path:
-                return get_leaderboard(event, cors_headers)
-            elif '/user-rank' in path:
-                return get_user_rank(event, cors_headers)
-            elif '/leaderboard/stats' in path:
-                return get_leaderboard_stats(event, cors_headers)
+            # API Gateway가 넘겨주는 리소스 경로로 핸들러 조회
+            route = (event.get('resource') or path).rstrip('/')
+            handler = ROUTES.get(route)
+            if handler:
+                return handler(event, cors_headers)
         
         elif http_method == 'POST':
             body = json.loads(event.get('body', '{}'))
-            action = body.get('action')
-            
-            if action == 'update_leaderboard':
-                return update_leaderboard(body, cors_headers)
-            elif action == 'bulk_update':
-                return bulk_update_leaderboard(body, cors_headers)
-            elif action == 'reset_leaderboard':
-                return reset_leaderboard(body, cors_headers)
+            handler = ACTIONS.get(body.get('action'))
+            if handler:
+                _CACHE.clear()
+                return handler(body, cors_headers)
         
         return {
             'statusCode': 404,
             'headers': cors_headers,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'error': '요청한 엔드포인트를 찾을 수 없습니다.',
                 'path': path,
                 'method': http_method
-            }, ensure_ascii=False)
+            })
         }
         
     except Exception as e:
@@ -97,10 +208,10 @@ def lambda_handler(event, context):
                 'Content-Type': 'application/json',
                 'Access-Control-Allow-Origin': '*'
             },
-            'body': json.dumps({
+            'body': _json_dumps({
                 'error': '서버 내부 오류가 발생했습니다.',
                 'details': str(e)
-            }, ensure_ascii=False)
+            })
         }
 
 def get_user_rank(event, cors_headers) -> Dict:
@@ -116,52 +227,60 @@ def get_user_rank(event, cors_headers) -> Dict:
             return {
                 'statusCode': 400,
                 'headers': cors_headers,
-                'body': json.dumps({
-                    'error': 'userId 파라미터가 필요합니다.'
-                }, ensure_ascii=False)
+                'body': _ERR_USER_ID_PARAM
             }
         
-        # 사용자의 리더보드 엔트리 조회
-        response = leaderboard_table.query(
-            IndexName='userId-index',
-            KeyConditionExpression=Key('userId').eq(user_id),
-            FilterExpression=Attr('leaderboardType').eq(leaderboard_type)
-        )
-        
-        user_entries = response.get('Items', [])
-        if not user_entries:
+        cache_key = ('user-rank', leaderboard_type, user_id)
+        cached = _cache_get(cache_key)
+        if cached:
+            return cached
+        
+        # 사용자 엔트리와 집계 행을 한 번의 BatchGetItem으로 조회
+        found, unprocessed = batch_get_with_retry(leaderboard_resource, LEADERBOARD_TABLE, {
+            'Keys': [
+                {'leaderboardType': leaderboard_type, 'userId': user_id},
+                {'leaderboardType': leaderboard_type, 'userId': STATS_USER_ID}
+            ],
+            'ProjectionExpression': 'userId, score, #pos, username, #lvl, accuracy, entryCount',
+            'ExpressionAttributeNames': {'#pos': 'position', '#lvl': 'level'}
+        })
+        if unprocessed:
+            # 스로틀링으로 못 읽은 행을 404/잘못된 참가자 수로 응답하지 않도록 실패 처리
+            raise RuntimeError(f"Unprocessed leaderboard keys after {BATCH_GET_MAX_RETRIES} attempts")
+        items = {item['userId']: item for item in found}
+        
+        user_entry = items.get(user_id)
+        if not user_entry or 'score' not in user_entry:
             return {
                 'statusCode': 404,
                 'headers': cors_headers,
-                'body': json.dumps({
-                    'error': '사용자의 순위 정보를 찾을 수 없습니다.'
-                }, ensure_ascii=False)
+                'body': _ERR_RANK_NOT_FOUND
             }
         
-        user_entry = user_entries[0]
         user_score = user_entry['score']
-        
-        # 해당 사용자보다 높은 점수를 가진 사용자 수 조회 (순위 계산)
-        higher_scores_response = leaderboard_table.query(
-            KeyConditionExpression=Key('leaderboardType').eq(leaderboard_type) & Key('score').gt(user_score),
-            ScanIndexForward=False
-        )
-        
-        rank = len(higher_scores_response.get('Items', [])) + 1
-        
-        # 전체 참가자 수 조회
-        total_response = leaderboard_table.query(
-            KeyConditionExpression=Key('leaderboardType').eq(leaderboard_type)
-        )
-        total_participants = len(total_response.get('Items', []))
+        partition = Key('leaderboardType').eq(leaderboard_type)
+        
+        # 스트림 처리기(leaderboard_ranker)가 미리 계산한 순위 사용,
+        # 아직 반영되지 않았으면 높은 점수를 가진 사용자 수로 계산
+        rank = user_entry.get('position')
+        if rank is None:
+            rank = count_query(partition & Key('score').gt(user_score), index_name=SCORE_INDEX) + 1
+        rank = int(rank)
+        
+        # 전체 참가자 수 (집계 행이 없으면 점수 GSI 카운트)
+        aggregates = items.get(STATS_USER_ID)
+        if aggregates and 'entryCount' in aggregates:
+            total_participants = int(aggregates['entryCount'])
+        else:
+            total_participants = count_query(partition, index_name=SCORE_INDEX)
         
         # 상위 퍼센트 계산
         percentile = ((total_participants - rank + 1) / total_participants) * 100 if total_participants > 0 else 0
         
-        return {
+        return _cache_set(cache_key, {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'user_id': user_id,
                 'leaderboard_type': leaderboard_type,
                 'rank': rank,
@@ -173,8 +292,8 @@ def get_user_rank(event, cors_headers) -> Dict:
                     'level': user_entry.get('level', 1),
                     'accuracy': user_entry.get('accuracy', 0)
                 }
-            }, ensure_ascii=False)
-        }
+            })
+        })
         
     except Exception as e:
         print(f"Error in get_user_rank: {str(e)}")
@@ -188,19 +307,58 @@ def get_leaderboard_stats(event, cors_headers) -> Dict:
         query_params = event.get('queryStringParameters') or {}
         leaderboard_type = query_params.get('type', 'alltime')
         
-        # 리더보드 데이터 조회
-        response = leaderboard_table.query(
-            KeyConditionExpression=Key('leaderboardType').eq(leaderboard_type),
-            ScanIndexForward=False
-        )
+        cache_key = ('stats', leaderboard_type)
+        cached = _cache_get(cache_key)
+        if cached:
+            return cached
         
-        entries = response.get('Items', [])
-        
-        if not entries:
+        # 상위 5명, 최저 점수, 스트림 집계 행을 병렬 조회
+        partition = Key('leaderboardType').eq(leaderboard_type)
+        top_future = _FANOUT_EXECUTOR.submit(
+            _leaderboard_call, 'query',
+            IndexName=SCORE_INDEX, KeyConditionExpression=partition, ScanIndexForward=False, Limit=5
+        )
+        lowest_future = _FANOUT_EXECUTOR.submit(
+            _leaderboard_call, 'query',
+            IndexName=SCORE_INDEX, KeyConditionExpression=partition, ScanIndexForward=True, Limit=1,
+            ProjectionExpression='score'
+        )
+        aggregates_future = _FANOUT_EXECUTOR.submit(
+            _leaderboard_call, 'get_item',
+            Key={'leaderboardType': leaderboard_type, 'userId': STATS_USER_ID}
+        )
+        top_performers = top_future.result().get('Items', [])
+        lowest_entries = lowest_future.result().get('Items', [])
+        aggregates = aggregates_future.result().get('Item')
+        
+        if top_performers and aggregates and aggregates.get('entryCount', 0) > 0:
+            statistics = summarize_aggregates(aggregates, top_performers[0]['score'], lowest_entries[0]['score'])
+            statistics['top_performers'] = top_performers
+            return _cache_set(cache_key, {
+                'statusCode': 200,
+                'headers': cors_headers,
+                'body': _json_dumps({
+                    'leaderboard_type': leaderboard_type,
+                    'statistics': statistics,
+                    'last_updated': datetime.utcnow().isoformat() + 'Z'
+                })
+            })
+        
+        # 집계 행이 아직 없으면 전체 데이터를 페이지 단위로 순회하며 집계
+        statistics = None
+        if top_performers:
+            statistics = summarize_pages(query_pages(
+                IndexName=SCORE_INDEX,
+                KeyConditionExpression=partition,
+                ProjectionExpression='score, #lvl, accuracy',
+                ExpressionAttributeNames={'#lvl': 'level'}
+            ))
+        
+        if not statistics:
             return {
                 'statusCode': 200,
                 'headers': cors_headers,
-                'body': json.dumps({
+                'body': _json_dumps({
                     'leaderboard_type': leaderboard_type,
                     'statistics': {
                         'total_participants': 0,
@@ -208,35 +366,20 @@ def get_leaderboard_stats(event, cors_headers) -> Dict:
                         'highest_score': 0,
                         'lowest_score': 0
                     }
-                }, ensure_ascii=False)
+                })
             }
         
-        # 통계 계산
-        scores = [entry['score'] for entry in entries]
-        levels = [entry.get('level', 1) for entry in entries]
-        accuracies = [entry.get('accuracy', 0) for entry in entries]
-        
-        statistics = {
-            'total_participants': len(entries),
-            'average_score': round(sum(scores) / len(scores), 1),
-            'highest_score': max(scores),
-            'lowest_score': min(scores),
-            'average_level': round(sum(levels) / len(levels), 1),
-            'average_accuracy': round(sum(accuracies) / len(accuracies), 1),
-            'score_distribution': calculate_score_distribution(scores),
-            'level_distribution': calculate_level_distribution(levels),
-            'top_performers': entries[:5]  # 상위 5명
-        }
+        statistics['top_performers'] = top_performers  # 상위 5명
         
-        return {
+        return _cache_set(cache_key, {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'leaderboard_type': leaderboard_type,
                 'statistics': statistics,
                 'last_updated': datetime.utcnow().isoformat() + 'Z'
-            }, ensure_ascii=False)
-        }
+            })
+        })
         
     except Exception as e:
         print(f"Error in get_leaderboard_stats: {str(e)}")
@@ -253,50 +396,82 @@ def bulk_update_leaderboard(data: Dict, cors_headers) -> Dict:
             return {
                 'statusCode': 400,
                 'headers': cors_headers,
-                'body': json.dumps({
-                    'error': 'userUpdates 배열이 필요합니다.'
-                }, ensure_ascii=False)
+                'body': _ERR_USER_UPDATES
             }
         
         updated_count = 0
         failed_updates = []
+        user_ids = [update.get('userId') for update in user_updates if update.get('userId')]
+        
+        # 사용자 정보 일괄 조회
+        users = batch_get_users(user_ids)
+        failed_updates.extend(
+            {'userId': user_id, 'reason': 'User not found'}
+            for user_id in user_ids if user_id not in users
+        )
         
-        for update in user_updates:
+        # 사용자별 리더보드 업데이트를 병렬로 실행 (사용자 안에서는 타입별로 순차 쓰기)
+        futures = {
+            _BULK_EXECUTOR.submit(update_user_ranking, users[user_id], LEADERBOARD_TYPES, False): user_id
+            for user_id in user_ids if user_id in users
+        }
+        for future in as_completed(futures):
             try:
-                user_id = update.get('userId')
-                if not user_id:
-                    continue
-                
-                # 사용자 정보 조회
-                user_response = users_table.get_item(Key={'userId': user_id})
-                if 'Item' not in user_response:
-                    failed_updates.append({'userId': user_id, 'reason': 'User not found'})
-                    continue
-                
-                user = user_response['Item']
-                
-                # 리더보드 업데이트
-                update_user_ranking(user, ['alltime', 'monthly', 'weekly', 'daily'])
+                future.result()
                 updated_count += 1
-                
             except Exception as e:
-                failed_updates.append({'userId': update.get('userId'), 'reason': str(e)})
+                failed_updates.append({'userId': futures[future], 'reason': str(e)})
         
         return {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'message': f'{updated_count}명의 사용자 리더보드가 업데이트되었습니다.',
                 'updated_count': updated_count,
                 'failed_count': len(failed_updates),
                 'failed_updates': failed_updates
-            }, ensure_ascii=False)
+            })
         }
         
     except Exception as e:
         print(f"Error in bulk_update_leaderboard: {str(e)}")
         raise
 
+def batch_get_with_retry(resource, table_name: str, keys_and_options: Dict):
+    """
+    한 테이블에 대한 BatchGetItem (미처리 키는 백오프 후 재시도)
+    (조회된 항목, 재시도 후에도 남은 미처리 키 또는 None) 반환
+    """
+    items = []
+    request_items = {table_name: keys_and_options}
+    for attempt in range(BATCH_GET_MAX_RETRIES):
+        response = resource.batch_get_item(RequestItems=request_items)
+        items.extend(response.get('Responses', {}).get(table_name, []))
+        
+        request_items = response.get('UnprocessedKeys')
+        if not request_items:
+            return items, None
+        time.sleep(0.05 * (2 ** attempt))
+    return items, request_items
+
+def batch_get_users(user_ids: List[str]) -> Dict[str, Dict]:
+    """
+    BatchGetItem으로 사용자 일괄 조회 (100개 단위, 미처리 키는 백오프 후 재시도)
+    """
+    users = {}
+    unique_ids = list(dict.fromkeys(user_ids))
+    
+    for start in range(0, len(unique_ids), BATCH_GET_LIMIT):
+        found, unprocessed = batch_get_with_retry(dynamodb, USERS_TABLE, {
+            'Keys': [{'userId': user_id} for user_id in unique_ids[start:start + BATCH_GET_LIMIT]]
+        })
+        for item in found:
+            users[item['userId']] = item
+        if unprocessed:
+            print(f"Unprocessed user keys after {BATCH_GET_MAX_RETRIES} attempts")
+    
+    return users
+
 def reset_leaderboard(data: Dict, cors_headers) -> Dict:
     """
     리더보드 초기화 (관리자 전용)
@@ -310,43 +485,43 @@ def reset_leaderboard(data: Dict, cors_headers) -> Dict:
             return {
                 'statusCode': 403,
                 'headers': cors_headers,
-                'body': json.dumps({
-                    'error': '관리자 권한이 필요합니다.'
-                }, ensure_ascii=False)
+                'body': _ERR_ADMIN_REQUIRED
             }
         
         if not leaderboard_type:
             return {
                 'statusCode': 400,
                 'headers': cors_headers,
-                'body': json.dumps({
-                    'error': 'leaderboardType이 필요합니다.'
-                }, ensure_ascii=False)
+                'body': _ERR_LEADERBOARD_TYPE
             }
         
-        # 해당 타입의 모든 리더보드 엔트리 삭제
-        response = leaderboard_table.query(
-            KeyConditionExpression=Key('leaderboardType').eq(leaderboard_type)
+        # 해당 타입의 모든 리더보드 엔트리 삭제 (BatchWriteItem, 페이지 단위)
+        # 점수 GSI로 조회해 집계 행은 남기고, 집계는 스트림의 REMOVE로 차감됨
+        pages = query_pages(
+            IndexName=SCORE_INDEX,
+            KeyConditionExpression=Key('leaderboardType').eq(leaderboard_type),
+            ProjectionExpression='userId'
         )
-        
         deleted_count = 0
-        for item in response.get('Items', []):
-            leaderboard_table.delete_item(
-                Key={
-                    'leaderboardType': leaderboard_type,
-                    'score': item['score']
-                }
-            )
-            deleted_count += 1
+        with leaderboard_table.batch_writer() as batch:
+            for page in pages:
+                for item in page:
+                    batch.delete_item(
+                        Key={
+                            'leaderboardType': leaderboard_type,
+                            'userId': item['userId']
+                        }
+                    )
+                    deleted_count += 1
         
         return {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'message': f'{leaderboard_type} 리더보드가 초기화되었습니다.',
                 'deleted_count': deleted_count,
                 'leaderboard_type': leaderboard_type
-            }, ensure_ascii=False)
+            })
         }
         
     except Exception as e:
@@ -354,122 +529,169 @@ def reset_leaderboard(data: Dict, cors_headers) -> Dict:
         raise
 
 # 헬퍼 함수들
-def calculate_score_distribution(scores: List[int]) -> Dict:
+def count_query(key_condition, index_name: str = None) -> int:
     """
-    점수 분포 계산
+    Select='COUNT' 쿼리로 항목 수만 조회 (페이지 누적)
     """
-    if not scores:
-        return {}
-    
-    # 점수 구간별 분포
-    ranges = {
-        '0-999': 0,
-        '1000-2499': 0,
-        '2500-4999': 0,
-        '5000-9999': 0,
-        '10000+': 0
+    kwargs = {'KeyConditionExpression': key_condition, 'Select': 'COUNT'}
+    if index_name:
+        kwargs['IndexName'] = index_name
+    total = 0
+    while True:
+        response = leaderboard_table.query(**kwargs)
+        total += response.get('Count', 0)
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return total
+        kwargs['ExclusiveStartKey'] = last_key
+
+@lru_cache(maxsize=1)
+def _numpy():
+    """numpy 지연 import (대규모 통계 집계 시에만 로드, 없는 환경에서는 None)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def summarize_aggregates(aggregates: Dict, highest_score, lowest_score) -> Dict:
+    """
+    집계 행(합계/구간별 카운터)으로 통계 계산
+    """
+    count = aggregates['entryCount']
+    return {
+        'total_participants': count,
+        'average_score': round(aggregates.get('scoreSum', 0) / count, 1),
+        'highest_score': highest_score,
+        'lowest_score': lowest_score,
+        'average_level': round(aggregates.get('levelSum', 0) / count, 1),
+        'average_accuracy': round(aggregates.get('accuracySum', 0) / count, 1),
+        'score_distribution': {
+            label: aggregates.get(f'scoreBucket{i}', 0) for i, label in enumerate(SCORE_LABELS)
+        },
+        'level_distribution': {
+            label: aggregates.get(f'levelBucket{i}', 0) for i, label in enumerate(LEVEL_LABELS)
+        }
     }
-    
-    for score in scores:
-        if score < 1000:
-            ranges['0-999'] += 1
-        elif score < 2500:
-            ranges['1000-2499'] += 1
-        elif score < 5000:
-            ranges['2500-4999'] += 1
-        elif score < 10000:
-            ranges['5000-9999'] += 1
+
+def query_pages(**kwargs) -> Iterator[List[Dict]]:
+    """
+    리더보드 Query 결과를 페이지(최대 1MB) 단위로 지연 반환
+    """
+    while True:
+        response = leaderboard_table.query(**kwargs)
+        yield response.get('Items', [])
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return
+        kwargs['ExclusiveStartKey'] = last_key
+
+def summarize_pages(pages: Iterable[List[Dict]]) -> Optional[Dict]:
+    """
+    페이지별 부분 집계를 합쳐 통계 계산 (전체 엔트리를 메모리에 두지 않음)
+    """
+    np = _numpy()
+    totals = None
+    for page in pages:
+        if not page:
+            continue
+        if np is not None and len(page) >= NUMPY_STATS_THRESHOLD:
+            partial = aggregate_entries_numpy(np, page)
         else:
-            ranges['10000+'] += 1
+            partial = aggregate_entries(page)
+        
+        if totals is None:
+            totals = partial
+            continue
+        for name, value in partial.items():
+            if name == 'highestScore':
+                totals[name] = max(totals[name], value)
+            elif name == 'lowestScore':
+                totals[name] = min(totals[name], value)
+            else:
+                totals[name] += value
     
-    return ranges
+    if totals is None:
+        return None
+    return summarize_aggregates(totals, totals['highestScore'], totals['lowestScore'])
 
-def calculate_level_distribution(levels: List[int]) -> Dict:
+def aggregate_entries(entries: List[Dict]) -> Dict:
     """
-    레벨 분포 계산
+    엔트리 부분 집계 (한 번의 순회로 합계/최대/최소/분포 계산, 집계 행과 같은 키 사용)
     """
-    if not levels:
-        return {}
-    
-    # 레벨 구간별 분포
-    ranges = {
-        '1-3': 0,
-        '4-6': 0,
-        '7-9': 0,
-        '10-12': 0,
-        '13+': 0
-    }
+    score_sum = level_sum = 0
+    accuracy_sum = 0.0
+    highest_score = lowest_score = int(entries[0]['score'])
+    score_buckets = [0] * len(SCORE_LABELS)
+    level_buckets = [0] * len(LEVEL_LABELS)
     
-    for level in levels:
-        if level <= 3:
-            ranges['1-3'] += 1
-        elif level <= 6:
-            ranges['4-6'] += 1
-        elif level <= 9:
-            ranges['7-9'] += 1
-        elif level <= 12:
-            ranges['10-12'] += 1
-        else:
-            ranges['13+'] += 1
+    for entry in entries:
+        score = int(entry['score'])
+        level = int(entry.get('level', 1))
+        score_sum += score
+        level_sum += level
+        accuracy_sum += float(entry.get('accuracy', 0))
+        if score > highest_score:
+            highest_score = score
+        elif score < lowest_score:
+            lowest_score = score
+        score_buckets[bisect_right(SCORE_BOUNDS, score)] += 1
+        level_buckets[bisect_left(LEVEL_BOUNDS, level)] += 1
     
-    return ranges
+    return _partial_aggregate(
+        len(entries), score_sum, level_sum, accuracy_sum,
+        highest_score, lowest_score, score_buckets, level_buckets
+    )
 
-def update_user_ranking(user: Dict, leaderboard_types: List[str]):
+def aggregate_entries_numpy(np, entries: List[Dict]) -> Dict:
     """
-    특정 리더보드 타입들에 사용자 순위 업데이트
+    대규모 엔트리 부분 집계를 NumPy 벡터 연산으로 계산
     """
-    try:
-        user_id = user['userId']
-        score = user.get('totalScore', 0)
-        username = user.get('username', f'Player_{user_id[-6:]}')
-        level = user.get('level', 1)
-        accuracy = user.get('stats', {}).get('accuracy', 0.0)
-        
-        for lb_type in leaderboard_types:
-            # 기존 엔트리 삭제
-            try:
-                existing_response = leaderboard_table.query(
-                    IndexName='userId-index',
-                    KeyConditionExpression=Key('userId').eq(user_id),
-                    FilterExpression=Attr('leaderboardType').eq(lb_type)
-                )
-                
-                for item in existing_response.get('Items', []):
-                    leaderboard_table.delete_item(
-                        Key={
-                            'leaderboardType': lb_type,
-                            'score': item['score']
-                        }
-                    )
-            except Exception as e:
-                print(f"Error deleting existing ranking: {str(e)}")
-            
-            # 새 엔트리 추가
-            leaderboard_table.put_item(
-                Item={
-                    'leaderboardType': lb_type,
-                    'score': score,
-                    'userId': user_id,
-                    'username': username,
-                    'level': level,
-                    'accuracy': accuracy,
-                    'updatedAt': datetime.utcnow().isoformat() + 'Z'
-                }
-            )
-        
-    except Exception as e:
-        print(f"Error updating user ranking: {str(e)}")
-        raise
+    count = len(entries)
+    scores = np.fromiter((int(e['score']) for e in entries), dtype=np.int64, count=count)
+    levels = np.fromiter((int(e.get('level', 1)) for e in entries), dtype=np.int64, count=count)
+    accuracies = np.fromiter((float(e.get('accuracy', 0)) for e in entries), dtype=np.float64, count=count)
+    
+    # searchsorted(side)는 bisect_right/bisect_left와 같은 구간 경계를 사용
+    score_buckets = np.bincount(np.searchsorted(SCORE_BOUNDS, scores, side='right'), minlength=len(SCORE_LABELS))
+    level_buckets = np.bincount(np.searchsorted(LEVEL_BOUNDS, levels, side='left'), minlength=len(LEVEL_LABELS))
+    
+    return _partial_aggregate(
+        count, int(scores.sum()), int(levels.sum()), float(accuracies.sum()),
+        int(scores.max()), int(scores.min()), score_buckets.tolist(), level_buckets.tolist()
+    )
+
+def _partial_aggregate(count, score_sum, level_sum, accuracy_sum,
+                       highest_score, lowest_score, score_buckets, level_buckets) -> Dict:
+    partial = {
+        'entryCount': count,
+        'scoreSum': score_sum,
+        'levelSum': level_sum,
+        'accuracySum': accuracy_sum,
+        'highestScore': highest_score,
+        'lowestScore': lowest_score
+    }
+    partial.update((f'scoreBucket{i}', n) for i, n in enumerate(score_buckets))
+    partial.update((f'levelBucket{i}', n) for i, n in enumerate(level_buckets))
+    return partial
+
+def get_leaderboard(event, cors_headers) -> Dict:
     """
     리더보드 조회
     """
     try:
         query_params = event.get('queryStringParameters') or {}
         leaderboard_type = query_params.get('type', 'alltime')
-        limit = int(query_params.get('limit', 10))
+        limit = min(max(int(query_params.get('limit', 10)), 1), MAX_LEADERBOARD_LIMIT)
+        
+        cache_key = ('leaderboard', leaderboard_type, limit)
+        cached = _cache_get(cache_key)
+        if cached:
+            return cached
         
         # 리더보드 조회 (점수 내림차순)
         response = leaderboard_table.query(
+            IndexName=SCORE_INDEX,
             KeyConditionExpression=Key('leaderboardType').eq(leaderboard_type),
             ScanIndexForward=False,  # 내림차순
             Limit=limit
@@ -481,25 +703,22 @@ def update_user_ranking(user: Dict, leaderboard_types: List[str]):
         for i, ranking in enumerate(rankings, 1):
             ranking['position'] = i
         
-        return {
+        return _cache_set(cache_key, {
             'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
+            'headers': cors_headers,
+            'body': _json_dumps({
                 'leaderboard': rankings,
                 'type': leaderboard_type,
                 'count': len(rankings),
                 'lastUpdated': datetime.utcnow().isoformat() + 'Z'
-            }, ensure_ascii=False)
-        }
+            })
+        })
         
     except Exception as e:
         print(f"Error in get_leaderboard: {str(e)}")
         raise
 
-def update_leaderboard(data: Dict) -> Dict:
+def update_leaderboard(data: Dict, cors_headers) -> Dict:
     """
     리더보드 업데이트
     """
@@ -509,13 +728,8 @@ def update_leaderboard(data: Dict) -> Dict:
         if not user_id:
             return {
                 'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': 'userId가 필요합니다.'
-                }, ensure_ascii=False)
+                'headers': cors_headers,
+                'body': _ERR_USER_ID
             }
         
         # 사용자 정보 조회
@@ -524,81 +738,65 @@ def update_leaderboard(data: Dict) -> Dict:
         if 'Item' not in user_response:
             return {
                 'statusCode': 404,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': '사용자를 찾을 수 없습니다.'
-                }, ensure_ascii=False)
+                'headers': cors_headers,
+                'body': _ERR_USER_NOT_FOUND
             }
         
-        user = user_response['Item']
-        
         # 모든 리더보드 타입 업데이트
-        leaderboard_types = ['daily', 'weekly', 'monthly', 'alltime']
-        
-        for lb_type in leaderboard_types:
-            update_user_ranking(user, lb_type)
+        update_user_ranking(user_response['Item'], LEADERBOARD_TYPES)
         
         return {
             'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
+            'headers': cors_headers,
+            'body': _json_dumps({
                 'message': '리더보드가 성공적으로 업데이트되었습니다.',
                 'userId': user_id
-            }, ensure_ascii=False)
+            })
         }
         
     except Exception as e:
         print(f"Error in update_leaderboard: {str(e)}")
         raise
 
-def update_user_ranking(user: Dict, leaderboard_type: str):
+def _upsert_ranking_in_thread(leaderboard_type: str, user_id: str, attributes: Dict) -> bool:
+    """현재 스레드의 리더보드 Table로 엔트리 갱신"""
+    return upsert_ranking(thread_leaderboard_table(), leaderboard_type, user_id, attributes)
+
+def update_user_ranking(user: Dict, leaderboard_types: List[str], parallel: bool = True):
     """
-    특정 리더보드 타입에 사용자 순위 업데이트
+    특정 리더보드 타입들에 사용자 순위 업데이트
+    (이미 작업자 스레드에서 호출되는 대량 업데이트는 parallel=False로 순차 쓰기)
     """
     try:
         user_id = user['userId']
-        score = user.get('totalScore', 0)
-        
-        # 기존 항목 삭제 (점수가 변경되었을 수 있으므로)
-        try:
-            existing_response = leaderboard_table.query(
-                IndexName='userId-index',
-                KeyConditionExpression=Key('userId').eq(user_id),
-                FilterExpression=Attr('leaderboardType').eq(leaderboard_type)
-            )
-            
-            for item in existing_response.get('Items', []):
-                leaderboard_table.delete_item(
-                    Key={
-                        'leaderboardType': leaderboard_type,
-                        'score': item['score']
-                    }
-                )
-        except Exception as e:
-            print(f"Error deleting existing ranking: {str(e)}")
-        
-        # 새 항목 추가
-        leaderboard_table.put_item(
-            Item={
-                'leaderboardType': leaderboard_type,
-                'score': score,
-                'userId': user_id,
-                'username': user.get('username', f'Player_{user_id[-6:]}'),
-                'level': user.get('level', 1),
-                'rank': user.get('rank', 'Junior Solutions Architect'),
-                'accuracy': user.get('stats', {}).get('accuracy', 0.0),
-                'totalQuestions': user.get('stats', {}).get('totalQuestions', 0),
-                'achievements': user.get('achievements', []),
-                'updatedAt': datetime.utcnow().isoformat() + 'Z'
-            }
-        )
+        attributes = ranking_attributes(user)
+        
+        if not parallel:
+            for lb_type in leaderboard_types:
+                _upsert_ranking_in_thread(lb_type, user_id, attributes)
+            return
+        
+        # 타입별 쓰기를 병렬로 실행 (예외는 result()에서 다시 발생)
+        futures = [
+            _FANOUT_EXECUTOR.submit(_upsert_ranking_in_thread, lb_type, user_id, attributes)
+            for lb_type in leaderboard_types
+        ]
+        for future in futures:
+            future.result()
         
     except Exception as e:
         print(f"Error updating user ranking: {str(e)}")
         raise
+
+# GET 경로 / POST action 디스패치 테이블
+ROUTES = {
+    '/leaderboard': get_leaderboard,
+    '/user-rank': get_user_rank,
+    '/leaderboard/stats': get_leaderboard_stats
+}
+
+ACTIONS = {
+    'update_leaderboard': update_leaderboard,
+    'bulk_update': bulk_update_leaderboard,
+    'reset_leaderboard': reset_leaderboard
+}
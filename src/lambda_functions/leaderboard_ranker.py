@@ -0,0 +1,201 @@
+"""
+AWS Problem Solver Game - Leaderboard Ranker Lambda Function
+리더보드 테이블 스트림을 받아 순위(position)를 미리 계산하는 Lambda 함수
+(상위 퍼센트는 조회 시 #STATS의 entryCount로 계산)
+"""
+
+import os
+import boto3
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from typing import Dict, Optional
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+# DynamoDB 클라이언트 초기화 (웜 컨테이너에서 재사용)
+dynamodb = boto3.resource('dynamodb', config=Config(
+    retries={'mode': 'adaptive', 'total_max_attempts': 3},
+    connect_timeout=5,
+    read_timeout=10,
+    tcp_keepalive=True
+))
+leaderboard_table = dynamodb.Table(os.environ.get('LEADERBOARD_TABLE', 'aws-game-leaderboard-v2'))
+
+# 점수 순 조회용 GSI
+SCORE_INDEX = 'leaderboardType-score-index'
+
+# 타입별 집계 행과 분포 구간 (leaderboard.py와 동일)
+STATS_USER_ID = '#STATS'
+SCORE_BOUNDS = (1000, 2500, 5000, 10000)
+LEVEL_BOUNDS = (3, 6, 9, 12)
+
+_deserializer = TypeDeserializer()
+
+def lambda_handler(event, context):
+    """
+    DynamoDB Streams 레코드 처리
+    """
+    windows = {}  # leaderboardType -> (최저 점수 또는 None(하한 없음), 최고 점수)
+    stats_deltas = {}  # leaderboardType -> 집계 증감
+
+    for record in event.get('Records', []):
+        change = record.get('dynamodb', {})
+        old_image = _deserialize_image(change.get('OldImage'))
+        new_image = _deserialize_image(change.get('NewImage'))
+        leaderboard_type = (new_image or old_image).get('leaderboardType')
+        # 집계 행 자체의 변경은 무시
+        if not leaderboard_type or (new_image or old_image).get('userId') == STATS_USER_ID:
+            continue
+
+        deltas = stats_deltas.setdefault(leaderboard_type, {})
+        for name, value in _contribution(new_image).items():
+            deltas[name] = deltas.get(name, 0) + value
+        for name, value in _contribution(old_image).items():
+            deltas[name] = deltas.get(name, 0) - value
+
+        old_score = old_image.get('score')
+        new_score = new_image.get('score')
+        if record.get('eventName') in ('INSERT', 'REMOVE'):
+            # 추가/삭제된 점수 이하 항목만 순위가 한 칸씩 밀리거나 당겨짐
+            score = new_score if new_score is not None else old_score
+            if score is None:
+                continue
+            low, high = None, score
+        elif old_score is None or new_score is None or old_score == new_score:
+            # 순위 갱신으로 생긴 MODIFY 등 점수 변화가 없는 레코드는 무시
+            continue
+        else:
+            low, high = min(old_score, new_score), max(old_score, new_score)
+
+        if leaderboard_type in windows:
+            prev_low, prev_high = windows[leaderboard_type]
+            low = None if low is None or prev_low is None else min(low, prev_low)
+            high = max(high, prev_high)
+        windows[leaderboard_type] = (low, high)
+
+    for leaderboard_type, deltas in stats_deltas.items():
+        apply_stats_deltas(leaderboard_type, deltas)
+
+    updated = 0
+    for leaderboard_type, (low, high) in windows.items():
+        updated += rerank(leaderboard_type, low, high)
+
+    print(f"Reranked {updated} leaderboard entries")
+    return {'updated': updated}
+
+def rerank(leaderboard_type: str, low: Optional[Decimal] = None, high: Optional[Decimal] = None) -> int:
+    """
+    점수 구간의 순위 재계산, 변경된 항목 수 반환
+    (low가 없으면 high 이하 전체, 둘 다 없으면 파티션 전체)
+    """
+    partition = Key('leaderboardType').eq(leaderboard_type)
+    if high is None:
+        key_condition = partition
+    elif low is None:
+        key_condition = partition & Key('score').lte(high)
+    else:
+        key_condition = partition & Key('score').between(low, high)
+    # 구간 위쪽 항목의 순위는 변하지 않음
+    higher = 0 if high is None else _count(partition & Key('score').gt(high))
+
+    query_kwargs = {
+        'IndexName': SCORE_INDEX,
+        'KeyConditionExpression': key_condition,
+        'ScanIndexForward': False,
+        'ProjectionExpression': 'userId, score, #pos',
+        'ExpressionAttributeNames': {'#pos': 'position'}
+    }
+
+    updated = 0
+    index = 0
+    position = higher + 1
+    prev_score = None
+    while True:
+        response = leaderboard_table.query(**query_kwargs)
+        for item in response.get('Items', []):
+            # 동점자는 같은 순위
+            if item['score'] != prev_score:
+                position = higher + index + 1
+                prev_score = item['score']
+            index += 1
+
+            if item.get('position') == position:
+                continue
+            if _set_position(leaderboard_type, item['userId'], position):
+                updated += 1
+
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return updated
+        query_kwargs['ExclusiveStartKey'] = last_key
+
+def apply_stats_deltas(leaderboard_type: str, deltas: Dict):
+    """
+    집계 행에 합계/구간 카운터 증감을 ADD로 반영
+    """
+    deltas = {name: value for name, value in deltas.items() if value}
+    if not deltas:
+        return
+
+    names = {f'#a{i}': name for i, name in enumerate(deltas)}
+    leaderboard_table.update_item(
+        Key={'leaderboardType': leaderboard_type, 'userId': STATS_USER_ID},
+        UpdateExpression='ADD ' + ', '.join(f'{n} :v{i}' for i, n in enumerate(names)),
+        ExpressionAttributeNames=names,
+        ExpressionAttributeValues={f':v{i}': value for i, value in enumerate(deltas.values())}
+    )
+
+# 헬퍼 함수들
+def _set_position(leaderboard_type: str, user_id: str, position: int) -> bool:
+    """
+    순위 기록 (그사이 삭제된 항목은 다시 만들지 않음)
+    """
+    try:
+        leaderboard_table.update_item(
+            Key={'leaderboardType': leaderboard_type, 'userId': user_id},
+            UpdateExpression='SET #pos = :pos',
+            ConditionExpression='attribute_exists(userId)',
+            ExpressionAttributeNames={'#pos': 'position'},
+            ExpressionAttributeValues={':pos': position}
+        )
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            raise
+        return False
+
+def _contribution(image: Dict) -> Dict:
+    """
+    엔트리 하나가 집계 행에 더하는 값
+    """
+    if 'score' not in image:
+        return {}
+    score = image['score']
+    level = image.get('level', 1)
+    return {
+        'entryCount': 1,
+        'scoreSum': score,
+        'levelSum': level,
+        'accuracySum': image.get('accuracy', 0),
+        f'scoreBucket{bisect_right(SCORE_BOUNDS, score)}': 1,
+        f'levelBucket{bisect_left(LEVEL_BOUNDS, level)}': 1
+    }
+
+def _deserialize_image(image: Optional[Dict]) -> Dict:
+    return {k: _deserializer.deserialize(v) for k, v in (image or {}).items()}
+
+def _count(key_condition) -> int:
+    """
+    GSI에 대한 Select='COUNT' 쿼리 (페이지 누적)
+    """
+    kwargs = {'IndexName': SCORE_INDEX, 'KeyConditionExpression': key_condition, 'Select': 'COUNT'}
+    total = 0
+    while True:
+        response = leaderboard_table.query(**kwargs)
+        total += response.get('Count', 0)
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return total
+        kwargs['ExclusiveStartKey'] = last_key
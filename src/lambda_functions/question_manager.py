@@ -6,10 +6,21 @@ AWS Problem Solver Game - Question Manager Lambda Function
 import json
 import boto3
 import os
+import random
+import re
 import sys
+import time
+import traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Optional
 from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
 
 # 프로젝트 경로 추가
 sys.path.append('/opt/python')
@@ -24,30 +35,235 @@ except ImportError:
     question_engine = None
     difficulty_adapter = None
 
-# DynamoDB 클라이언트 초기화
-dynamodb = boto3.resource('dynamodb')
-questions_table = dynamodb.Table(os.environ.get('QUESTIONS_TABLE', 'aws-game-questions'))
+try:
+    import orjson
+except ImportError:
+    # orjson이 없는 환경에서는 표준 json 사용
+    orjson = None
+
+def _decimal_default(obj):
+    """DynamoDB Decimal 값을 int/float로 변환"""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+def _json_dumps(obj) -> str:
+    """JSON 직렬화 (orjson 사용 가능 시 우선 사용, 한글은 이스케이프하지 않음)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_decimal_default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, default=_decimal_default)
+
+# 응답 공통 헤더 (요청마다 새로 만들지 않음)
+CORS_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization'
+}
+
+# 자주 쓰는 응답 본문 (미리 직렬화)
+_PREFLIGHT_BODY = _json_dumps({'message': 'CORS preflight successful'})
+_ERR_USER_ID_PARAM = _json_dumps({'error': 'userId 파라미터가 필요합니다.'})
+_ERR_NO_MATCHING_QUESTION = _json_dumps({'error': '조건에 맞는 문제를 찾을 수 없습니다.'})
+_ERR_NPC_ID_PARAM = _json_dumps({'error': 'npcId 파라미터가 필요합니다.'})
+_ERR_SCENARIO_ID_PARAM = _json_dumps({'error': 'scenarioId 파라미터가 필요합니다.'})
+_ERR_MISSING_PARAMS = _json_dumps({'error': '필수 파라미터가 누락되었습니다.'})
+_ERR_QUESTION_NOT_FOUND = _json_dumps({'error': '문제를 찾을 수 없습니다.'})
+_ERR_CATEGORY_PARAM = _json_dumps({'error': 'category 파라미터가 필요합니다.'})
+
+# DynamoDB 클라이언트 초기화 (웜 컨테이너에서 연결 재사용)
+DYNAMODB_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'mode': 'standard', 'max_attempts': 3}
+)
+dynamodb = boto3.resource('dynamodb', config=DYNAMODB_CONFIG)
+# 단건 조회 경로는 리소스 계층 없이 저수준 클라이언트 사용
+dynamodb_client = boto3.client('dynamodb', config=DYNAMODB_CONFIG)
+_deserializer = TypeDeserializer()
+QUESTIONS_TABLE = os.environ.get('QUESTIONS_TABLE', 'aws-game-questions')
+questions_table = dynamodb.Table(QUESTIONS_TABLE)
+# NPC별 문제 ID 목록 (오프라인으로 갱신되는 {npcId, questionIds} 항목)
+npc_questions_table = dynamodb.Table(os.environ.get('NPC_QUESTIONS_TABLE', 'aws-game-npc-questions'))
 users_table = dynamodb.Table(os.environ.get('USERS_TABLE', 'aws-game-users'))
 
+# 랜덤 선택용 GSI (문제 등록 시 randomBucket = 0..RANDOM_BUCKETS-1 을 무작위로 기록)
+RANDOM_BUCKET_INDEX = 'category-randomBucket-index'
+RANDOM_BUCKETS = int(os.environ.get('RANDOM_BUCKETS', 10))
+
+def has_random_buckets(category: str) -> bool:
+    """
+    카테고리에 randomBucket이 기록된 문제가 하나라도 있는지 확인
+    """
+    response = questions_table.query(
+        IndexName=RANDOM_BUCKET_INDEX,
+        KeyConditionExpression=Key('category').eq(category),
+        Select='COUNT',
+        Limit=1
+    )
+    return response.get('Count', 0) > 0
+
+# 카테고리별 fallback 스캔 동시 실행 (웜 컨테이너에서 재사용)
+_SCAN_POOL = ThreadPoolExecutor(max_workers=8)
+
+# 문제 항목 캐시 (웜 컨테이너 재사용, TTL 구간이 바뀌면 새로 조회)
+QUESTION_CACHE_TTL = int(os.environ.get('QUESTION_CACHE_TTL', 600))
+
+def _get_question_item(question_id: str, **kwargs) -> Optional[Dict]:
+    """
+    저수준 클라이언트 GetItem 후 Python 타입으로 변환
+    """
+    item = dynamodb_client.get_item(
+        TableName=QUESTIONS_TABLE,
+        Key={'questionId': {'S': question_id}},
+        **kwargs
+    ).get('Item')
+    if not item:
+        return None
+    return {name: _deserializer.deserialize(value) for name, value in item.items()}
+
+@lru_cache(maxsize=2048)
+def _load_question(question_id: str, ttl_bucket: int) -> Optional[Dict]:
+    return _get_question_item(question_id)
+
+def load_question(question_id: str) -> Optional[Dict]:
+    """
+    questionId로 문제 조회 (최대 QUESTION_CACHE_TTL초 동안 캐시된 값 사용)
+    """
+    return _load_question(question_id, int(time.monotonic() // QUESTION_CACHE_TTL))
+
+# 필터 조합별 활성 문제 ID 목록 (웜 컨테이너 재사용, QUESTION_IDS_TTL초마다 백그라운드에서 다시 스캔)
+QUESTION_IDS_TTL = int(os.environ.get('QUESTION_IDS_TTL', 300))
+_question_ids: Optional[Dict] = None
+_question_ids_loaded_at: Optional[float] = None
+_question_ids_refresh = None
+
+def _scan_question_ids() -> Dict:
+    """
+    활성 문제의 ID를 (category, difficulty) 조합별로 수집 (None은 해당 조건 없음)
+    """
+    ids = defaultdict(list)
+    scan_kwargs = {
+        'ProjectionExpression': 'questionId, category, difficulty',
+        'FilterExpression': Attr('isActive').eq(True)
+    }
+    while True:
+        response = questions_table.scan(**scan_kwargs)
+        for item in response.get('Items', []):
+            category, difficulty = item.get('category'), item.get('difficulty')
+            for key in ((category, difficulty), (category, None), (None, difficulty), (None, None)):
+                ids[key].append(item['questionId'])
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return dict(ids)
+        scan_kwargs['ExclusiveStartKey'] = last_key
+
+def _refresh_question_ids() -> None:
+    """
+    ID 목록 다시 스캔 (실패하면 이전 목록 유지, TTL 뒤 재시도)
+    """
+    global _question_ids, _question_ids_loaded_at
+    try:
+        _question_ids = _scan_question_ids()
+    except Exception as e:
+        print(f"Error loading question ids: {str(e)}")
+    _question_ids_loaded_at = time.monotonic()
+
+def question_ids(category: Optional[str] = None, difficulty: Optional[str] = None) -> Optional[List[str]]:
+    """
+    조건에 맞는 활성 문제 ID 목록 (아직 로드되지 않았으면 None)
+    만료 시 전체 스캔은 요청 경로 밖에서 실행하고 그동안은 이전 목록 사용
+    """
+    global _question_ids_refresh
+    expired = _question_ids_loaded_at is None or time.monotonic() - _question_ids_loaded_at > QUESTION_IDS_TTL
+    if expired and (_question_ids_refresh is None or _question_ids_refresh.done()):
+        _question_ids_refresh = _SCAN_POOL.submit(_refresh_question_ids)
+    if _question_ids is None:
+        return None
+    return _question_ids.get((category or None, difficulty or None), [])
+
+# BatchGetItem 한 번에 요청할 수 있는 최대 키 수와 미처리 키 재시도 횟수
+BATCH_GET_LIMIT = 100
+BATCH_GET_MAX_RETRIES = 5
+
+def batch_get_questions(question_ids: List[str], projection: Optional[str] = None) -> List[Dict]:
+    """
+    BatchGetItem으로 문제 일괄 조회 (100개 단위, 미처리 키는 백오프 후 재시도, 요청 순서 유지)
+    """
+    found = {}
+    unique_ids = list(dict.fromkeys(question_ids))
+    
+    for start in range(0, len(unique_ids), BATCH_GET_LIMIT):
+        keys_and_options = {'Keys': [{'questionId': qid} for qid in unique_ids[start:start + BATCH_GET_LIMIT]]}
+        if projection:
+            keys_and_options['ProjectionExpression'] = projection
+            # 사용하지 않는 이름이 있으면 요청이 거부되므로 필요한 것만 전달
+            names = {name: value for name, value in PROJECTION_NAMES.items() if name in projection}
+            if names:
+                keys_and_options['ExpressionAttributeNames'] = names
+        request_items = {QUESTIONS_TABLE: keys_and_options}
+        for attempt in range(BATCH_GET_MAX_RETRIES):
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for item in response.get('Responses', {}).get(QUESTIONS_TABLE, []):
+                found[item['questionId']] = item
+            
+            request_items = response.get('UnprocessedKeys')
+            if not request_items:
+                break
+            time.sleep(0.05 * (2 ** attempt))
+        else:
+            print(f"Unprocessed question keys after {BATCH_GET_MAX_RETRIES} attempts")
+    
+    return [found[qid] for qid in unique_ids if qid in found]
+
+# 클라이언트 전송 필드 (필수 필드는 itemgetter 한 번으로 추출)
+CLIENT_FIELDS = ('questionId', 'category', 'difficulty', 'npcCharacter', 'scenario', 'question')
+CLIENT_FIELD_DEFAULTS = (('tags', []), ('estimatedTime', 60), ('points', 100))
+_get_client_fields = itemgetter(*CLIENT_FIELDS)
+
+# 읽기 시 필요한 속성만 가져오기 (해설/힌트 등 대용량 속성 제외)
+PROJECTION_NAMES = {'#sc': 'scenario', '#q': 'question', '#opts': 'options'}
+CLIENT_PROJECTION = 'questionId, category, difficulty, npcCharacter, #sc, #q, #opts, tags, estimatedTime, points'
+SUMMARY_PROJECTION = 'questionId, category, difficulty, npcCharacter, #sc.title, estimatedTime, points'
+SUMMARY_DEFAULTS = {'estimatedTime': 60, 'points': 100}
+
+@lru_cache(maxsize=2048)
+def _load_client_question(question_id: str, ttl_bucket: int) -> Optional[Dict]:
+    return _get_question_item(
+        question_id,
+        ProjectionExpression=CLIENT_PROJECTION + ', isActive',
+        ExpressionAttributeNames=PROJECTION_NAMES
+    )
+
+def load_client_question(question_id: str) -> Optional[Dict]:
+    """
+    클라이언트 필드와 isActive만 조회 (해설/정답 등은 읽지 않음, load_question과 같은 TTL)
+    """
+    return _load_client_question(question_id, int(time.monotonic() // QUESTION_CACHE_TTL))
+
+def _project_question(question: Dict) -> Dict:
+    """
+    정답 정보를 제외한 클라이언트용 필드만 추출
+    """
+    projected = dict(zip(CLIENT_FIELDS, _get_client_fields(question)))
+    projected['options'] = [{'id': option['id'], 'text': option['text']} for option in question.get('options', [])]
+    for name, default in CLIENT_FIELD_DEFAULTS:
+        projected[name] = question.get(name, default)
+    return projected
+
 def lambda_handler(event, context):
     """
     Lambda 함수 메인 핸들러
     """
     try:
-        # CORS 헤더 설정
-        cors_headers = {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-            'Access-Control-Allow-Headers': 'Content-Type, Authorization'
-        }
+        cors_headers = CORS_HEADERS
         
         # OPTIONS 요청 처리 (CORS preflight)
         if event.get('httpMethod') == 'OPTIONS':
             return {
                 'statusCode': 200,
                 'headers': cors_headers,
-                'body': json.dumps({'message': 'CORS preflight successful'})
+                'body': _PREFLIGHT_BODY
             }
         
         # HTTP 메서드와 경로 확인
@@ -57,53 +273,41 @@ def lambda_handler(event, context):
         print(f"Processing {http_method} request to {path}")
         
         if http_method == 'GET':
-            if '/question/random' in path:
-                return get_random_question(event, cors_headers)
-            elif '/question/adaptive' in path:
-                return get_adaptive_question(event, cors_headers)
-            elif '/question/' in path:
-                return get_question_by_id(event, cors_headers)
-            elif '/questions/category' in path:
-                return get_questions_by_category(event, cors_headers)
-            elif '/questions/npc' in path:
-                return get_questions_by_npc(event, cors_headers)
-            elif '/questions/scenario' in path:
-                return get_questions_by_scenario(event, cors_headers)
+            # API Gateway가 넘겨주는 리소스 경로로 핸들러 조회
+            route = (event.get('resource') or path).rstrip('/')
+            handler = ROUTES.get(route)
+            if not handler and QUESTION_ID_PATH.match(route):
+                handler = get_question_by_id
+            if handler:
+                return handler(event, cors_headers)
         
         elif http_method == 'POST':
             body = json.loads(event.get('body', '{}'))
-            action = body.get('action')
-            
-            if action == 'validate_answer':
-                return validate_answer(body, cors_headers)
-            elif action == 'get_question_stats':
-                return get_question_statistics(body, cors_headers)
+            handler = ACTIONS.get(body.get('action'))
+            if handler:
+                return handler(body, cors_headers)
         
         return {
             'statusCode': 404,
             'headers': cors_headers,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'error': '요청한 엔드포인트를 찾을 수 없습니다.',
                 'path': path,
                 'method': http_method
-            }, ensure_ascii=False)
+            })
         }
         
     except Exception as e:
         print(f"Error in question_manager: {str(e)}")
-        import traceback
         traceback.print_exc()
         
         return {
             'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
+            'headers': CORS_HEADERS,
+            'body': _json_dumps({
                 'error': '서버 내부 오류가 발생했습니다.',
                 'details': str(e)
-            }, ensure_ascii=False)
+            })
         }
 
 def get_adaptive_question(event, cors_headers) -> Dict:
@@ -120,9 +324,7 @@ def get_adaptive_question(event, cors_headers) -> Dict:
             return {
                 'statusCode': 400,
                 'headers': cors_headers,
-                'body': json.dumps({
-                    'error': 'userId 파라미터가 필요합니다.'
-                }, ensure_ascii=False)
+                'body': _ERR_USER_ID_PARAM
             }
         
         # 세션 컨텍스트 구성
@@ -143,22 +345,20 @@ def get_adaptive_question(event, cors_headers) -> Dict:
             return {
                 'statusCode': 404,
                 'headers': cors_headers,
-                'body': json.dumps({
-                    'error': '조건에 맞는 문제를 찾을 수 없습니다.'
-                }, ensure_ascii=False)
+                'body': _ERR_NO_MATCHING_QUESTION
             }
         
         return {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'question': question,
                 'adaptive_info': {
                     'user_id': user_id,
                     'selection_method': 'adaptive',
                     'context': session_context
                 }
-            }, ensure_ascii=False)
+            })
         }
         
     except Exception as e:
@@ -179,9 +379,7 @@ def get_questions_by_npc(event, cors_headers) -> Dict:
             return {
                 'statusCode': 400,
                 'headers': cors_headers,
-                'body': json.dumps({
-                    'error': 'npcId 파라미터가 필요합니다.'
-                }, ensure_ascii=False)
+                'body': _ERR_NPC_ID_PARAM
             }
         
         # NPC별 문제 선택
@@ -194,12 +392,12 @@ def get_questions_by_npc(event, cors_headers) -> Dict:
         return {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'questions': questions,
                 'npc_id': npc_id,
                 'count': len(questions),
                 'user_level': user_level
-            }, ensure_ascii=False)
+            })
         }
         
     except Exception as e:
@@ -219,9 +417,7 @@ def get_questions_by_scenario(event, cors_headers) -> Dict:
             return {
                 'statusCode': 400,
                 'headers': cors_headers,
-                'body': json.dumps({
-                    'error': 'scenarioId 파라미터가 필요합니다.'
-                }, ensure_ascii=False)
+                'body': _ERR_SCENARIO_ID_PARAM
             }
         
         # 시나리오별 문제 선택
@@ -234,12 +430,12 @@ def get_questions_by_scenario(event, cors_headers) -> Dict:
         return {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'questions': questions,
                 'scenario_id': scenario_id,
                 'phase': phase,
                 'count': len(questions)
-            }, ensure_ascii=False)
+            })
         }
         
     except Exception as e:
@@ -261,9 +457,7 @@ def validate_answer(data: Dict, cors_headers) -> Dict:
             return {
                 'statusCode': 400,
                 'headers': cors_headers,
-                'body': json.dumps({
-                    'error': '필수 파라미터가 누락되었습니다.'
-                }, ensure_ascii=False)
+                'body': _ERR_MISSING_PARAMS
             }
         
         # 답안 검증
@@ -279,13 +473,13 @@ def validate_answer(data: Dict, cors_headers) -> Dict:
             return {
                 'statusCode': 404,
                 'headers': cors_headers,
-                'body': json.dumps(result, ensure_ascii=False)
+                'body': _json_dumps(result)
             }
         
         return {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps(result, ensure_ascii=False)
+            'body': _json_dumps(result)
         }
         
     except Exception as e:
@@ -308,7 +502,7 @@ def get_question_statistics(data: Dict, cors_headers) -> Dict:
         return {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps(stats, ensure_ascii=False)
+            'body': _json_dumps(stats)
         }
         
     except Exception as e:
@@ -316,6 +510,8 @@ def get_question_statistics(data: Dict, cors_headers) -> Dict:
         raise
 
 # Fallback 함수들 (question_engine 사용 불가 시)
+QUESTION_ID_PICKS = 3  # ID 목록에서 활성 문제를 찾을 때 시도할 최대 개수
+
 def get_fallback_random_question(query_params: Dict) -> Optional[Dict]:
     """
     기본 랜덤 문제 선택 (fallback)
@@ -324,26 +520,56 @@ def get_fallback_random_question(query_params: Dict) -> Optional[Dict]:
         category = query_params.get('category')
         difficulty = query_params.get('difficulty')
         
+        # ID 목록이 로드되어 있으면 그 목록이 기준 (비어 있으면 조건에 맞는 문제 없음)
+        ids = question_ids(category, difficulty)
+        if ids is not None:
+            # 목록 갱신 전에 비활성화된 문제를 고른 경우를 대비해 몇 개까지 시도
+            for question_id in random.sample(ids, min(QUESTION_ID_PICKS, len(ids))):
+                question = load_question(question_id)
+                if question and question.get('isActive', True):
+                    return prepare_question_for_client_fallback(question)
+            return None
+        
+        # ID 목록을 아직 불러오지 못한 경우에만 GSI/스캔으로 선택
         # 필터 조건 구성
         filter_expression = Attr('isActive').eq(True)
-        
-        if category:
-            filter_expression = filter_expression & Attr('category').eq(category)
         if difficulty:
             filter_expression = filter_expression & Attr('difficulty').eq(difficulty)
         
-        # DynamoDB 스캔
-        response = questions_table.scan(
-            FilterExpression=filter_expression,
-            Limit=10
-        )
+        questions = []
+        if category:
+            # 무작위 버킷부터 GSI Query (스캔 없이 카테고리의 1/N만 읽음)
+            start = random.randrange(RANDOM_BUCKETS)
+            indexed = None
+            for offset in range(RANDOM_BUCKETS):
+                bucket = (start + offset) % RANDOM_BUCKETS
+                response = questions_table.query(
+                    IndexName=RANDOM_BUCKET_INDEX,
+                    KeyConditionExpression=Key('category').eq(category) & Key('randomBucket').eq(bucket),
+                    FilterExpression=filter_expression,
+                    ProjectionExpression=CLIENT_PROJECTION,
+                    ExpressionAttributeNames=PROJECTION_NAMES
+                )
+                questions = response.get('Items', [])
+                if questions:
+                    break
+                # 카테고리가 인덱스에 전혀 없으면(randomBucket 미기록 데이터) 나머지 버킷은 건너뛰고 스캔
+                if indexed is None and not response.get('ScannedCount'):
+                    indexed = has_random_buckets(category)
+                    if not indexed:
+                        break
+        
+        if not questions:
+            # 카테고리 미지정 또는 randomBucket이 없는 기존 데이터는 무작위 세그먼트부터 스캔
+            # (테이블 앞쪽 파티션에 선택이 치우치지 않도록)
+            if category:
+                filter_expression = filter_expression & Attr('category').eq(category)
+            questions = scan_random_segments(filter_expression)
         
-        questions = response.get('Items', [])
         if not questions:
             return None
         
         # 랜덤 선택
-        import random
         selected_question = random.choice(questions)
         return prepare_question_for_client_fallback(selected_question)
         
@@ -351,11 +577,61 @@ def get_fallback_random_question(query_params: Dict) -> Optional[Dict]:
         print(f"Error in get_fallback_random_question: {str(e)}")
         return None
 
+def scan_random_segments(filter_expression) -> List[Dict]:
+    """
+    무작위 세그먼트부터 조건에 맞는 항목이 나올 때까지 스캔
+    (Limit은 필터 전에 적용되므로 쓰지 않고, 세그먼트 끝까지 페이지를 이어 읽은 뒤 다음 세그먼트로)
+    """
+    start = random.randrange(RANDOM_BUCKETS)
+    for offset in range(RANDOM_BUCKETS):
+        scan_kwargs = {
+            'FilterExpression': filter_expression,
+            'Segment': (start + offset) % RANDOM_BUCKETS,
+            'TotalSegments': RANDOM_BUCKETS,
+            'ProjectionExpression': CLIENT_PROJECTION,
+            'ExpressionAttributeNames': PROJECTION_NAMES
+        }
+        while True:
+            response = questions_table.scan(**scan_kwargs)
+            items = response.get('Items', [])
+            if items:
+                return items
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                break
+            scan_kwargs['ExclusiveStartKey'] = last_key
+    return []
+
+def get_precomputed_npc_questions(npc_id: str, count: int) -> List[Dict]:
+    """
+    NPC 문제 ID 목록 테이블에서 무작위로 골라 조회 (목록이 없으면 빈 리스트)
+    """
+    npc_row = npc_questions_table.get_item(Key={'npcId': npc_id}).get('Item')
+    if not npc_row or not npc_row.get('questionIds'):
+        return []
+    npc_question_ids = list(npc_row['questionIds'])
+    sampled_ids = random.sample(npc_question_ids, min(count, len(npc_question_ids)))
+    return [
+        _project_question(item)
+        for item in batch_get_questions(sampled_ids, CLIENT_PROJECTION + ', isActive')
+        if item.get('isActive', True)
+    ]
+
 def get_fallback_npc_questions(npc_id: str, count: int) -> List[Dict]:
     """
     NPC 기반 기본 문제 선택 (fallback)
     """
     try:
+        # 미리 계산된 NPC 문제 ID 목록이 있으면 GetItem + BatchGetItem으로 조회
+        # (테이블이 없거나 조회에 실패하면 아래 카테고리 스캔으로 진행)
+        try:
+            questions = get_precomputed_npc_questions(npc_id, count)
+        except Exception as e:
+            print(f"Error reading precomputed NPC questions: {str(e)}")
+            questions = []
+        if questions:
+            return questions
+        
         # NPC별 기본 카테고리 매핑
         npc_categories = {
             'alex_ceo': ['EC2', 'S3'],
@@ -365,19 +641,19 @@ def get_fallback_npc_questions(npc_id: str, count: int) -> List[Dict]:
         }
         
         categories = npc_categories.get(npc_id, ['EC2'])
-        questions = []
         
-        for category in categories:
-            response = questions_table.scan(
+        # 카테고리 스캔을 동시에 실행 (지연 = 가장 느린 스캔 하나)
+        def scan_category(category):
+            return questions_table.scan(
                 FilterExpression=Attr('category').eq(category) & Attr('isActive').eq(True),
+                ProjectionExpression=CLIENT_PROJECTION,
+                ExpressionAttributeNames=PROJECTION_NAMES,
                 Limit=count
-            )
-            
-            for item in response.get('Items', []):
-                if len(questions) < count:
-                    questions.append(prepare_question_for_client_fallback(item))
+            ).get('Items', [])
+        
+        items = [item for page in _SCAN_POOL.map(scan_category, categories) for item in page]
         
-        return questions
+        return [_project_question(item) for item in items[:count]]
         
     except Exception as e:
         print(f"Error in get_fallback_npc_questions: {str(e)}")
@@ -389,13 +665,11 @@ def validate_answer_fallback(question_id: str, selected_answer: str, time_spent:
     """
     try:
         # 문제 조회
-        response = questions_table.get_item(Key={'questionId': question_id})
+        question = load_question(question_id)
         
-        if 'Item' not in response:
+        if not question:
             return {'error': '문제를 찾을 수 없습니다.'}
         
-        question = response['Item']
-        
         # 정답 확인
         correct_answer = None
         for option in question.get('options', []):
@@ -436,26 +710,7 @@ def prepare_question_for_client_fallback(question: Dict) -> Dict:
     if not question:
         return None
     
-    # 선택지에서 정답 정보 제거
-    options = []
-    for option in question.get('options', []):
-        options.append({
-            'id': option['id'],
-            'text': option['text']
-        })
-    
-    return {
-        'questionId': question['questionId'],
-        'category': question['category'],
-        'difficulty': question['difficulty'],
-        'npcCharacter': question['npcCharacter'],
-        'scenario': question['scenario'],
-        'question': question['question'],
-        'options': options,
-        'tags': question.get('tags', []),
-        'estimatedTime': question.get('estimatedTime', 60),
-        'points': question.get('points', 100)
-    }
+    return _project_question(question)
 def get_random_question(event, cors_headers) -> Dict:
     """
     랜덤 문제 조회
@@ -484,64 +739,40 @@ def get_random_question(event, cors_headers) -> Dict:
             return {
                 'statusCode': 404,
                 'headers': cors_headers,
-                'body': json.dumps({
-                    'error': '조건에 맞는 문제를 찾을 수 없습니다.'
-                }, ensure_ascii=False)
+                'body': _ERR_NO_MATCHING_QUESTION
             }
         
         return {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'question': question,
                 'selection_method': 'random',
                 'filters_applied': query_params
-            }, ensure_ascii=False)
+            })
         }
         
     except Exception as e:
         print(f"Error in get_random_question: {str(e)}")
         raise
 
-def get_question_by_id(event) -> Dict:
+def get_question_by_id(event, cors_headers) -> Dict:
     """
     특정 ID의 문제 조회
     """
     try:
-        # 경로에서 questionId 추출
-        path_parts = event['path'].split('/')
-        question_id = path_parts[-1]
-        
-        # DynamoDB에서 문제 조회
-        response = questions_table.get_item(
-            Key={'questionId': question_id}
-        )
+        # API Gateway가 파싱한 경로 파라미터 우선, 없으면 경로 마지막 부분
+        question_id = (event.get('pathParameters') or {}).get('questionId') or event['path'].rsplit('/', 1)[-1]
         
-        if 'Item' not in response:
-            return {
-                'statusCode': 404,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': '문제를 찾을 수 없습니다.'
-                }, ensure_ascii=False)
-            }
-        
-        question = response['Item']
+        # DynamoDB에서 클라이언트 필드만 조회 (캐시 우선)
+        question = load_client_question(question_id)
         
-        # 비활성화된 문제 체크
-        if not question.get('isActive', True):
+        # 없거나 비활성화된 문제
+        if not question or not question.get('isActive', True):
             return {
                 'statusCode': 404,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': '문제를 찾을 수 없습니다.'
-                }, ensure_ascii=False)
+                'headers': CORS_HEADERS,
+                'body': _ERR_QUESTION_NOT_FOUND
             }
         
         # 클라이언트용 데이터 준비
@@ -549,18 +780,15 @@ def get_question_by_id(event) -> Dict:
         
         return {
             'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps(question_data, ensure_ascii=False)
+            'headers': CORS_HEADERS,
+            'body': _json_dumps(question_data)
         }
         
     except Exception as e:
         print(f"Error in get_question_by_id: {str(e)}")
         raise
 
-def get_questions_by_category(event) -> Dict:
+def get_questions_by_category(event, cors_headers) -> Dict:
     """
     카테고리별 문제 목록 조회
     """
@@ -573,13 +801,8 @@ def get_questions_by_category(event) -> Dict:
         if not category:
             return {
                 'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': 'category 파라미터가 필요합니다.'
-                }, ensure_ascii=False)
+                'headers': CORS_HEADERS,
+                'body': _ERR_CATEGORY_PARAM
             }
         
         # GSI를 사용한 쿼리
@@ -588,6 +811,8 @@ def get_questions_by_category(event) -> Dict:
                 IndexName='category-difficulty-index',
                 KeyConditionExpression=Key('category').eq(category) & Key('difficulty').eq(difficulty),
                 FilterExpression=Attr('isActive').eq(True),
+                ProjectionExpression=SUMMARY_PROJECTION,
+                ExpressionAttributeNames={'#sc': 'scenario'},
                 Limit=limit
             )
         else:
@@ -595,38 +820,23 @@ def get_questions_by_category(event) -> Dict:
                 IndexName='category-difficulty-index',
                 KeyConditionExpression=Key('category').eq(category),
                 FilterExpression=Attr('isActive').eq(True),
+                ProjectionExpression=SUMMARY_PROJECTION,
+                ExpressionAttributeNames={'#sc': 'scenario'},
                 Limit=limit
             )
         
-        questions = response.get('Items', [])
-        
-        # 클라이언트용 데이터 준비 (목록이므로 간단한 정보만)
-        questions_summary = []
-        for question in questions:
-            questions_summary.append({
-                'questionId': question['questionId'],
-                'category': question['category'],
-                'difficulty': question['difficulty'],
-                'npcCharacter': question['npcCharacter'],
-                'scenario': {
-                    'title': question['scenario']['title']
-                },
-                'estimatedTime': question.get('estimatedTime', 60),
-                'points': question.get('points', 100)
-            })
+        # 목록용 속성만 조회했으므로 기본값만 채움
+        questions_summary = [{**SUMMARY_DEFAULTS, **question} for question in response.get('Items', [])]
         
         return {
             'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
+            'headers': CORS_HEADERS,
+            'body': _json_dumps({
                 'questions': questions_summary,
                 'count': len(questions_summary),
                 'category': category,
                 'difficulty': difficulty
-            }, ensure_ascii=False)
+            })
         }
         
     except Exception as e:
@@ -637,27 +847,7 @@ def prepare_question_for_client(question: Dict) -> Dict:
     """
     클라이언트에 전송할 문제 데이터 준비 (정답 정보 제외)
     """
-    # 선택지에서 정답 정보 제거
-    options = []
-    for option in question.get('options', []):
-        options.append({
-            'id': option['id'],
-            'text': option['text']
-            # isCorrect 필드는 제외
-        })
-    
-    return {
-        'questionId': question['questionId'],
-        'category': question['category'],
-        'difficulty': question['difficulty'],
-        'npcCharacter': question['npcCharacter'],
-        'scenario': question['scenario'],
-        'question': question['question'],
-        'options': options,
-        'tags': question.get('tags', []),
-        'estimatedTime': question.get('estimatedTime', 60),
-        'points': question.get('points', 100)
-    }
+    return _project_question(question)
 
 def get_available_categories() -> List[str]:
     """
@@ -676,3 +866,43 @@ def get_available_npcs() -> List[str]:
     사용 가능한 NPC 캐릭터 목록 반환
     """
     return ['alex_ceo', 'sarah_analyst', 'mike_security', 'jenny_developer']
+
+# GET 경로 -> 핸들러 (단수 경로는 기존 클라이언트, 복수 경로는 API Gateway 리소스)
+ROUTES = {
+    '/question/random': get_random_question,
+    '/questions/random': get_random_question,
+    '/question/adaptive': get_adaptive_question,
+    '/questions/adaptive': get_adaptive_question,
+    '/question/{questionId}': get_question_by_id,
+    '/questions/category': get_questions_by_category,
+    '/questions/npc': get_questions_by_npc,
+    '/questions/scenario': get_questions_by_scenario
+}
+
+# 템플릿 리소스가 없는 호출(/question/{id} 실제 경로)용
+QUESTION_ID_PATH = re.compile(r'^/question/[^/]+$')
+
+ACTIONS = {
+    'validate_answer': validate_answer,
+    'get_question_stats': get_question_statistics
+}
+
+def _warm_up() -> None:
+    """
+    INIT 단계에서 DynamoDB 연결 수립 및 문제 엔진 경로 예열 (첫 요청 지연 감소)
+    문제 ID 목록 스캔은 INIT 시간 제한에 걸리지 않도록 첫 요청 때 백그라운드에서 시작
+    """
+    try:
+        dynamodb_client.get_item(
+            TableName=QUESTIONS_TABLE,
+            Key={'questionId': {'S': '__warmup__'}},
+            ProjectionExpression='questionId'
+        )
+        if question_engine:
+            question_engine.get_random_question({})
+    except Exception as e:
+        print(f"Warm-up failed: {str(e)}")
+
+# 프로비저닝된 동시성 등 INIT 비용을 감수할 환경에서만 WARMUP=1로 사용
+if os.environ.get('WARMUP', '0') == '1':
+    _warm_up()
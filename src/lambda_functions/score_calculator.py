@@ -9,7 +9,7 @@ import os
 import sys
 from datetime import datetime
 from typing import Dict, List, Optional
-from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.conditions import Key
 
 # 프로젝트 경로 추가
 sys.path.append('/opt/python')
@@ -21,12 +21,14 @@ try:
 except ImportError:
     difficulty_adapter = None
 
+from utils.leaderboard_store import LEADERBOARD_TYPES, ranking_attributes, upsert_ranking
+
 # DynamoDB 클라이언트 초기화
 dynamodb = boto3.resource('dynamodb')
 users_table = dynamodb.Table(os.environ.get('USERS_TABLE', 'aws-game-users'))
 sessions_table = dynamodb.Table(os.environ.get('SESSIONS_TABLE', 'aws-game-sessions'))
 questions_table = dynamodb.Table(os.environ.get('QUESTIONS_TABLE', 'aws-game-questions'))
-leaderboard_table = dynamodb.Table(os.environ.get('LEADERBOARD_TABLE', 'aws-game-leaderboard'))
+leaderboard_table = dynamodb.Table(os.environ.get('LEADERBOARD_TABLE', 'aws-game-leaderboard-v2'))
 
 def lambda_handler(event, context):
     """
@@ -364,45 +366,10 @@ def update_leaderboard_entry(user_id: str, user_data: Dict):
     리더보드 엔트리 업데이트
     """
     try:
-        score = user_data.get('totalScore', 0)
-        username = user_data.get('username', f'Player_{user_id[-6:]}')
-        level = user_data.get('level', 1)
-        accuracy = user_data.get('stats', {}).get('accuracy', 0)
-        
-        # 기존 엔트리 삭제 후 새로 추가
-        leaderboard_types = ['daily', 'weekly', 'monthly', 'alltime']
-        
-        for lb_type in leaderboard_types:
-            # 기존 엔트리 찾기 및 삭제
-            try:
-                existing_response = leaderboard_table.query(
-                    IndexName='userId-index',
-                    KeyConditionExpression=Key('userId').eq(user_id),
-                    FilterExpression=Attr('leaderboardType').eq(lb_type)
-                )
-                
-                for item in existing_response.get('Items', []):
-                    leaderboard_table.delete_item(
-                        Key={
-                            'leaderboardType': lb_type,
-                            'score': item['score']
-                        }
-                    )
-            except Exception as e:
-                print(f"Error deleting existing leaderboard entry: {str(e)}")
-            
-            # 새 엔트리 추가
-            leaderboard_table.put_item(
-                Item={
-                    'leaderboardType': lb_type,
-                    'score': score,
-                    'userId': user_id,
-                    'username': username,
-                    'level': level,
-                    'accuracy': accuracy,
-                    'updatedAt': datetime.utcnow().isoformat() + 'Z'
-                }
-            )
+        # leaderboard 함수와 같은 속성/조건으로 (leaderboardType, userId) 엔트리 갱신
+        attributes = ranking_attributes({**user_data, 'userId': user_id})
+        for lb_type in LEADERBOARD_TYPES:
+            upsert_ranking(leaderboard_table, lb_type, user_id, attributes)
         
     except Exception as e:
         print(f"Error updating leaderboard: {str(e)}")
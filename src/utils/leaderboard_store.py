@@ -0,0 +1,55 @@
+"""
+AWS Problem Solver Game - Leaderboard Store
+리더보드 엔트리 쓰기 공통 로직 (leaderboard, score_calculator 함수에서 공유)
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict
+from botocore.exceptions import ClientError
+
+# 리더보드 타입
+LEADERBOARD_TYPES = ('daily', 'weekly', 'monthly', 'alltime')
+
+def ranking_attributes(user: Dict) -> Dict:
+    """
+    사용자 항목에서 리더보드 엔트리 속성 생성
+    """
+    user_id = user['userId']
+    stats = user.get('stats', {})
+    return {
+        'score': user.get('totalScore', 0),
+        'username': user.get('username', f'Player_{user_id[-6:]}'),
+        'level': user.get('level', 1),
+        'rank': user.get('rank', 'Junior Solutions Architect'),
+        'accuracy': stats.get('accuracy', Decimal('0')),  # boto3 resource는 float를 허용하지 않음
+        'totalQuestions': stats.get('totalQuestions', 0),
+        'achievements': user.get('achievements', []),
+        'updatedAt': datetime.utcnow().isoformat() + 'Z'
+    }
+
+def upsert_ranking(table, leaderboard_type: str, user_id: str, attributes: Dict) -> bool:
+    """
+    (leaderboardType, userId) 키의 리더보드 엔트리를 UpdateItem으로 갱신, 실제로 썼으면 True
+    """
+    names = {f'#a{i}': name for i, name in enumerate(attributes)}
+    values = {f':v{i}': value for i, value in enumerate(attributes.values())}
+
+    # updatedAt 외의 값이 모두 같으면 쓰지 않음 (스트림 재계산도 발생하지 않음)
+    changed = [
+        f'attribute_not_exists({n}) OR {n} <> :v{i}' for i, n in enumerate(names)
+        if names[n] != 'updatedAt'
+    ]
+    try:
+        table.update_item(
+            Key={'leaderboardType': leaderboard_type, 'userId': user_id},
+            UpdateExpression='SET ' + ', '.join(f'{n} = :v{i}' for i, n in enumerate(names)),
+            ConditionExpression=' OR '.join(['attribute_not_exists(userId)'] + changed),
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values
+        )
+        return True
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+            raise
+        return False
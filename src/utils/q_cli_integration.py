@@ -5,17 +5,79 @@ Amazon Q CLI와의 연동을 담당하는 유틸리티 모듈
 
 import subprocess
 import json
-import os
+import time
 import asyncio
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Optional, Union
 from datetime import datetime
 
+# Q CLI 설치 여부 캐시 (같은 프로세스에서는 거의 바뀌지 않으므로 1시간 재사용)
+CLI_CHECK_TTL = 3600
+_Q_CLI_CACHED: Optional[bool] = None
+_Q_CLI_CACHED_AT = 0.0
+
+# Q CLI 호출 타임아웃 및 타임아웃 발생 후 호출 중단 시간 (초)
+DEFAULT_TIMEOUT = 8
+CLI_FAILURE_BACKOFF = 60
+_cli_backoff_until = 0.0
+
+# 설명 수준별 프롬프트 문구
+_LEVEL_PROMPTS = MappingProxyType({
+    'basic': '초보자도 이해할 수 있도록 간단하게',
+    'intermediate': '실무에서 활용할 수 있는 수준으로',
+    'advanced': '깊이 있는 기술적 세부사항을 포함하여'
+})
+
+# 힌트 레벨별 프롬프트 템플릿 (선택된 레벨만 포맷)
+_HINT_PROMPT_TEMPLATES = MappingProxyType({
+    1: """다음 AWS {category} 관련 문제에 대해 해결 방향을 제시하는 힌트를 주세요:
+
+시나리오: {description}
+문제: {question}
+
+힌트는 직접적인 답을 주지 말고, 고려해야 할 AWS 서비스나 개념을 제안하는 형태로 작성해주세요.""",
+    2: """AWS {category} 관련 {difficulty} 난이도 문제에 대해 좀 더 구체적인 힌트를 주세요:
+
+컨텍스트: {context}
+
+어떤 AWS 서비스들을 조합해서 사용해야 하는지 방향을 제시해주세요.""",
+    3: """다음 AWS 문제의 해결책에 대해 거의 정답에 가까운 힌트를 주세요:
+
+시나리오: {description}
+문제: {question}
+
+구체적인 AWS 서비스 이름과 설정 방법을 포함해서 설명해주세요."""
+})
+
+
+class QCLIError(Exception):
+    """Q CLI 실행 실패 (실패 결과가 응답 캐시에 남지 않도록 예외로 전달)"""
+
+
+@lru_cache(maxsize=512)
+def _cached_q(full_question: str, timeout: int) -> str:
+    """
+    Q CLI 실행 결과 캐시 (같은 질문은 프로세스 내에서 재사용, 성공한 응답만 저장)
+    """
+    result = subprocess.run(
+        ['q', 'chat'],
+        input=full_question,
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+    
+    if result.returncode != 0:
+        raise QCLIError(result.stderr)
+    return result.stdout
+
 class AmazonQCLIIntegration:
     """
     Amazon Q CLI 연동 클래스
     """
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = DEFAULT_TIMEOUT):
         """
         초기화
         
@@ -27,8 +89,13 @@ class AmazonQCLIIntegration:
     
     def _check_cli_availability(self) -> bool:
         """
-        Amazon Q CLI 사용 가능 여부 확인
+        Amazon Q CLI 사용 가능 여부 확인 (결과는 CLI_CHECK_TTL 동안 캐시)
         """
+        global _Q_CLI_CACHED, _Q_CLI_CACHED_AT
+        
+        if _Q_CLI_CACHED is not None and time.monotonic() - _Q_CLI_CACHED_AT < CLI_CHECK_TTL:
+            return _Q_CLI_CACHED
+        
         try:
             result = subprocess.run(
                 ['q', '--version'],
@@ -36,9 +103,13 @@ class AmazonQCLIIntegration:
                 text=True,
                 timeout=5
             )
-            return result.returncode == 0
+            available = result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-            return False
+            available = False
+        
+        _Q_CLI_CACHED = available
+        _Q_CLI_CACHED_AT = time.monotonic()
+        return available
     
     def ask_question(self, question: str, context: str = '') -> Optional[str]:
         """
@@ -51,31 +122,25 @@ class AmazonQCLIIntegration:
         Returns:
             Q CLI 응답 또는 None (실패 시)
         """
-        if not self.cli_available:
+        global _cli_backoff_until
+        
+        # 설치되지 않았거나 최근 타임아웃이 발생한 경우 즉시 반환
+        if not self.cli_available or time.monotonic() < _cli_backoff_until:
             return None
         
         try:
             # 컨텍스트가 있으면 질문에 포함
             full_question = self._format_question(question, context)
             
-            # Q CLI 명령어 실행 (stdin으로 질문 전달)
-            result = subprocess.run(
-                ['q', 'chat'],
-                input=full_question,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                env=dict(os.environ)
-            )
-            
-            if result.returncode == 0:
-                return self._clean_response(result.stdout)
-            else:
-                print(f"Q CLI error: {result.stderr}")
-                return None
+            # Q CLI 명령어 실행 (stdin으로 질문 전달, 같은 질문은 캐시 재사용)
+            return self._clean_response(_cached_q(full_question, self.timeout))
                 
+        except QCLIError as e:
+            print(f"Q CLI error: {str(e)}")
+            return None
         except subprocess.TimeoutExpired:
             print("Q CLI timeout")
+            _cli_backoff_until = time.monotonic() + CLI_FAILURE_BACKOFF
             return None
         except Exception as e:
             print(f"Error calling Q CLI: {str(e)}")
@@ -93,14 +158,8 @@ class AmazonQCLIIntegration:
         Returns:
             설명 내용 또는 None
         """
-        level_prompts = {
-            'basic': '초보자도 이해할 수 있도록 간단하게',
-            'intermediate': '실무에서 활용할 수 있는 수준으로',
-            'advanced': '깊이 있는 기술적 세부사항을 포함하여'
-        }
-        
         question = f"""
-        AWS {service}의 {concept}에 대해 {level_prompts.get(level, '간단하게')} 설명해주세요.
+        AWS {service}의 {concept}에 대해 {_LEVEL_PROMPTS.get(level, '간단하게')} 설명해주세요.
         
         다음 내용을 포함해주세요:
         1. 기본 개념과 목적
@@ -129,33 +188,14 @@ class AmazonQCLIIntegration:
         scenario = question_data.get('scenario', {})
         question_text = question_data.get('question', '')
         
-        hint_prompts = {
-            1: f"""
-            다음 AWS {category} 관련 문제에 대해 해결 방향을 제시하는 힌트를 주세요:
-            
-            시나리오: {scenario.get('description', '')}
-            문제: {question_text}
-            
-            힌트는 직접적인 답을 주지 말고, 고려해야 할 AWS 서비스나 개념을 제안하는 형태로 작성해주세요.
-            """,
-            2: f"""
-            AWS {category} 관련 {difficulty} 난이도 문제에 대해 좀 더 구체적인 힌트를 주세요:
-            
-            컨텍스트: {scenario.get('context', '')}
-            
-            어떤 AWS 서비스들을 조합해서 사용해야 하는지 방향을 제시해주세요.
-            """,
-            3: f"""
-            다음 AWS 문제의 해결책에 대해 거의 정답에 가까운 힌트를 주세요:
-            
-            시나리오: {scenario.get('description', '')}
-            문제: {question_text}
-            
-            구체적인 AWS 서비스 이름과 설정 방법을 포함해서 설명해주세요.
-            """
-        }
-        
-        prompt = hint_prompts.get(hint_level, hint_prompts[1])
+        template = _HINT_PROMPT_TEMPLATES.get(hint_level, _HINT_PROMPT_TEMPLATES[1])
+        prompt = template.format(
+            category=category,
+            difficulty=difficulty,
+            description=scenario.get('description', ''),
+            context=scenario.get('context', ''),
+            question=question_text
+        )
         return self.ask_question(prompt)
     
     def get_best_practices(self, service: str, scenario: str) -> Optional[str]:
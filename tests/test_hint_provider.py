@@ -8,11 +8,16 @@ import sys
 import os
 from unittest.mock import Mock, patch, MagicMock
 import subprocess
+import io
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # 테스트를 위해 Lambda 함수 경로 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda_functions'))
 
-from hint_provider import AmazonQHintProvider, lambda_handler
+import hint_provider
+from hint_provider import AmazonQHintProvider, LLMCache, lambda_handler
 
 
 class TestAmazonQHintProvider(unittest.TestCase):
@@ -20,6 +25,13 @@ class TestAmazonQHintProvider(unittest.TestCase):
     
     def setUp(self):
         """테스트 설정"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        probe_cache_patcher = patch('hint_provider.Q_CLI_PROBE_CACHE_PATH',
+                                    os.path.join(self.tmp_dir.name, '.q_cli_available'))
+        probe_cache_patcher.start()
+        self.addCleanup(probe_cache_patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        
         self.hint_provider = AmazonQHintProvider()
         
         # 테스트용 문제 데이터
@@ -35,6 +47,13 @@ class TestAmazonQHintProvider(unittest.TestCase):
             'question': '이 상황에서 가장 적절한 AWS 솔루션은 무엇입니까?'
         }
     
+    def tearDown(self):
+        """Q CLI 확인 캐시 및 응답 캐시 초기화"""
+        AmazonQHintProvider._q_cli_available_cache = None
+        AmazonQHintProvider._qcli_failures = 0
+        AmazonQHintProvider._qcli_circuit_open_until = 0.0
+        hint_provider._LLM_CACHE.clear()
+    
     def test_init(self):
         """초기화 테스트"""
         self.assertIsInstance(self.hint_provider, AmazonQHintProvider)
@@ -43,9 +62,12 @@ class TestAmazonQHintProvider(unittest.TestCase):
         self.assertIn('mike_security', self.hint_provider.npc_hint_styles)
         self.assertIn('jenny_developer', self.hint_provider.npc_hint_styles)
     
+    @patch.dict(os.environ, {'ENABLE_Q_CLI': 'true'})
+    @patch('hint_provider.shutil.which', return_value='/usr/local/bin/q')
     @patch('hint_provider.subprocess.run')
-    def test_check_q_cli_availability_success(self, mock_subprocess):
+    def test_check_q_cli_availability_success(self, mock_subprocess, mock_which):
         """Amazon Q CLI 사용 가능 테스트"""
+        AmazonQHintProvider._q_cli_available_cache = None
         mock_result = Mock()
         mock_result.returncode = 0
         mock_subprocess.return_value = mock_result
@@ -53,13 +75,65 @@ class TestAmazonQHintProvider(unittest.TestCase):
         provider = AmazonQHintProvider()
         self.assertTrue(provider.q_cli_available)
     
+    @patch.dict(os.environ, {'ENABLE_Q_CLI': 'true'})
+    @patch('hint_provider.shutil.which', return_value='/usr/local/bin/q')
     @patch('hint_provider.subprocess.run')
-    def test_check_q_cli_availability_failure(self, mock_subprocess):
+    def test_check_q_cli_availability_failure(self, mock_subprocess, mock_which):
         """Amazon Q CLI 사용 불가 테스트"""
+        AmazonQHintProvider._q_cli_available_cache = None
+        mock_subprocess.side_effect = FileNotFoundError()
+        
+        provider = AmazonQHintProvider()
+        self.assertFalse(provider.q_cli_available)
+    
+    @patch.dict(os.environ, {'ENABLE_Q_CLI': 'true'})
+    @patch('hint_provider.shutil.which', return_value='/usr/local/bin/q')
+    @patch('hint_provider.subprocess.run')
+    def test_check_q_cli_availability_cached(self, mock_subprocess, mock_which):
+        """Q CLI 확인 결과 캐시 테스트"""
+        AmazonQHintProvider._q_cli_available_cache = None
         mock_subprocess.side_effect = FileNotFoundError()
         
+        AmazonQHintProvider()
+        AmazonQHintProvider()
+        self.assertEqual(mock_subprocess.call_count, 1)
+    
+    @patch.dict(os.environ, {'ENABLE_Q_CLI': 'true'})
+    @patch('hint_provider.shutil.which', return_value='/usr/local/bin/q')
+    @patch('hint_provider.subprocess.run')
+    def test_check_q_cli_availability_disk_cached(self, mock_subprocess, mock_which):
+        """콜드 스타트 후 디스크 캐시 재사용 테스트"""
+        AmazonQHintProvider._q_cli_available_cache = None
+        mock_subprocess.side_effect = FileNotFoundError()
+        AmazonQHintProvider()
+        
+        # 새 컨테이너 프로세스처럼 클래스 캐시만 초기화
+        AmazonQHintProvider._q_cli_available_cache = None
+        provider = AmazonQHintProvider()
+        
+        self.assertFalse(provider.q_cli_available)
+        self.assertEqual(mock_subprocess.call_count, 1)
+    
+    @patch.dict(os.environ, {'ENABLE_Q_CLI': 'true'})
+    @patch('hint_provider.shutil.which', return_value=None)
+    @patch('hint_provider.subprocess.run')
+    def test_check_q_cli_availability_not_on_path(self, mock_subprocess, mock_which):
+        """PATH에 q가 없으면 subprocess 확인 생략 테스트"""
+        AmazonQHintProvider._q_cli_available_cache = None
+        
+        provider = AmazonQHintProvider()
+        self.assertFalse(provider.q_cli_available)
+        mock_subprocess.assert_not_called()
+    
+    @patch.dict(os.environ, {'ENABLE_Q_CLI': 'false'})
+    @patch('hint_provider.subprocess.run')
+    def test_check_q_cli_availability_disabled(self, mock_subprocess):
+        """ENABLE_Q_CLI 비활성화 시 Q CLI 확인 생략 테스트"""
+        AmazonQHintProvider._q_cli_available_cache = None
+        
         provider = AmazonQHintProvider()
         self.assertFalse(provider.q_cli_available)
+        mock_subprocess.assert_not_called()
     
     def test_build_question_context(self):
         """문제 컨텍스트 구축 테스트"""
@@ -106,17 +180,17 @@ class TestAmazonQHintProvider(unittest.TestCase):
             self.assertEqual(hint_result['npc_id'], npc_id)
             self.assertIsInstance(hint_result['hint'], str)
     
-    def test_apply_npc_style(self):
+    def test_styled_hint(self):
         """NPC 스타일 적용 테스트"""
         base_hint = "Auto Scaling Group을 고려해보세요."
-        npc_style = self.hint_provider.npc_hint_styles['alex_ceo']
         
-        styled_hint = self.hint_provider._apply_npc_style(
-            base_hint, 'alex_ceo', npc_style
-        )
+        styled_hint = hint_provider._styled_hint(base_hint, 'alex_ceo', 1)
         
         self.assertNotEqual(styled_hint, base_hint)
         self.assertIn(base_hint, styled_hint)
+        
+        # 같은 입력은 항상 같은 결과 (응답 캐시 적중 가능)
+        self.assertEqual(styled_hint, hint_provider._styled_hint(base_hint, 'alex_ceo', 1))
     
     def test_get_fallback_explanation_ec2(self):
         """EC2 대체 설명 테스트"""
@@ -177,6 +251,281 @@ class TestAmazonQHintProvider(unittest.TestCase):
         # 실패 시 대체 힌트로 전환되어야 함
         self.assertEqual(hint_result['source'], 'fallback')
     
+    @patch('hint_provider.time.sleep')
+    @patch('hint_provider.subprocess.run')
+    def test_generate_q_cli_hint_timeout_not_retried(self, mock_subprocess, mock_sleep):
+        """Q CLI 타임아웃은 재시도 없이 대체 힌트 (최대 대기 시간은 REQUEST_TIMEOUT_S)"""
+        mock_subprocess.side_effect = subprocess.TimeoutExpired('q', 8)
+        
+        hint_result = self.hint_provider._generate_q_cli_hint(
+            self.test_question_data, 'alex_ceo', 1
+        )
+        
+        self.assertEqual(hint_result['source'], 'fallback')
+        self.assertEqual(mock_subprocess.call_count, 1)
+        self.assertLessEqual(mock_subprocess.call_args.kwargs['timeout'], 8)
+        mock_sleep.assert_not_called()
+    
+    @patch('hint_provider.subprocess.run')
+    def test_q_cli_timeout_opens_circuit(self, mock_subprocess):
+        """타임아웃 직후 요청은 Q CLI를 호출하지 않고 대체 힌트"""
+        mock_subprocess.side_effect = subprocess.TimeoutExpired('q', 8)
+        
+        for _ in range(3):
+            hint_result = self.hint_provider._generate_q_cli_hint(
+                self.test_question_data, 'alex_ceo', 1
+            )
+            self.assertEqual(hint_result['source'], 'fallback')
+        
+        self.assertEqual(mock_subprocess.call_count, 1)
+    
+    @patch('hint_provider.subprocess.run')
+    def test_q_cli_missing_counts_as_failure(self, mock_subprocess):
+        """q 실행 파일이 없으면(OSError) 대체 힌트, 연속 실패 시 서킷 오픈"""
+        mock_subprocess.side_effect = FileNotFoundError('q')
+        
+        for _ in range(hint_provider.Q_CLI_CIRCUIT_FAILURE_THRESHOLD + 2):
+            hint_result = self.hint_provider._generate_q_cli_hint(
+                self.test_question_data, 'alex_ceo', 1
+            )
+            self.assertEqual(hint_result['source'], 'fallback')
+        
+        self.assertEqual(mock_subprocess.call_count, hint_provider.Q_CLI_CIRCUIT_FAILURE_THRESHOLD)
+    
+    @patch('hint_provider.subprocess.run')
+    def test_q_cli_circuit_breaker(self, mock_subprocess):
+        """Q CLI 연속 실패 시 서킷 오픈 후 호출 생략 테스트"""
+        self.hint_provider.q_cli_available = True
+        mock_result = Mock()
+        mock_result.returncode = 1
+        mock_result.stderr = 'error'
+        mock_subprocess.return_value = mock_result
+        
+        for _ in range(hint_provider.Q_CLI_CIRCUIT_FAILURE_THRESHOLD + 2):
+            hint_result = self.hint_provider._generate_q_cli_hint(
+                self.test_question_data, 'alex_ceo', 1
+            )
+            self.assertEqual(hint_result['source'], 'fallback')
+        
+        self.assertEqual(mock_subprocess.call_count, hint_provider.Q_CLI_CIRCUIT_FAILURE_THRESHOLD)
+    
+    @patch('hint_provider.LLM_BACKEND', 'bedrock')
+    @patch('hint_provider._get_bedrock_client')
+    def test_generate_bedrock_hint_success(self, mock_client):
+        """Bedrock 백엔드 힌트 생성 테스트"""
+        mock_client.return_value.invoke_model.return_value = {
+            'body': io.BytesIO(json.dumps({
+                'content': [{'type': 'text', 'text': 'Auto Scaling Group을 고려해보세요.'}]
+            }).encode('utf-8'))
+        }
+        
+        hint_result = self.hint_provider._generate_q_cli_hint(
+            self.test_question_data, 'alex_ceo', 1
+        )
+        
+        self.assertEqual(hint_result['source'], 'bedrock')
+        self.assertIn('Auto Scaling', hint_result['hint'])
+        mock_client.return_value.invoke_model.assert_called_once()
+        
+        # 고정 프롬프트 영역은 system 블록으로 전달 (기본 모델은 프롬프트 캐시 미지원)
+        body = json.loads(mock_client.return_value.invoke_model.call_args.kwargs['body'])
+        self.assertNotIn('cache_control', body['system'][0])
+        self.assertTrue(body['messages'][0]['content'].endswith('힌트:'))
+    
+    def test_bedrock_prompt_cache_gating(self):
+        """지원 모델 + 최소 길이 이상일 때만 cache_control 추가"""
+        long_system = 'x' * hint_provider.PROMPT_CACHE_MIN_CHARS
+        
+        with patch('hint_provider.BEDROCK_MODEL_ID', 'anthropic.claude-3-7-sonnet-20250219-v1:0'):
+            body = json.loads(hint_provider._build_bedrock_body('p', 10, long_system))
+            self.assertEqual(body['system'][0]['cache_control'], {'type': 'ephemeral'})
+            
+            body = json.loads(hint_provider._build_bedrock_body('p', 10, 'short'))
+            self.assertNotIn('cache_control', body['system'][0])
+        
+        with patch('hint_provider.BEDROCK_MODEL_ID', 'anthropic.claude-3-haiku-20240307-v1:0'):
+            body = json.loads(hint_provider._build_bedrock_body('p', 10, long_system))
+            self.assertNotIn('cache_control', body['system'][0])
+    
+    @patch('hint_provider.subprocess.run')
+    def test_generate_hint_uses_cache(self, mock_subprocess):
+        """동일한 힌트 요청 캐시 재사용 테스트"""
+        self.hint_provider.q_cli_available = True
+        
+        mock_result = Mock()
+        mock_result.returncode = 0
+        mock_result.stdout = json.dumps({
+            'response': 'Auto Scaling Group과 Load Balancer를 고려해보세요.'
+        })
+        mock_subprocess.return_value = mock_result
+        
+        first = self.hint_provider.generate_hint(self.test_question_data, 'alex_ceo', 1)
+        second = self.hint_provider.generate_hint(self.test_question_data, 'alex_ceo', 1)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_subprocess.call_count, 1)
+    
+    @patch('hint_provider._SHARED_CACHE', hint_provider.SharedHintCache('HintCache'))
+    @patch('hint_provider._get_dynamodb_client')
+    @patch('hint_provider.subprocess.run')
+    def test_generate_hint_uses_shared_cache(self, mock_subprocess, mock_ddb):
+        """DynamoDB 공유 캐시 적중 시 LLM 호출 생략 테스트"""
+        self.hint_provider.q_cli_available = True
+        cached_hint = {'hint': '공유 캐시 힌트', 'source': 'amazon_q'}
+        mock_ddb.return_value.get_item.return_value = {
+            'Item': {'hint_json': {'S': json.dumps(cached_hint)}}
+        }
+        
+        hint_result = self.hint_provider.generate_hint(self.test_question_data, 'alex_ceo', 1)
+        
+        self.assertEqual(hint_result, cached_hint)
+        mock_subprocess.assert_not_called()
+    
+    @patch('hint_provider._SHARED_CACHE', hint_provider.SharedHintCache('HintCache'))
+    @patch('hint_provider._get_dynamodb_client')
+    @patch('hint_provider.subprocess.run')
+    def test_generate_hints_batch_prefetches_shared_cache(self, mock_subprocess, mock_ddb):
+        """배치 요청 시 BatchGetItem 한 번으로 공유 캐시 조회 테스트"""
+        self.hint_provider.q_cli_available = True
+        requests = [
+            {'questionData': self.test_question_data, 'npcId': npc_id, 'hintLevel': 1}
+            for npc_id in ('alex_ceo', 'sarah_analyst')
+        ]
+        keys = [
+            self.hint_provider._hint_cache_key(
+                self.hint_provider._build_question_context(self.test_question_data), npc_id, 1
+            )
+            for npc_id in ('alex_ceo', 'sarah_analyst')
+        ]
+        mock_ddb.return_value.batch_get_item.return_value = {
+            'Responses': {'HintCache': [
+                {'cache_key': {'S': key}, 'hint_json': {'S': json.dumps({'hint': key})}}
+                for key in keys
+            ]}
+        }
+        
+        results = self.hint_provider.generate_hints_batch(requests)
+        
+        self.assertEqual([r['hint'] for r in results], keys)
+        mock_ddb.return_value.batch_get_item.assert_called_once()
+        mock_ddb.return_value.get_item.assert_not_called()
+        mock_subprocess.assert_not_called()
+    
+    @patch('hint_provider._SHARED_CACHE', hint_provider.SharedHintCache('HintCache'))
+    @patch('hint_provider._get_dynamodb_client')
+    @patch('hint_provider.subprocess.run')
+    def test_get_aws_explanation_uses_shared_cache(self, mock_subprocess, mock_ddb):
+        """설명 요청 시 DynamoDB 공유 캐시 재사용 테스트"""
+        self.hint_provider.q_cli_available = True
+        cached_explanation = {'explanation': '공유 캐시 설명', 'service': 'EC2', 'source': 'amazon_q'}
+        mock_ddb.return_value.get_item.return_value = {
+            'Item': {'hint_json': {'S': json.dumps(cached_explanation)}}
+        }
+        
+        result = self.hint_provider.get_aws_explanation('EC2', '')
+        
+        self.assertEqual(result, cached_explanation)
+        mock_subprocess.assert_not_called()
+    
+    @patch('hint_provider._get_dynamodb_client')
+    def test_shared_cache_set_writes_synchronously(self, mock_ddb):
+        """공유 캐시 기록이 반환 전에 TTL과 함께 저장되는지 테스트"""
+        cache = hint_provider.SharedHintCache('HintCache', ttl=60)
+        
+        cache.set('key', {'hint': '힌트'})
+        
+        mock_ddb.return_value.put_item.assert_called_once()
+        item = mock_ddb.return_value.put_item.call_args.kwargs['Item']
+        self.assertEqual(item['cache_key'], {'S': 'key'})
+        self.assertEqual(json.loads(item['hint_json']['S']), {'hint': '힌트'})
+        self.assertIn('N', item['ttl'])
+    
+    @patch('hint_provider._DDB', None)
+    @patch('hint_provider._SESSION')
+    def test_client_created_once_across_threads(self, mock_session):
+        """여러 작업자 스레드가 동시에 처음 호출해도 클라이언트는 한 번만 생성"""
+        def slow_client(*args, **kwargs):
+            time.sleep(0.01)
+            return Mock()
+        mock_session.client.side_effect = slow_client
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: hint_provider._get_dynamodb_client(), range(8)))
+        
+        self.assertEqual(mock_session.client.call_count, 1)
+        self.assertTrue(all(client is clients[0] for client in clients))
+    
+    def test_llm_cache_expiry_and_eviction(self):
+        """응답 캐시 만료 및 크기 제한 테스트"""
+        cache = LLMCache(maxsize=2, ttl=60)
+        cache.set('a', {'hint': 'a'})
+        cache.set('b', {'hint': 'b'})
+        cache.set('c', {'hint': 'c'})
+        
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('c'), {'hint': 'c'})
+        
+        expired = LLMCache(maxsize=2, ttl=-1)
+        expired.set('a', {'hint': 'a'})
+        self.assertIsNone(expired.get('a'))
+    
+    @unittest.skipIf(hint_provider._numpy() is None, 'numpy not installed')
+    def test_semantic_cache_lookup(self):
+        """시맨틱 캐시 유사도 조회 테스트"""
+        cache = hint_provider.SemanticHintCache(maxsize=2, threshold=0.9)
+        cache.add([1.0, 0.0, 0.0], 'alex_ceo', 1, {'hint': 'cached'})
+        
+        self.assertEqual(cache.lookup([0.99, 0.05, 0.0], 'alex_ceo', 1), {'hint': 'cached'})
+        self.assertIsNone(cache.lookup([0.0, 1.0, 0.0], 'alex_ceo', 1))
+        self.assertIsNone(cache.lookup([1.0, 0.0, 0.0], 'sarah_analyst', 1))
+        
+        cache.add([0.0, 1.0, 0.0], 'alex_ceo', 1, {'hint': 'second'})
+        cache.add([0.0, 0.0, 1.0], 'alex_ceo', 1, {'hint': 'third'})
+        self.assertIsNone(cache.lookup([1.0, 0.0, 0.0], 'alex_ceo', 1))
+    
+    @patch('hint_provider._SHARED_CACHE', hint_provider.SharedHintCache('HintCache'))
+    @patch('hint_provider._get_dynamodb_client')
+    @patch('hint_provider._SEMANTIC_CACHE')
+    @patch('hint_provider.subprocess.run')
+    def test_semantic_cache_hit_rebuilds_question_fields(self, mock_subprocess, mock_semantic, mock_ddb):
+        """시맨틱 캐시 적중 시 힌트 문구만 재사용하고 컨텍스트는 현재 문제 기준"""
+        self.hint_provider.q_cli_available = True
+        mock_ddb.return_value.get_item.return_value = {}
+        mock_semantic.lookup.return_value = {'hint': '유사 문제 힌트', 'source': 'amazon_q'}
+        question_data = dict(self.test_question_data, questionId='ec2-999', question='다른 표현의 문제')
+        
+        with patch.object(self.hint_provider, '_get_context_embedding', return_value=[1.0, 0.0]):
+            hint_result = self.hint_provider.generate_hint(question_data, 'alex_ceo', 2)
+        
+        self.assertEqual(hint_result['hint'], '유사 문제 힌트')
+        self.assertEqual(hint_result['question_id'], 'ec2-999')
+        self.assertEqual(hint_result['context']['question'], '다른 표현의 문제')
+        self.assertEqual(hint_result['hint_level'], 2)
+        mock_subprocess.assert_not_called()
+    
+    def test_generate_fallback_hint_category_case(self):
+        """카테고리 대소문자와 무관한 대체 힌트 조회 테스트"""
+        for category in ('lambda', 'LaMbDa'):
+            question_data = dict(self.test_question_data, category=category)
+            
+            hint_result = self.hint_provider._generate_fallback_hint(question_data, 'alex_ceo', 1)
+            
+            self.assertIn('서버리스', hint_result['hint'])
+        
+        ec2_hint = self.hint_provider._generate_fallback_hint(
+            dict(self.test_question_data, category='Ec2'), 'alex_ceo', 1)
+        self.assertIn('인스턴스 확장성', ec2_hint['hint'])
+    
+    def test_generate_fallback_hint_level_out_of_range(self):
+        """범위 밖 힌트 레벨 요청 시 가장 가까운 레벨 힌트 반환 테스트"""
+        hint_result = self.hint_provider._generate_fallback_hint(self.test_question_data, 'alex_ceo', 5)
+        
+        self.assertEqual(hint_result['hint_level'], 5)
+        self.assertEqual(
+            hint_result['hint'],
+            self.hint_provider._generate_fallback_hint(self.test_question_data, 'alex_ceo', 3)['hint']
+        )
+    
     def test_generate_hint_with_q_cli_unavailable(self):
         """Q CLI 사용 불가 시 힌트 생성 테스트"""
         self.hint_provider.q_cli_available = False
@@ -234,6 +583,44 @@ class TestLambdaHandler(unittest.TestCase):
         self.assertIn('hint', body)
         self.assertIn('source', body)
     
+    @patch('hint_provider.METRICS_ENABLED', True)
+    @patch('builtins.print')
+    def test_lambda_handler_emits_emf_metrics(self, mock_print):
+        """힌트 응답 시 EMF 지표 로그 출력 테스트"""
+        event = {
+            'action': 'get_hint',
+            'questionData': {'category': 'EC2', 'question': '적절한 솔루션은?'},
+            'npcId': 'alex_ceo',
+            'hintLevel': 1
+        }
+        
+        response = lambda_handler(event, self.test_context)
+        
+        self.assertEqual(response['statusCode'], 200)
+        metrics = json.loads(mock_print.call_args.args[0])
+        self.assertEqual(metrics['Source'], json.loads(response['body'])['source'])
+        self.assertEqual(metrics['HintsProvided'], 1)
+        self.assertIn('CloudWatchMetrics', metrics['_aws'])
+    
+    def test_lambda_handler_hint_level_coercion(self):
+        """문자열 hintLevel은 정수로 변환, 변환 불가 값은 400"""
+        question_data = {'category': 'EC2', 'question': '적절한 솔루션은?'}
+        
+        response = lambda_handler({'action': 'get_hint', 'questionData': question_data,
+                                   'hintLevel': '2'}, self.test_context)
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body'])['hint_level'], 2)
+        
+        response = lambda_handler({'action': 'get_hint', 'questionData': question_data,
+                                   'hintLevel': 'abc'}, self.test_context)
+        self.assertEqual(response['statusCode'], 400)
+        
+        response = lambda_handler({'action': 'get_hints_batch', 'requests': [
+            {'questionData': question_data, 'hintLevel': 1},
+            {'questionData': question_data, 'hintLevel': None}
+        ]}, self.test_context)
+        self.assertEqual(response['statusCode'], 400)
+    
     def test_lambda_handler_get_explanation(self):
         """설명 요청 Lambda 핸들러 테스트"""
         event = {
@@ -253,6 +640,56 @@ class TestLambdaHandler(unittest.TestCase):
         self.assertIn('explanation', body)
         self.assertIn('service', body)
     
+    def test_lambda_handler_get_hints_batch(self):
+        """배치 힌트 요청 Lambda 핸들러 테스트"""
+        question_data = {
+            'category': 'EC2',
+            'scenario': {'description': '트래픽 급증 문제'},
+            'question': '적절한 솔루션은?'
+        }
+        event = {
+            'httpMethod': 'POST',
+            'body': json.dumps({
+                'action': 'get_hints_batch',
+                'requests': [
+                    {'questionData': question_data, 'npcId': npc_id, 'hintLevel': 1}
+                    for npc_id in ['alex_ceo', 'sarah_analyst', 'mike_security']
+                ]
+            })
+        }
+        
+        response = lambda_handler(event, self.test_context)
+        
+        self.assertEqual(response['statusCode'], 200)
+        
+        body = json.loads(response['body'])
+        self.assertEqual(body['count'], 3)
+        self.assertEqual([h['npc_id'] for h in body['hints']],
+                         ['alex_ceo', 'sarah_analyst', 'mike_security'])
+    
+    def test_lambda_handler_get_hints_batch_empty(self):
+        """빈 배치 힌트 요청 테스트"""
+        event = {
+            'httpMethod': 'POST',
+            'body': json.dumps({'action': 'get_hints_batch', 'requests': []})
+        }
+        
+        response = lambda_handler(event, self.test_context)
+        
+        self.assertEqual(response['statusCode'], 400)
+    
+    def test_lambda_handler_get_hints_batch_malformed(self):
+        """requests가 리스트가 아니거나 항목이 객체가 아니면 400"""
+        for requests in ({'hintLevel': 1}, 'abc', [1, 2], [{'hintLevel': 1}, None]):
+            event = {
+                'httpMethod': 'POST',
+                'body': json.dumps({'action': 'get_hints_batch', 'requests': requests})
+            }
+            
+            response = lambda_handler(event, self.test_context)
+            
+            self.assertEqual(response['statusCode'], 400, requests)
+    
     def test_lambda_handler_options_request(self):
         """OPTIONS 요청 (CORS preflight) 테스트"""
         event = {
@@ -0,0 +1,272 @@
+"""
+AWS Problem Solver Game - Leaderboard 단위 테스트
+"""
+
+import unittest
+import json
+import sys
+import os
+from decimal import Decimal
+from unittest.mock import Mock, patch
+from botocore.exceptions import ClientError
+
+# 테스트를 위해 Lambda 함수와 공통 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda_functions'))
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+import leaderboard
+from leaderboard import lambda_handler
+from boto3.dynamodb.types import TypeSerializer
+from utils.leaderboard_store import ranking_attributes, upsert_ranking
+
+
+def _get_event(resource, **params):
+    return {'httpMethod': 'GET', 'resource': resource, 'path': resource, 'queryStringParameters': params or None}
+
+
+class LeaderboardTestCase(unittest.TestCase):
+    """리더보드 테이블을 Mock으로 바꾸고 응답 캐시를 비우는 공통 설정"""
+
+    def setUp(self):
+        leaderboard._CACHE.clear()
+        self.addCleanup(leaderboard._CACHE.clear)
+        self.table = Mock()
+        self.resource = Mock()
+        for target, value in (('leaderboard_table', self.table), ('leaderboard_resource', self.resource)):
+            patcher = patch(f'leaderboard.{target}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestRouting(LeaderboardTestCase):
+    """경로/액션 디스패치 테스트"""
+
+    def test_options_preflight(self):
+        """OPTIONS 요청은 DynamoDB 호출 없이 200"""
+        response = lambda_handler({'httpMethod': 'OPTIONS'}, None)
+        self.assertEqual(response['statusCode'], 200)
+        self.table.query.assert_not_called()
+
+    def test_get_leaderboard_route(self):
+        """리소스 경로(끝의 / 무시)로 핸들러 조회, 본문은 압축 없는 JSON"""
+        self.table.query.return_value = {'Items': [{'userId': 'a', 'score': Decimal(100)}]}
+
+        response = lambda_handler(_get_event('/leaderboard/', type='weekly'), None)
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertNotIn('isBase64Encoded', response)
+        self.assertNotIn('Content-Encoding', response['headers'])
+        body = json.loads(response['body'])
+        self.assertEqual(body['leaderboard'], [{'userId': 'a', 'score': 100, 'position': 1}])
+        self.assertEqual(self.table.query.call_args.kwargs['IndexName'], leaderboard.SCORE_INDEX)
+
+    def test_unknown_route(self):
+        """등록되지 않은 경로는 404"""
+        response = lambda_handler(_get_event('/leaderboard/unknown'), None)
+        self.assertEqual(response['statusCode'], 404)
+
+    def test_post_action_clears_cache(self):
+        """POST 액션 디스패치 시 응답 캐시 비움"""
+        mock_update = Mock(return_value={'statusCode': 200})
+        leaderboard._cache_set(('leaderboard', 'alltime', 10), {'statusCode': 200})
+
+        with patch.dict(leaderboard.ACTIONS, {'update_leaderboard': mock_update}):
+            response = lambda_handler({
+                'httpMethod': 'POST',
+                'body': json.dumps({'action': 'update_leaderboard', 'userId': 'u1'})
+            }, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        mock_update.assert_called_once()
+        self.assertEqual(len(leaderboard._CACHE), 0)
+
+
+class TestGetLeaderboard(LeaderboardTestCase):
+    """리더보드 조회 테스트"""
+
+    def test_limit_clamped(self):
+        """limit은 1..MAX_LEADERBOARD_LIMIT 범위로 제한"""
+        self.table.query.return_value = {'Items': []}
+
+        lambda_handler(_get_event('/leaderboard', limit='100000'), None)
+        self.assertEqual(self.table.query.call_args.kwargs['Limit'], leaderboard.MAX_LEADERBOARD_LIMIT)
+
+        lambda_handler(_get_event('/leaderboard', limit='-5'), None)
+        self.assertEqual(self.table.query.call_args.kwargs['Limit'], 1)
+
+    def test_cached_response(self):
+        """같은 조건의 재요청은 캐시 응답 사용"""
+        self.table.query.return_value = {'Items': []}
+
+        first = lambda_handler(_get_event('/leaderboard'), None)
+        second = lambda_handler(_get_event('/leaderboard'), None)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.table.query.call_count, 1)
+
+    @patch('leaderboard.LB_CACHE_MAX_ENTRIES', 2)
+    def test_cache_evicts_least_recently_used(self):
+        """가득 차면 가장 오래 사용하지 않은 항목부터 제거"""
+        leaderboard._cache_set(('a',), {'body': 'a'})
+        leaderboard._cache_set(('b',), {'body': 'b'})
+        leaderboard._cache_get(('a',))
+        leaderboard._cache_set(('c',), {'body': 'c'})
+
+        self.assertEqual(list(leaderboard._CACHE), [('a',), ('c',)])
+
+
+class TestGetUserRank(LeaderboardTestCase):
+    """사용자 순위 조회 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch('leaderboard.time.sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _batch_response(self, *items, unprocessed=None):
+        response = {'Responses': {leaderboard.LEADERBOARD_TABLE: list(items)}}
+        if unprocessed:
+            response['UnprocessedKeys'] = unprocessed
+        return response
+
+    def test_precomputed_position(self):
+        """스트림 처리기가 기록한 순위와 집계 행 참가자 수 사용"""
+        self.resource.batch_get_item.return_value = self._batch_response(
+            {'userId': 'u1', 'score': Decimal(900), 'position': Decimal(3), 'username': 'kim'},
+            {'userId': leaderboard.STATS_USER_ID, 'entryCount': Decimal(10)}
+        )
+
+        response = lambda_handler(_get_event('/user-rank', userId='u1'), None)
+
+        body = json.loads(response['body'])
+        self.assertEqual((body['rank'], body['total_participants'], body['percentile']), (3, 10, 80.0))
+        self.table.query.assert_not_called()
+
+    def test_counts_when_position_missing(self):
+        """순위와 집계 행이 없으면 점수 GSI 카운트로 계산"""
+        self.resource.batch_get_item.return_value = self._batch_response(
+            {'userId': 'u1', 'score': Decimal(900)}
+        )
+        self.table.query.side_effect = [{'Count': 4}, {'Count': 20}]
+
+        body = json.loads(lambda_handler(_get_event('/user-rank', userId='u1'), None)['body'])
+
+        self.assertEqual((body['rank'], body['total_participants']), (5, 20))
+        self.assertEqual(self.table.query.call_args_list[0].kwargs['Select'], 'COUNT')
+
+    def test_retries_unprocessed_keys(self):
+        """미처리 키는 백오프 후 다시 요청"""
+        unprocessed = {leaderboard.LEADERBOARD_TABLE: {'Keys': [{'leaderboardType': 'alltime', 'userId': 'u1'}]}}
+        self.resource.batch_get_item.side_effect = [
+            self._batch_response({'userId': leaderboard.STATS_USER_ID, 'entryCount': Decimal(2)},
+                                 unprocessed=unprocessed),
+            self._batch_response({'userId': 'u1', 'score': Decimal(50), 'position': Decimal(2)})
+        ]
+
+        response = lambda_handler(_get_event('/user-rank', userId='u1'), None)
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body'])['total_participants'], 2)
+        self.assertEqual(self.resource.batch_get_item.call_args.kwargs['RequestItems'], unprocessed)
+        self.sleep.assert_called_once()
+
+    def test_unprocessed_after_retries_is_error(self):
+        """재시도 후에도 미처리 키가 남으면 404가 아닌 500"""
+        unprocessed = {leaderboard.LEADERBOARD_TABLE: {'Keys': [{'leaderboardType': 'alltime', 'userId': 'u1'}]}}
+        self.resource.batch_get_item.return_value = self._batch_response(unprocessed=unprocessed)
+
+        response = lambda_handler(_get_event('/user-rank', userId='u1'), None)
+
+        self.assertEqual(response['statusCode'], 500)
+        self.assertEqual(self.resource.batch_get_item.call_count, leaderboard.BATCH_GET_MAX_RETRIES)
+
+    def test_user_not_ranked(self):
+        """엔트리가 없으면 404"""
+        self.resource.batch_get_item.return_value = self._batch_response()
+
+        response = lambda_handler(_get_event('/user-rank', userId='u1'), None)
+
+        self.assertEqual(response['statusCode'], 404)
+
+    def test_missing_user_id(self):
+        """userId 파라미터가 없으면 400"""
+        response = lambda_handler(_get_event('/user-rank'), None)
+        self.assertEqual(response['statusCode'], 400)
+
+
+class TestBulkUpdate(LeaderboardTestCase):
+    """대량 업데이트 테스트"""
+
+    @patch('leaderboard.batch_get_users')
+    @patch('leaderboard.thread_leaderboard_table')
+    def test_bulk_update(self, mock_thread_table, mock_batch_get):
+        """작업자 스레드별 Table로 타입마다 갱신, 없는 사용자는 실패 목록"""
+        mock_thread_table.return_value = self.table
+        mock_batch_get.return_value = {'u1': {'userId': 'u1', 'totalScore': Decimal(10)}}
+
+        response = leaderboard.bulk_update_leaderboard(
+            {'userUpdates': [{'userId': 'u1'}, {'userId': 'u2'}]}, leaderboard.CORS_HEADERS
+        )
+
+        body = json.loads(response['body'])
+        self.assertEqual((body['updated_count'], body['failed_count']), (1, 1))
+        self.assertEqual(body['failed_updates'], [{'userId': 'u2', 'reason': 'User not found'}])
+        self.assertEqual(
+            sorted(c.kwargs['Key']['leaderboardType'] for c in self.table.update_item.call_args_list),
+            sorted(leaderboard.LEADERBOARD_TYPES)
+        )
+
+
+class TestUpsertRanking(unittest.TestCase):
+    """리더보드 엔트리 조건부 갱신 테스트"""
+
+    def test_update_expression(self):
+        """모든 속성을 SET, updatedAt 외의 값이 바뀐 경우에만 쓰기"""
+        table = Mock()
+
+        written = upsert_ranking(table, 'daily', 'u1', {'score': Decimal(10), 'updatedAt': 'now'})
+
+        self.assertTrue(written)
+        kwargs = table.update_item.call_args.kwargs
+        self.assertEqual(kwargs['Key'], {'leaderboardType': 'daily', 'userId': 'u1'})
+        self.assertEqual(kwargs['UpdateExpression'], 'SET #a0 = :v0, #a1 = :v1')
+        self.assertEqual(
+            kwargs['ConditionExpression'],
+            'attribute_not_exists(userId) OR attribute_not_exists(#a0) OR #a0 <> :v0'
+        )
+        self.assertEqual(kwargs['ExpressionAttributeNames'], {'#a0': 'score', '#a1': 'updatedAt'})
+
+    def test_attributes_without_stats(self):
+        """stats가 없는 사용자도 DynamoDB에 쓸 수 있는 값(float 없음)으로 생성"""
+        attributes = ranking_attributes({'userId': 'user-123456'})
+
+        self.assertEqual(attributes['accuracy'], Decimal('0'))
+        self.assertEqual(attributes['username'], 'Player_123456')
+        serializer = TypeSerializer()
+        for value in attributes.values():
+            serializer.serialize(value)
+
+    def test_unchanged_entry_skipped(self):
+        """조건 실패(값 변화 없음)는 False"""
+        table = Mock()
+        table.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem'
+        )
+
+        self.assertFalse(upsert_ranking(table, 'daily', 'u1', {'score': Decimal(10)}))
+
+    def test_other_errors_raised(self):
+        """조건 실패 외의 오류는 그대로 전달"""
+        table = Mock()
+        table.update_item.side_effect = ClientError(
+            {'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'UpdateItem'
+        )
+
+        with self.assertRaises(ClientError):
+            upsert_ranking(table, 'daily', 'u1', {'score': Decimal(10)})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
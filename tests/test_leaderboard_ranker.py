@@ -0,0 +1,201 @@
+"""
+AWS Problem Solver Game - Leaderboard Ranker 단위 테스트
+"""
+
+import unittest
+import sys
+import os
+from decimal import Decimal
+from unittest.mock import Mock, patch
+from botocore.exceptions import ClientError
+
+# 테스트를 위해 Lambda 함수 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda_functions'))
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+import leaderboard_ranker
+from leaderboard_ranker import _contribution, apply_stats_deltas, rerank
+
+
+def _conditional_check_failed():
+    return ClientError({'Error': {'Code': 'ConditionalCheckFailedException'}}, 'UpdateItem')
+
+
+class TestContribution(unittest.TestCase):
+    """집계 행 기여값 테스트"""
+
+    def test_entry_contribution(self):
+        """점수/레벨 구간과 합계"""
+        image = {'score': Decimal(1200), 'level': Decimal(4), 'accuracy': Decimal(80)}
+        self.assertEqual(_contribution(image), {
+            'entryCount': 1,
+            'scoreSum': Decimal(1200),
+            'levelSum': Decimal(4),
+            'accuracySum': Decimal(80),
+            'scoreBucket1': 1,
+            'levelBucket1': 1
+        })
+
+    def test_bucket_bounds(self):
+        """점수 상한은 미포함, 레벨 상한은 포함"""
+        contribution = _contribution({'score': Decimal(1000), 'level': Decimal(3)})
+        self.assertIn('scoreBucket1', contribution)
+        self.assertIn('levelBucket0', contribution)
+        self.assertEqual(contribution['accuracySum'], 0)
+
+    def test_missing_score(self):
+        """점수가 없는 이미지(삭제/집계 행)는 기여 없음"""
+        self.assertEqual(_contribution({}), {})
+        self.assertEqual(_contribution({'userId': 'u1'}), {})
+
+
+class TestRerank(unittest.TestCase):
+    """순위 재계산 테스트"""
+
+    def setUp(self):
+        self.table = Mock()
+        patcher = patch('leaderboard_ranker.leaderboard_table', self.table)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _positions(self):
+        return {
+            call.kwargs['Key']['userId']: call.kwargs['ExpressionAttributeValues'][':pos']
+            for call in self.table.update_item.call_args_list
+        }
+
+    def test_full_rerank_ties(self):
+        """동점자는 같은 순위, 다음 순위는 건너뜀"""
+        self.table.query.return_value = {'Items': [
+            {'userId': 'a', 'score': Decimal(100)},
+            {'userId': 'b', 'score': Decimal(90)},
+            {'userId': 'c', 'score': Decimal(90)},
+            {'userId': 'd', 'score': Decimal(80)}
+        ]}
+
+        self.assertEqual(rerank('alltime'), 4)
+        self.assertEqual(self._positions(), {'a': 1, 'b': 2, 'c': 2, 'd': 4})
+        # 전체 재계산은 COUNT 쿼리 없이 한 번만 조회
+        self.assertEqual(self.table.query.call_count, 1)
+
+    def test_window_offsets_by_higher_count(self):
+        """구간 위쪽 항목 수만큼 순위가 밀림"""
+        self.table.query.side_effect = [
+            {'Count': 3},
+            {'Items': [
+                {'userId': 'b', 'score': Decimal(90)},
+                {'userId': 'c', 'score': Decimal(90)},
+                {'userId': 'd', 'score': Decimal(80)}
+            ]}
+        ]
+
+        rerank('alltime', None, Decimal(90))
+        self.assertEqual(self._positions(), {'b': 4, 'c': 4, 'd': 6})
+
+    def test_unchanged_positions_skipped(self):
+        """순위가 그대로인 항목은 쓰지 않음"""
+        self.table.query.return_value = {'Items': [
+            {'userId': 'a', 'score': Decimal(100), 'position': Decimal(1)},
+            {'userId': 'b', 'score': Decimal(90), 'position': Decimal(3)}
+        ]}
+
+        self.assertEqual(rerank('alltime'), 1)
+        self.assertEqual(self._positions(), {'b': 2})
+
+    def test_paginates(self):
+        """LastEvaluatedKey가 있으면 이어서 조회하고 순위를 이어감"""
+        self.table.query.side_effect = [
+            {'Items': [{'userId': 'a', 'score': Decimal(100)}], 'LastEvaluatedKey': {'userId': 'a'}},
+            {'Items': [{'userId': 'b', 'score': Decimal(100)}, {'userId': 'c', 'score': Decimal(50)}]}
+        ]
+
+        rerank('alltime')
+        self.assertEqual(self._positions(), {'a': 1, 'b': 1, 'c': 3})
+        self.assertEqual(self.table.query.call_args_list[1].kwargs['ExclusiveStartKey'], {'userId': 'a'})
+
+    def test_deleted_rows_not_recreated(self):
+        """조건부 쓰기 실패(삭제된 항목)는 무시"""
+        self.table.query.return_value = {'Items': [{'userId': 'gone', 'score': Decimal(10)}]}
+        self.table.update_item.side_effect = _conditional_check_failed()
+
+        self.assertEqual(rerank('alltime'), 0)
+        self.assertEqual(
+            self.table.update_item.call_args.kwargs['ConditionExpression'],
+            'attribute_exists(userId)'
+        )
+
+
+class TestApplyStatsDeltas(unittest.TestCase):
+    """집계 행 증감 반영 테스트"""
+
+    @patch('leaderboard_ranker.leaderboard_table')
+    def test_add_expression(self, table):
+        """0이 아닌 증감만 ADD로 반영"""
+        apply_stats_deltas('weekly', {'entryCount': 1, 'scoreSum': Decimal(500), 'scoreBucket0': 0})
+
+        kwargs = table.update_item.call_args.kwargs
+        self.assertEqual(kwargs['Key'], {'leaderboardType': 'weekly', 'userId': '#STATS'})
+        self.assertEqual(kwargs['UpdateExpression'], 'ADD #a0 :v0, #a1 :v1')
+        self.assertEqual(kwargs['ExpressionAttributeNames'], {'#a0': 'entryCount', '#a1': 'scoreSum'})
+        self.assertEqual(kwargs['ExpressionAttributeValues'], {':v0': 1, ':v1': Decimal(500)})
+
+    @patch('leaderboard_ranker.leaderboard_table')
+    def test_no_deltas(self, table):
+        """증감이 모두 0이면 쓰지 않음"""
+        apply_stats_deltas('weekly', {'entryCount': 0})
+        table.update_item.assert_not_called()
+
+
+class TestLambdaHandler(unittest.TestCase):
+    """스트림 레코드 처리 테스트"""
+
+    def _record(self, event_name, old=None, new=None):
+        def image(values):
+            if values is None:
+                return None
+            return {
+                'leaderboardType': {'S': 'alltime'},
+                'userId': {'S': values.get('userId', 'u1')},
+                **({'score': {'N': str(values['score'])}} if 'score' in values else {})
+            }
+        change = {}
+        if old is not None:
+            change['OldImage'] = image(old)
+        if new is not None:
+            change['NewImage'] = image(new)
+        return {'eventName': event_name, 'dynamodb': change}
+
+    @patch('leaderboard_ranker.apply_stats_deltas')
+    @patch('leaderboard_ranker.rerank', return_value=0)
+    def test_insert_reranks_at_or_below_score(self, mock_rerank, _):
+        """INSERT는 추가된 점수 이하만 재계산"""
+        leaderboard_ranker.lambda_handler({'Records': [self._record('INSERT', new={'score': 70})]}, None)
+        mock_rerank.assert_called_once_with('alltime', None, Decimal(70))
+
+    @patch('leaderboard_ranker.apply_stats_deltas')
+    @patch('leaderboard_ranker.rerank', return_value=0)
+    def test_windows_merge(self, mock_rerank, _):
+        """같은 타입의 구간은 합치고 하한 없음이 우선"""
+        leaderboard_ranker.lambda_handler({'Records': [
+            self._record('MODIFY', old={'score': 50}, new={'score': 80}),
+            self._record('REMOVE', old={'userId': 'u2', 'score': 60})
+        ]}, None)
+        mock_rerank.assert_called_once_with('alltime', None, Decimal(80))
+
+    @patch('leaderboard_ranker.apply_stats_deltas')
+    @patch('leaderboard_ranker.rerank', return_value=0)
+    def test_position_only_modify_ignored(self, mock_rerank, mock_stats):
+        """점수 변화가 없는 MODIFY와 집계 행 변경은 무시"""
+        leaderboard_ranker.lambda_handler({'Records': [
+            self._record('MODIFY', old={'score': 50}, new={'score': 50}),
+            self._record('MODIFY', old={'userId': '#STATS'}, new={'userId': '#STATS'})
+        ]}, None)
+        mock_rerank.assert_not_called()
+        mock_stats.assert_called_once_with('alltime', {
+            'entryCount': 0, 'scoreSum': 0, 'levelSum': 0, 'accuracySum': 0,
+            'scoreBucket0': 0, 'levelBucket0': 0
+        })
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -12,8 +12,10 @@ from unittest.mock import patch, MagicMock
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import utils.q_cli_integration as q_cli_integration
 from utils.q_cli_integration import (
     AmazonQCLIIntegration, 
+    _cached_q,
     ask_q, 
     get_aws_help, 
     generate_question_hint,
@@ -30,6 +32,8 @@ class TestAmazonQCLIIntegration(unittest.TestCase):
         테스트 설정
         """
         self.q_cli = AmazonQCLIIntegration(timeout=10)
+        _cached_q.cache_clear()
+        q_cli_integration._cli_backoff_until = 0.0
         
         # 테스트용 문제 데이터
         self.sample_question = {
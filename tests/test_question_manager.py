@@ -0,0 +1,271 @@
+"""
+AWS Problem Solver Game - Question Manager 단위 테스트
+"""
+
+import unittest
+import json
+import sys
+import os
+from unittest.mock import Mock, patch
+from botocore.exceptions import ClientError
+
+# 테스트를 위해 Lambda 함수와 공통 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda_functions'))
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+os.environ['WARMUP'] = '0'
+
+import question_manager
+from question_manager import lambda_handler
+
+
+def _typed_question(question_id, is_active=True):
+    """저수준 클라이언트 GetItem 응답 형식의 문제 항목"""
+    return {
+        'questionId': {'S': question_id},
+        'category': {'S': 'EC2'},
+        'difficulty': {'S': 'easy'},
+        'npcCharacter': {'S': 'alex_ceo'},
+        'scenario': {'M': {'title': {'S': '트래픽 급증'}}},
+        'question': {'S': '어떤 서비스를 사용해야 할까요?'},
+        'options': {'L': [{'M': {'id': {'S': 'A'}, 'text': {'S': 'Auto Scaling'}}}]},
+        'isActive': {'BOOL': is_active}
+    }
+
+
+class TestGetQuestionById(unittest.TestCase):
+    """문제 단건 조회 테스트"""
+
+    def setUp(self):
+        question_manager._load_client_question.cache_clear()
+        self.addCleanup(question_manager._load_client_question.cache_clear)
+        self.client = Mock()
+        patcher = patch('question_manager.dynamodb_client', self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_resource_route(self):
+        """템플릿 리소스 경로와 pathParameters로 조회, 클라이언트 필드만 요청"""
+        self.client.get_item.return_value = {'Item': _typed_question('ec2-001')}
+
+        response = lambda_handler({
+            'httpMethod': 'GET',
+            'resource': '/question/{questionId}',
+            'path': '/question/ec2-001',
+            'pathParameters': {'questionId': 'ec2-001'}
+        }, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        body = json.loads(response['body'])
+        self.assertEqual(body['questionId'], 'ec2-001')
+        self.assertEqual(body['options'], [{'id': 'A', 'text': 'Auto Scaling'}])
+        self.assertEqual((body['estimatedTime'], body['points']), (60, 100))
+        self.assertNotIn('isActive', body)
+
+        kwargs = self.client.get_item.call_args.kwargs
+        self.assertEqual(kwargs['Key'], {'questionId': {'S': 'ec2-001'}})
+        self.assertIn('isActive', kwargs['ProjectionExpression'])
+        self.assertNotIn('explanation', kwargs['ProjectionExpression'])
+
+    def test_raw_path_route(self):
+        """리소스가 없으면 실제 경로(/question/{id})를 정규식으로 매칭"""
+        self.client.get_item.return_value = {'Item': _typed_question('ec2-002')}
+
+        response = lambda_handler({'httpMethod': 'GET', 'path': '/question/ec2-002'}, None)
+
+        self.assertEqual(json.loads(response['body'])['questionId'], 'ec2-002')
+
+    def test_cached_within_ttl(self):
+        """같은 문제는 TTL 안에서 한 번만 조회"""
+        self.client.get_item.return_value = {'Item': _typed_question('ec2-001')}
+        event = {'httpMethod': 'GET', 'path': '/question/ec2-001'}
+
+        lambda_handler(event, None)
+        lambda_handler(event, None)
+
+        self.assertEqual(self.client.get_item.call_count, 1)
+
+    def test_inactive_or_missing(self):
+        """비활성화되었거나 없는 문제는 404"""
+        self.client.get_item.side_effect = [{'Item': _typed_question('old', is_active=False)}, {}]
+
+        for question_id in ('old', 'missing'):
+            response = lambda_handler({'httpMethod': 'GET', 'path': f'/question/{question_id}'}, None)
+            self.assertEqual(response['statusCode'], 404)
+
+    def test_nested_path_not_matched(self):
+        """하위 경로는 단건 조회로 매칭하지 않음"""
+        response = lambda_handler({'httpMethod': 'GET', 'path': '/question/ec2-001/extra'}, None)
+
+        self.assertEqual(response['statusCode'], 404)
+        self.client.get_item.assert_not_called()
+
+
+class TestBatchGetQuestions(unittest.TestCase):
+    """문제 일괄 조회 테스트"""
+
+    def setUp(self):
+        self.dynamodb = Mock()
+        for target, value in (('dynamodb', self.dynamodb), ('time.sleep', Mock())):
+            patcher = patch(f'question_manager.{target}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_request_order_and_projection_names(self):
+        """요청 순서 유지, 프로젝션에 쓰인 이름만 전달"""
+        table = question_manager.QUESTIONS_TABLE
+        self.dynamodb.batch_get_item.return_value = {'Responses': {table: [
+            {'questionId': 'b'}, {'questionId': 'a'}
+        ]}}
+
+        items = question_manager.batch_get_questions(['a', 'b', 'a'], question_manager.SUMMARY_PROJECTION)
+
+        self.assertEqual([item['questionId'] for item in items], ['a', 'b'])
+        request = self.dynamodb.batch_get_item.call_args.kwargs['RequestItems'][table]
+        self.assertEqual(len(request['Keys']), 2)
+        self.assertEqual(request['ExpressionAttributeNames'], {'#sc': 'scenario'})
+
+    def test_retries_unprocessed_keys(self):
+        """미처리 키는 다시 요청"""
+        table = question_manager.QUESTIONS_TABLE
+        unprocessed = {table: {'Keys': [{'questionId': 'b'}]}}
+        self.dynamodb.batch_get_item.side_effect = [
+            {'Responses': {table: [{'questionId': 'a'}]}, 'UnprocessedKeys': unprocessed},
+            {'Responses': {table: [{'questionId': 'b'}]}}
+        ]
+
+        items = question_manager.batch_get_questions(['a', 'b'])
+
+        self.assertEqual([item['questionId'] for item in items], ['a', 'b'])
+        self.assertEqual(self.dynamodb.batch_get_item.call_args.kwargs['RequestItems'], unprocessed)
+
+
+class TestRandomQuestionIds(unittest.TestCase):
+    """문제 ID 목록 기반 랜덤 선택 테스트"""
+
+    def setUp(self):
+        self.questions_table = Mock()
+        patchers = [
+            patch('question_manager.questions_table', self.questions_table),
+            patch('question_manager._question_ids', None),
+            patch('question_manager._question_ids_loaded_at', None),
+            patch('question_manager._question_ids_refresh', None)
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _load_ids(self, ids):
+        question_manager._question_ids = ids
+        question_manager._question_ids_loaded_at = question_manager.time.monotonic()
+
+    def test_loaded_map_is_authoritative(self):
+        """로드된 목록에 없는 조합은 GSI/스캔 없이 None"""
+        self._load_ids({(None, None): ['q1']})
+
+        self.assertIsNone(question_manager.get_fallback_random_question({'category': 'EC2', 'difficulty': 'hard'}))
+        self.questions_table.query.assert_not_called()
+        self.questions_table.scan.assert_not_called()
+
+    @patch('question_manager.load_question')
+    def test_picks_from_loaded_map(self, mock_load):
+        """목록에서 고른 문제만 조회"""
+        self._load_ids({('EC2', None): ['q1']})
+        mock_load.return_value = {'questionId': 'q1', 'category': 'EC2', 'difficulty': 'easy',
+                                  'npcCharacter': 'alex_ceo', 'scenario': {}, 'question': 'Q1'}
+
+        question = question_manager.get_fallback_random_question({'category': 'EC2'})
+
+        self.assertEqual(question['questionId'], 'q1')
+        mock_load.assert_called_once_with('q1')
+
+    @patch('question_manager._SCAN_POOL')
+    def test_expired_map_served_while_refreshing(self, scan_pool):
+        """만료된 목록은 백그라운드 갱신을 시작하고 그대로 사용"""
+        self._load_ids({('EC2', None): ['q1']})
+        question_manager._question_ids_loaded_at -= question_manager.QUESTION_IDS_TTL + 1
+
+        self.assertEqual(question_manager.question_ids('EC2'), ['q1'])
+        scan_pool.submit.assert_called_once_with(question_manager._refresh_question_ids)
+        self.questions_table.scan.assert_not_called()
+
+    @patch('question_manager._SCAN_POOL')
+    def test_unloaded_map_falls_back_to_index(self, scan_pool):
+        """목록을 아직 불러오지 못했으면 None을 돌려 GSI 경로 사용"""
+        self.assertIsNone(question_manager.question_ids('EC2'))
+        scan_pool.submit.assert_called_once()
+
+    def test_refresh_failure_keeps_previous_map(self):
+        """갱신 스캔이 실패하면 이전 목록 유지"""
+        self._load_ids({(None, None): ['q1']})
+        self.questions_table.scan.side_effect = ClientError(
+            {'Error': {'Code': 'ProvisionedThroughputExceededException'}}, 'Scan'
+        )
+
+        question_manager._refresh_question_ids()
+
+        self.assertEqual(question_manager._question_ids, {(None, None): ['q1']})
+
+
+class TestScanRandomSegments(unittest.TestCase):
+    """세그먼트 스캔 테스트"""
+
+    @patch('question_manager.random.randrange', return_value=0)
+    @patch('question_manager.questions_table')
+    def test_paginates_then_next_segment(self, questions_table, _):
+        """빈 페이지는 LastEvaluatedKey로 이어 읽고, 세그먼트가 끝나면 다음 세그먼트로"""
+        questions_table.scan.side_effect = [
+            {'Items': [], 'LastEvaluatedKey': {'questionId': 'q0'}},
+            {'Items': []},
+            {'Items': [{'questionId': 'q9'}]}
+        ]
+
+        self.assertEqual(question_manager.scan_random_segments(None), [{'questionId': 'q9'}])
+
+        calls = [c.kwargs for c in questions_table.scan.call_args_list]
+        self.assertEqual([c['Segment'] for c in calls], [0, 0, 1])
+        self.assertEqual(calls[1]['ExclusiveStartKey'], {'questionId': 'q0'})
+        self.assertTrue(all('Limit' not in c for c in calls))
+
+    @patch('question_manager.questions_table')
+    def test_no_match(self, questions_table):
+        """모든 세그먼트에 없으면 빈 리스트"""
+        questions_table.scan.return_value = {'Items': []}
+
+        self.assertEqual(question_manager.scan_random_segments(None), [])
+        self.assertEqual(questions_table.scan.call_count, question_manager.RANDOM_BUCKETS)
+
+
+class TestFallbackNpcQuestions(unittest.TestCase):
+    """NPC 문제 fallback 조회 테스트"""
+
+    @patch('question_manager.batch_get_questions')
+    @patch('question_manager.npc_questions_table')
+    def test_precomputed_list(self, npc_table, mock_batch_get):
+        """NPC 문제 ID 목록이 있으면 스캔 없이 일괄 조회"""
+        npc_table.get_item.return_value = {'Item': {'npcId': 'alex_ceo', 'questionIds': ['q1', 'q2']}}
+        mock_batch_get.return_value = [
+            {'questionId': 'q1', 'category': 'EC2', 'difficulty': 'easy', 'npcCharacter': 'alex_ceo',
+             'scenario': {}, 'question': 'Q1'},
+            {'questionId': 'q2', 'isActive': False}
+        ]
+
+        questions = question_manager.get_fallback_npc_questions('alex_ceo', 5)
+
+        self.assertEqual([q['questionId'] for q in questions], ['q1'])
+
+    @patch('question_manager.questions_table')
+    @patch('question_manager.npc_questions_table')
+    def test_missing_table_falls_through(self, npc_table, questions_table):
+        """NPC 목록 테이블 조회에 실패하면 기존 스캔 경로로 진행"""
+        npc_table.get_item.side_effect = ClientError(
+            {'Error': {'Code': 'ResourceNotFoundException'}}, 'GetItem'
+        )
+        questions_table.scan.return_value = {'Items': []}
+
+        self.assertEqual(question_manager.get_fallback_npc_questions('alex_ceo', 5), [])
+        questions_table.scan.assert_called()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)